@@ -0,0 +1,100 @@
+"""
+Scheduling benchmark suite.
+
+Run from the app directory:
+
+    python -m benchmarks run --output results.json
+    python -m benchmarks run --sizes 10x10,100x1000 --constraints skill_matching,no_overlapping
+    python -m benchmarks compare baseline.json results.json
+
+compare exits with status 1 when any case regressed against the baseline or has no
+baseline case with the same parameters, and with status 2 when the two runs used
+different model or solver backends.
+"""
+import argparse
+import json
+import sys
+from loguru import logger
+
+from models.api_models import ScheduleMode
+from models.schemas import ConstraintType
+from benchmarks.runner import DEFAULT_SIZES, compare_results, run_suite
+
+
+def _sizes(text: str):
+    """Parse "10x10,100x1000" into [(10, 10), (100, 1000)]."""
+    return [tuple(int(part) for part in size.lower().split("x")) for size in text.split(",")]
+
+
+def _constraints(text: str):
+    """Parse "all", "none" or a comma-separated list of constraint types."""
+    if text == "all":
+        return list(ConstraintType)
+    if text == "none":
+        return []
+    return [ConstraintType(name) for name in text.split(",")]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Scheduling benchmark suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Time every scheduling phase over a range of instance sizes")
+    run.add_argument("--sizes", type=_sizes, default=DEFAULT_SIZES,
+                     help="Comma-separated EMPLOYEESxSHIFTS sizes (default 10x10 up to 2000x20000)")
+    run.add_argument("--skills", type=int, default=4, help="Number of distinct skills")
+    run.add_argument("--overlap-density", type=float, default=0.5, help="Mean concurrent shifts per employee")
+    run.add_argument("--constraints", type=_constraints, default=list(ConstraintType),
+                     help="'all', 'none' or comma-separated constraint types")
+    run.add_argument("--seed", type=int, default=0, help="Seed of the instance generator")
+    run.add_argument("--repeat", type=int, default=3, help="Repetitions per case; times are medians")
+    run.add_argument("--time-limit-ms", type=int, default=60000, help="Solver time limit per case")
+    run.add_argument("--mode", type=ScheduleMode, default=ScheduleMode.OPTIMAL, help="Scheduling engine")
+    run.add_argument("--output", help="Write the results as JSON to this file")
+
+    compare = commands.add_parser("compare", help="Flag regressions of a result file against a baseline")
+    compare.add_argument("baseline", help="Baseline result file")
+    compare.add_argument("current", help="Result file to check")
+    compare.add_argument("--threshold", type=float, default=0.25, help="Allowed relative slowdown")
+    compare.add_argument("--min-delta-ms", type=float, default=10.0, help="Slowdowns below this are noise")
+    compare.add_argument("--gap-tolerance", type=float, default=0.01,
+                         help="Allowed growth of the gap of cases that hit the time limit")
+
+    args = parser.parse_args(argv)
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    if args.command == "run":
+        results = run_suite(args.sizes, skills=args.skills, overlap_density=args.overlap_density,
+                            constraints=args.constraints, seed=args.seed, repeat=args.repeat,
+                            time_limit_ms=args.time_limit_ms, mode=args.mode)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(results, f, indent=2)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    try:
+        findings = compare_results(baseline, current, args.threshold, args.min_delta_ms, args.gap_tolerance)
+    except ValueError as e:
+        print(f"Cannot compare: {e}")
+        return 2
+    for finding in findings:
+        if finding["mismatch"]:
+            print(f"{finding['case']:>12}  no baseline case with the same parameters  MISMATCH")
+            continue
+        ratio = f"{finding['ratio']:.2f}x" if finding["ratio"] is not None else "-"
+        flag = "REGRESSION" if finding["regression"] else "ok"
+        print(f"{finding['case']:>12}  {finding['metric']:<16} {finding['baseline']:12.4g} -> "
+              f"{finding['current']:12.4g}  {ratio:>7}  {flag}")
+    regressions = sum(finding["regression"] for finding in findings)
+    mismatches = sum(finding["mismatch"] for finding in findings)
+    compared = len({finding["case"] for finding in findings if not finding["mismatch"]})
+    print(f"{regressions} regression(s) in {compared} compared case(s), {mismatches} case(s) without a baseline")
+    return 1 if regressions or mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from models.api_models import ShiftScheduleRequest
+from models.schemas import ConstraintType
+from tests.test_utils import random_request
+
+# Start of every generated period
+BASE_DATETIME = datetime(2025, 7, 7, 0, 0)
+
+# Shortest and longest shift in hours, drawn uniformly
+SHIFT_HOURS = (4, 10)
+
+
+def generate_request(employees: int,
+                     shifts: int,
+                     skills: int = 4,
+                     overlap_density: float = 0.5,
+                     constraints: Optional[List[ConstraintType]] = None,
+                     seed: int = 0) -> ShiftScheduleRequest:
+    """
+    Generate a reproducible synthetic scheduling request.
+
+    The horizon is stretched so that, on average, overlap_density * employees shifts
+    run at the same time: at 1.0 there are about as many concurrent shifts as
+    employees, at 0.1 one for every ten. Hour caps are drawn around the average
+    workload per employee, so overtime limits bind for part of the roster, and
+    availability windows start in the first quarter of the horizon and cover between
+    half and three quarters of it. The roster is drawn by the tests' random_request.
+
+    Args:
+        employees: Number of employees
+        shifts: Number of shifts
+        skills: Number of distinct skills; every employee has one to three of them
+        overlap_density: Mean number of concurrent shifts per employee
+        constraints: Active constraint types (defaults to all of them)
+        seed: Seed of the random generator
+
+    Returns:
+        ShiftScheduleRequest: The generated request
+    """
+    mean_hours = sum(SHIFT_HOURS) / 2
+    horizon = max(24, round(shifts * mean_hours / (overlap_density * employees)))
+    workload = shifts * mean_hours / employees
+    min_cap, max_cap = (max(1, min(168, round(workload * factor))) for factor in (0.5, 1.5))
+
+    end = BASE_DATETIME + timedelta(days=horizon // 24 + 1)
+    return random_request(
+        seed,
+        list(ConstraintType) if constraints is None else constraints,
+        num_employees=employees,
+        num_shifts=shifts,
+        skills=[f"skill{k}" for k in range(skills)],
+        skills_per_employee=(1, min(3, skills)),
+        max_hours=range(min_cap, max_cap + 1),
+        availability_offset=(0, horizon // 4),
+        availability_hours=(horizon // 2, horizon - horizon // 4),
+        shift_offset=(0, horizon - SHIFT_HOURS[1]),
+        shift_hours=SHIFT_HOURS,
+        period=f"{BASE_DATETIME.date().isoformat()}/{end.date().isoformat()}",
+        base_datetime=BASE_DATETIME
+    )
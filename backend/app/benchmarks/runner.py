@@ -0,0 +1,187 @@
+import os
+import platform
+import statistics
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from models.api_models import ScheduleMode
+from models.schemas import ConstraintType
+from services.shift_scheduler import ShiftScheduler
+from benchmarks.generator import generate_request
+from core.settings import settings
+
+# Phases timed per case, in the order the scheduler reports them
+PHASES = ("validate", "build", "solve", "extract")
+
+# Instance sizes (employees, shifts) of the default suite
+DEFAULT_SIZES = [(10, 10), (50, 200), (100, 1000), (500, 5000), (1000, 10000), (2000, 20000)]
+
+# Case parameters that must all match for two results to be compared
+CASE_PARAMETERS = ("employees", "shifts", "skills", "overlap_density", "constraints", "seed", "mode", "time_limit_ms")
+
+# Settings recorded in the result metadata that must match for two suites to be compared
+META_PARAMETERS = ("model_backend", "solver_backend")
+
+
+def run_case(employees: int,
+             shifts: int,
+             skills: int = 4,
+             overlap_density: float = 0.5,
+             constraints: Optional[List[ConstraintType]] = None,
+             seed: int = 0,
+             repeat: int = 1,
+             time_limit_ms: Optional[int] = None,
+             mode: ScheduleMode = ScheduleMode.OPTIMAL) -> Dict:
+    """
+    Generate one instance and time every phase of scheduling it.
+
+    Phase times come from the scheduler's progress events: each phase lasts from its
+    own event to the next one, and extract lasts until schedule() returns. Times are
+    the median over the repetitions.
+
+    Returns:
+        Dict with the case parameters, the model size, the phase and total times in
+        milliseconds, and the objective value, gap, optimality, whether the solve ran
+        into its time limit and the solver of the last repetition
+    """
+    request = generate_request(employees, shifts, skills, overlap_density, constraints, seed)
+    request = request.model_copy(update={"time_limit_ms": time_limit_ms, "mode": mode})
+
+    runs, model, response = [], {}, None
+    for _ in range(repeat):
+        marks: List[Tuple[str, float]] = []
+
+        def progress(event: str, payload: Dict) -> None:
+            if event == "phase" and payload["phase"] in PHASES and payload["phase"] not in dict(marks):
+                marks.append((payload["phase"], time.perf_counter()))
+            elif event == "model":
+                model.update(rows=payload["rows"], columns=payload["columns"], nonzeros=payload["nonzeros"])
+
+        started = time.perf_counter()
+        response = ShiftScheduler(progress=progress).schedule(request)
+        finished = time.perf_counter()
+        if not response.success:
+            raise RuntimeError(f"Benchmark case {employees}x{shifts} failed: {response.message}")
+
+        ends = [mark for _, mark in marks[1:]] + [finished]
+        phases = {phase: 1000 * (end - mark) for (phase, mark), end in zip(marks, ends)}
+        runs.append({**{phase: phases.get(phase, 0.0) for phase in PHASES}, "total": 1000 * (finished - started)})
+
+    optimal = response.metrics.gap is not None and response.metrics.gap <= 1e-9
+    return {
+        "name": f"{employees}x{shifts}",
+        "employees": employees,
+        "shifts": shifts,
+        "skills": skills,
+        "overlap_density": overlap_density,
+        "constraints": [c.value for c in request.constraints],
+        "seed": seed,
+        "mode": mode.value,
+        "time_limit_ms": time_limit_ms,
+        "model": model,
+        "phases_ms": {phase: statistics.median(run[phase] for run in runs) for phase in PHASES},
+        "total_ms": statistics.median(run["total"] for run in runs),
+        "objective_value": response.metrics.objective_value,
+        "gap": response.metrics.gap,
+        "optimal": optimal,
+        # Exact and LNS solves that end without a proof ran until their time limit or budget
+        "hit_limit": not optimal and mode != ScheduleMode.FAST,
+        "solver": response.metrics.solver,
+    }
+
+
+def case_key(result: Dict) -> Tuple:
+    """Identify a case by every generator and mode parameter, so only like cases are compared."""
+    return tuple(
+        tuple(sorted(result.get(name))) if isinstance(result.get(name), list) else result.get(name)
+        for name in CASE_PARAMETERS
+    )
+
+
+def run_suite(sizes: List[Tuple[int, int]], **case_options) -> Dict:
+    """Run one case per (employees, shifts) size and collect the results with the environment."""
+    results = []
+    for employees, shifts in sizes:
+        result = run_case(employees, shifts, **case_options)
+        print(f"{result['name']:>12}  total {result['total_ms']:10.1f} ms  "
+              + "  ".join(f"{phase} {result['phases_ms'][phase]:.1f}" for phase in PHASES)
+              + f"  objective {result['objective_value']:.0f} ({result['solver']}"
+              + (", hit the time limit" if result["hit_limit"] else "") + ")", flush=True)
+        results.append(result)
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "model_backend": settings.model_backend,
+            "solver_backend": settings.solver_backend,
+        },
+        "results": results,
+    }
+
+
+def compare_results(baseline: Dict,
+                    current: Dict,
+                    threshold: float = 0.25,
+                    min_delta_ms: float = 10.0,
+                    gap_tolerance: float = 0.01) -> List[Dict]:
+    """
+    Compare two suite results case by case.
+
+    Cases are matched on every parameter in CASE_PARAMETERS. A phase or total time
+    regresses when it grew by more than threshold (relative) and by more than
+    min_delta_ms, which keeps millisecond noise on small cases from being flagged.
+    Times are only compared when neither run hit its time limit: such a solve measures
+    the limit, so these cases are compared on their gap instead, which regresses when
+    it grew by more than gap_tolerance. A lower objective value is always a regression.
+
+    Returns:
+        One finding per compared metric with its baseline and current value, the ratio
+        and whether it is a regression. A current case without a baseline case of the
+        same parameters gets one finding flagged as a mismatch; baseline cases missing
+        from the current run are skipped.
+
+    Raises:
+        ValueError: If the suites ran with different model or solver backends
+    """
+    for name in META_PARAMETERS:
+        if baseline["meta"].get(name) != current["meta"].get(name):
+            raise ValueError(f"Baseline ran with {name}={baseline['meta'].get(name)}, "
+                             f"current with {name}={current['meta'].get(name)}")
+
+    baseline_cases = {case_key(result): result for result in baseline["results"]}
+    findings = []
+    for result in current["results"]:
+        reference = baseline_cases.get(case_key(result))
+        if reference is None:
+            findings.append({"case": result["name"], "metric": "parameters", "baseline": None, "current": None,
+                             "ratio": None, "regression": False, "mismatch": True})
+            continue
+
+        if not reference["hit_limit"] and not result["hit_limit"]:
+            times = [(phase, reference["phases_ms"].get(phase, 0.0), result["phases_ms"].get(phase, 0.0))
+                     for phase in PHASES]
+            times.append(("total", reference["total_ms"], result["total_ms"]))
+            for metric, before, after in times:
+                findings.append(_finding(result["name"], metric, before, after,
+                                         after > before * (1 + threshold) and after - before > min_delta_ms))
+        else:
+            before, after = _gap(reference), _gap(result)
+            findings.append(_finding(result["name"], "gap", before, after, after > before + gap_tolerance))
+        findings.append(_finding(result["name"], "objective_value", reference["objective_value"],
+                                 result["objective_value"],
+                                 result["objective_value"] < reference["objective_value"] - 1e-6))
+    return findings
+
+
+def _finding(case: str, metric: str, before: float, after: float, regression: bool) -> Dict:
+    """One compared metric of a case."""
+    return {"case": case, "metric": metric, "baseline": before, "current": after,
+            "ratio": after / before if before else None, "regression": regression, "mismatch": False}
+
+
+def _gap(result: Dict) -> float:
+    """Relative gap of a case, counting an unknown gap as the largest possible."""
+    return result["gap"] if result["gap"] is not None else 1.0
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -30,6 +30,44 @@ class Settings(BaseSettings):
     allowed_methods: List[str] = ["*"]
     allowed_headers: List[str] = ["*"]
 
+    # Optimization Configuration
+    model_backend: str = "matrix"  # "matrix" (CSR arrays streamed to the solver) or "pulp" (reference path)
+    solver_backend: str = "auto"  # "auto" or a registered solver: "highs", "cbc", "cpsat", "greedy"
+    solver_threads: int = 1
+    solver_time_limit_ms: int = 0  # Default time limit of a request's solves (0 = none)
+    greedy_min_columns: int = 2_000_000  # Auto-selection uses the greedy heuristic above this many pairs
+    cpsat_max_columns: int = 200_000  # Auto-selection considers CP-SAT up to this many pairs
+    decomposition_enabled: bool = True  # Solve independent components of the eligibility graph separately
+    decomposition_workers: int = 0  # Pool processes for component solves outside job workers (0 = one per CPU)
+    decomposition_min_pairs: int = 50_000  # Below this many pairs components are solved in-process
+    greedy_warm_start: bool = False  # Seed optimal-mode solves without current assignments with the fast engine
+    lns_time_budget_ms: int = 2000  # Default wall-clock budget of mode "lns"
+    lns_neighborhood_columns: int = 2000  # Maximum columns freed per LNS iteration
+
+    # Result Cache Configuration
+    result_cache_enabled: bool = True
+    result_cache_max_entries: int = 256
+    result_cache_ttl_seconds: int = 3600
+    result_cache_sqlite_path: Optional[str] = None  # Shared on-disk tier, e.g. "cache/results.sqlite3"
+
+    # Session Configuration
+    session_idle_ttl_seconds: int = 1800
+    session_max_count: int = 100
+    session_memory_cap_mb: int = 512
+
+    # Job Queue Configuration
+    job_workers: int = 0  # Solves run at once, each in its own process (0 = one per CPU)
+    job_queue_depth: int = 64  # Solves that may wait for a worker; beyond that requests get 429
+    job_retention_seconds: int = 3600  # Finished jobs are kept this long for polling
+    solve_memory_limit_mb: int = 4096  # Address-space limit of a solve process (0 = none)
+    solve_cpu_time_limit_seconds: int = 600  # CPU-time limit of a solve process (0 = none)
+    batch_max_parallel: int = 0  # Items of one batch solved at once (0 = JOB_WORKERS)
+    batch_max_items: int = 500  # Largest accepted batch
+    sweep_max_scenarios: int = 50  # Most scenarios accepted by one what-if sweep
+
+    # Health Check Configuration
+    health_check_interval_seconds: int = 60  # Time between background solver self-tests
+
     # Logging Configuration
     log_level_format: List[List[str]]=[
         ["INFO","<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"]
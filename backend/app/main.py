@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
@@ -5,6 +6,17 @@ from loguru import logger
 from core.settings import settings
 from core.logging import setup_logging
 from routers import schedule, health
+from services.health_monitor import solver_health
+from services.job_manager import job_manager
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the solver self-test in the background; kill the worker processes of unfinished jobs on shutdown."""
+    solver_health.start()
+    yield
+    solver_health.stop()
+    job_manager.shutdown()
 
 
 def create_application() -> FastAPI:
@@ -25,6 +37,7 @@ def create_application() -> FastAPI:
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
+        lifespan=lifespan,
         contact={
             "name": "Andrew Ayman",
             "email": "andrewayman9@gmail.com",
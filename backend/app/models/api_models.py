@@ -1,9 +1,39 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field, field_validator
 from enum import Enum
 from models.schemas import Employee, Shift, Assignment, ConstraintType, OptimizationMetrics
 
+class ScheduleMode(str, Enum):
+    """Enumeration of scheduling engines a request can select."""
+    OPTIMAL = "optimal"  # Integer linear program, optimal up to the solver's limits
+    FAST = "fast"  # Greedy assignment without building a model
+    LNS = "lns"  # Greedy start improved by large neighborhood search within a time budget
+
+
+class JobStatus(str, Enum):
+    """Enumeration of the states of an optimization job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class RollingHorizon(BaseModel):
+    """Options for solving a long period window by window."""
+    window_days: int = Field(7, ge=1, description="Length of each solved window in days")
+    overlap_days: int = Field(1, ge=0, description="Look-ahead days re-solved by the next window")
+
+    @field_validator('overlap_days')
+    def overlap_shorter_than_window(cls, v, info):
+        """Validate that windows advance by at least one day."""
+        window_days = info.data.get('window_days')
+        if window_days is not None and v >= window_days:
+            raise ValueError('Overlap must be shorter than the window')
+        return v
+
+
 class ShiftScheduleRequest(BaseModel):
     """Request model for schedule optimization."""
     period: str = Field(..., description="Period in ISO format (e.g., '2025-07-01/2025-07-14')")
@@ -17,6 +47,31 @@ class ShiftScheduleRequest(BaseModel):
         default=[],
         description="List of constraints to apply during optimization"
     )
+    rolling_horizon: Optional[RollingHorizon] = Field(
+        default=None,
+        description="Solve window by window instead of as one model (for multi-week periods)"
+    )
+    mode: ScheduleMode = Field(
+        default=ScheduleMode.OPTIMAL,
+        description="Scheduling engine: 'optimal' solves the ILP, 'fast' assigns shifts greedily, "
+                    "'lns' improves a greedy start until time_budget_ms"
+    )
+    time_limit_ms: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Stop the solver after this many milliseconds and return the best solution found"
+    )
+    mip_gap: Optional[float] = Field(
+        default=None,
+        ge=0,
+        le=1,
+        description="Stop once the solution is within this relative gap of the best bound"
+    )
+    time_budget_ms: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Wall-clock budget of mode 'lns' in milliseconds (defaults to the server setting)"
+    )
 
     @field_validator('period')
     def validate_period_format(cls, v):
@@ -38,10 +93,162 @@ class ShiftScheduleResponse(BaseModel):
     metrics: OptimizationMetrics = Field(..., description="Optimization performance metrics")
     constraints_applied: List[str] = Field(..., description="List of applied constraint types")
     message: Optional[str] = Field(None, description="Additional information or error message")
+    cached: bool = Field(False, description="Whether the response was served from the result cache")
+
+
+class BatchScheduleRequest(BaseModel):
+    """Request model for solving independent schedules in one call."""
+    requests: List[ShiftScheduleRequest] = Field(..., min_length=1, description="Schedules to optimize")
+    max_parallel: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of schedules solved at once (capped by the server's batch core budget)"
+    )
+
+
+class BatchItemResult(BaseModel):
+    """Outcome of one schedule of a batch."""
+    index: int = Field(..., ge=0, description="Position of the schedule in the batch request")
+    result: Optional[ShiftScheduleResponse] = Field(None, description="Optimized schedule, unless the item failed")
+    error: Optional[str] = Field(None, description="Reason the item failed")
+    time_ms: int = Field(..., ge=0, description="Time from the start of the item's solve to its result")
+
+
+class BatchSummary(BaseModel):
+    """Totals of a batch, sent as the last line of a streamed batch."""
+    succeeded: int = Field(..., ge=0, description="Items that returned a schedule")
+    failed: int = Field(..., ge=0, description="Items that returned an error")
+    max_parallel: int = Field(..., ge=1, description="Number of schedules solved at once")
+    total_time_ms: int = Field(..., ge=0, description="Wall-clock time of the whole batch")
+    throughput_per_second: float = Field(..., ge=0, description="Items finished per second of wall-clock time")
+
+
+class BatchScheduleResponse(BatchSummary):
+    """Response model for batch optimization, with the items in request order."""
+    items: List[BatchItemResult] = Field(..., description="Outcome of every schedule, in request order")
+
+
+class SweepScenario(BaseModel):
+    """Parameter overrides of one what-if scenario, applied to the base request."""
+    name: Optional[str] = Field(None, description="Label of the scenario in the result table")
+    max_hours: Optional[int] = Field(None, ge=0, description="Hour cap applied to every employee")
+    employee_max_hours: Dict[str, int] = Field(
+        default={},
+        description="Hour caps of individual employees by ID, applied after max_hours"
+    )
+    add_constraints: List[ConstraintType] = Field(default=[], description="Constraint types to activate")
+    remove_constraints: List[ConstraintType] = Field(default=[], description="Constraint types to deactivate")
+
+    @field_validator('employee_max_hours')
+    def caps_not_negative(cls, v):
+        """Validate that hour caps are not negative."""
+        if any(hours < 0 for hours in v.values()):
+            raise ValueError('Hour caps must not be negative')
+        return v
+
+
+class SweepRequest(BaseModel):
+    """Request model for a what-if sweep over one roster."""
+    base: ShiftScheduleRequest = Field(..., description="Roster, constraints and limits shared by all scenarios")
+    scenarios: List[SweepScenario] = Field(..., min_length=1, description="Scenarios to solve, in order")
+
+
+class SweepScenarioResult(BaseModel):
+    """One row of the sweep result table."""
+    name: str = Field(..., description="Label of the scenario")
+    objective_value: float = Field(..., description="Number of assigned shifts")
+    unassigned_shifts: int = Field(..., ge=0, description="Number of shifts left unassigned")
+    overtime_hours: float = Field(..., ge=0, description="Hours assigned beyond the base request's hour caps")
+    optimal: bool = Field(..., description="Whether the solver proved the schedule optimal")
+    solve_time_ms: int = Field(..., ge=0, description="Time spent solving the scenario")
+
+
+class SweepResponse(BaseModel):
+    """Response model for a what-if sweep."""
+    scenarios: List[SweepScenarioResult] = Field(..., description="Result of every scenario, in request order")
+    num_columns: int = Field(..., ge=0, description="Columns of the model shared by all scenarios")
+    num_rows: int = Field(..., ge=0, description="Rows of the model shared by all scenarios")
+    build_time_ms: int = Field(..., ge=0, description="Time spent compiling the shared model once")
+    total_time_ms: int = Field(..., ge=0, description="Wall-clock time of the whole sweep")
+
+
+class SessionDelta(BaseModel):
+    """Request model for roster edits applied to an optimization session."""
+    add_employees: List[Employee] = Field(default=[], description="Employees to add")
+    update_employees: List[Employee] = Field(default=[], description="Employees to replace, matched by ID")
+    remove_employees: List[str] = Field(default=[], description="IDs of employees to remove")
+    add_shifts: List[Shift] = Field(default=[], description="Shifts to add")
+    update_shifts: List[Shift] = Field(default=[], description="Shifts to replace, matched by ID")
+    remove_shifts: List[str] = Field(default=[], description="IDs of shifts to remove")
+    add_constraints: List[ConstraintType] = Field(default=[], description="Constraint types to activate")
+    remove_constraints: List[ConstraintType] = Field(default=[], description="Constraint types to deactivate")
+
+
+class SessionScheduleResponse(ShiftScheduleResponse):
+    """Response model for optimization session endpoints."""
+    session_id: str = Field(..., description="ID of the optimization session")
+    num_employees: int = Field(..., ge=0, description="Employees currently in the session")
+    num_shifts: int = Field(..., ge=0, description="Shifts currently in the session")
+
+
+class CacheStatsResponse(BaseModel):
+    """Response model for result cache statistics."""
+    hits: int = Field(..., ge=0, description="Lookups answered from the cache")
+    misses: int = Field(..., ge=0, description="Lookups that required a solve")
+    disk_hits: int = Field(..., ge=0, description="Hits answered by the on-disk tier")
+    hit_rate: float = Field(..., ge=0, le=1, description="Share of lookups answered from the cache")
+    entries: int = Field(..., ge=0, description="Responses held in memory")
+    max_entries: int = Field(..., ge=0, description="Maximum number of cached responses")
+    ttl_seconds: float = Field(..., ge=0, description="Seconds before an entry expires")
+    sqlite_enabled: bool = Field(..., description="Whether the shared SQLite tier is configured")
+
+
+class JobResponse(BaseModel):
+    """Status of an optimization job, with its result once completed."""
+    job_id: str = Field(..., description="ID of the job")
+    status: JobStatus = Field(..., description="Current state of the job")
+    submitted_at: datetime = Field(..., description="Server time the job was submitted")
+    queue_position: Optional[int] = Field(None, ge=0, description="Jobs ahead of this one while queued")
+    wait_ms: float = Field(..., ge=0, description="Time spent waiting for a worker so far")
+    run_ms: Optional[float] = Field(None, ge=0, description="Time spent solving so far")
+    result: Optional[ShiftScheduleResponse] = Field(None, description="Schedule of a completed job")
+    error: Optional[str] = Field(None, description="Reason a job failed")
+
+
+class JobQueueStatsResponse(BaseModel):
+    """Job queue statistics for monitoring."""
+    queued: int = Field(..., ge=0, description="Jobs waiting for a worker")
+    running: int = Field(..., ge=0, description="Jobs being solved")
+    workers: int = Field(..., ge=1, description="Maximum number of jobs solved at once")
+    max_queued: Optional[int] = Field(None, ge=0, description="Maximum number of jobs waiting for a worker")
+    completed: int = Field(..., ge=0, description="Jobs completed since start-up")
+    failed: int = Field(..., ge=0, description="Jobs failed since start-up")
+    cancelled: int = Field(..., ge=0, description="Jobs cancelled since start-up")
+    rejected: int = Field(..., ge=0, description="Submissions rejected because the queue was full")
+    queue_full: bool = Field(False, description="Whether new solves are rejected until a slot frees up")
+    mean_wait_ms: float = Field(..., ge=0, description="Mean queue wait of recently started jobs")
+    max_wait_ms: float = Field(..., ge=0, description="Longest queue wait of recently started jobs")
+    oldest_queued_wait_ms: float = Field(..., ge=0, description="Time the oldest queued job has waited so far")
 
 
 class HealthResponse(BaseModel):
     """Response model for health check endpoint."""
     status: str = Field(..., description="Service status")
     timestamp: datetime = Field(..., description="Current server timestamp")
-    version: str = Field(..., description="API version")
\ No newline at end of file
+    version: str = Field(..., description="API version")
+    dependencies: Dict[str, str] = Field(default={}, description="Status of every dependency")
+    solver_checked_at: Optional[datetime] = Field(None, description="Server time of the last solver self-test")
+
+
+class ReadinessResponse(BaseModel):
+    """Response model for the readiness probe."""
+    status: str = Field(..., description="'ready' or 'not_ready'")
+    timestamp: datetime = Field(..., description="Current server timestamp")
+    solver: str = Field(..., description="Result of the last solver self-test")
+    solver_checked_at: Optional[datetime] = Field(None, description="Server time of the last solver self-test")
+    workers: int = Field(..., ge=1, description="Maximum number of solves run at once")
+    running: int = Field(..., ge=0, description="Solves running now")
+    queued: int = Field(..., ge=0, description="Solves waiting for a worker")
+    max_queued: Optional[int] = Field(None, ge=0, description="Maximum number of solves waiting for a worker")
+    saturation: float = Field(..., ge=0, description="Share of workers busy")
+    queue_full: bool = Field(..., description="Whether new solves are rejected with 429")
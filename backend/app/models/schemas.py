@@ -32,7 +32,24 @@ class Employee(BaseModel):
     name: str = Field(..., description="Full name of the employee")
     skills: List[str] = Field(..., description="List of skills the employee possesses")
     max_hours: int = Field(..., ge=0, le=168, description="Maximum weekly hours (0-168)")
-    availability: Availability = Field(..., description="Employee availability window")
+    availability: List[Availability] = Field(
+        ...,
+        description="Employee availability windows (a single window object is also accepted)"
+    )
+
+    @field_validator('availability', mode='before')
+    def wrap_single_window(cls, v):
+        """Accept a single availability window as a one-element list."""
+        if isinstance(v, (dict, Availability)):
+            return [v]
+        return v
+
+    @field_validator('availability')
+    def availability_not_empty(cls, v):
+        """Validate that employee has at least one availability window."""
+        if not v:
+            raise ValueError('Employee must have at least one availability window')
+        return v
 
     @field_validator('skills')
     def skills_not_empty(cls, v):
@@ -71,9 +88,55 @@ class Assignment(BaseModel):
     employee_id: str = Field(..., description="ID of the assigned employee")
 
 
+class ComponentMetrics(BaseModel):
+    """Model containing the size and timing of one independently solved component."""
+    num_employees: int = Field(..., ge=0, description="Employees in the component")
+    num_shifts: int = Field(..., ge=0, description="Shifts in the component")
+    num_pairs: int = Field(..., ge=0, description="Eligible employee-shift pairs in the component")
+    solve_time_ms: int = Field(..., ge=0, description="Build and solve time of the component in milliseconds")
+    objective_value: float = Field(..., description="Objective value of the component")
+    solver: Optional[str] = Field(None, description="Solver backend used for the component")
+
+
+class WindowMetrics(BaseModel):
+    """Model containing the outcome of one rolling-horizon window."""
+    start: datetime = Field(..., description="Start of the window")
+    end: datetime = Field(..., description="End of the window (exclusive)")
+    commit_end: datetime = Field(..., description="Shifts starting before this time were committed")
+    num_shifts: int = Field(..., ge=0, description="Shifts solved in the window, including look-ahead")
+    committed_assignments: int = Field(..., ge=0, description="Assignments fixed by this window")
+    solve_time_ms: int = Field(..., ge=0, description="Build and solve time of the window in milliseconds")
+    objective_value: float = Field(..., description="Objective value of the window model")
+
+
+class ObjectivePoint(BaseModel):
+    """Model representing the objective value reached at some point of an anytime solve."""
+    elapsed_ms: int = Field(..., ge=0, description="Milliseconds since the request started")
+    objective_value: float = Field(..., description="Best objective value at that time")
+
+
 class OptimizationMetrics(BaseModel):
     """Model containing optimization performance metrics."""
     total_overtime_minutes: int = Field(..., ge=0, description="Total overtime in minutes")
     constraint_violations: int = Field(..., ge=0, description="Number of constraint violations")
     optimization_time_ms: int = Field(..., ge=0, description="Optimization time in milliseconds")
     objective_value: float = Field(..., description="Final objective function value")
+    solver: Optional[str] = Field(None, description="Solver backend that produced the result")
+    solver_reason: Optional[str] = Field(None, description="Why the solver backend was selected")
+    warm_start_assignments: int = Field(0, ge=0, description="Current assignments accepted as the MIP start")
+    time_to_first_incumbent_ms: Optional[int] = Field(
+        None, ge=0, description="Milliseconds until the solver found its first non-empty solution"
+    )
+    components: List[ComponentMetrics] = Field(
+        default=[], description="Independent components solved separately, largest first"
+    )
+    windows: List[WindowMetrics] = Field(default=[], description="Rolling-horizon windows in solve order")
+    best_bound: Optional[float] = Field(
+        None, description="Upper bound on the objective value of the full model, when known"
+    )
+    gap: Optional[float] = Field(
+        None, ge=0, description="Relative gap between best_bound and objective_value, when known"
+    )
+    objective_trace: List[ObjectivePoint] = Field(
+        default=[], description="Objective value after every improvement of an anytime solve"
+    )
@@ -1,9 +1,13 @@
 from datetime import datetime
 from fastapi import APIRouter, status, HTTPException
+from fastapi.responses import JSONResponse
 from loguru import logger
-import pulp
+from starlette.concurrency import run_in_threadpool
 
-from models.api_models import HealthResponse
+from models.api_models import HealthResponse, ReadinessResponse
+from services.health_monitor import HEALTHY, solver_health
+from services.job_manager import job_manager
+from core.settings import settings
 
 # Create router for health check endpoints
 router = APIRouter(
@@ -23,12 +27,15 @@ router = APIRouter(
     summary="Backend availability check",
     description="""
     Check the health status of the schedule optimization service.
-    
+
     This endpoint provides information about:
     - Overall service status
     - Current timestamp
     - API version
     - Status of external dependencies (optimization solver, etc.)
+
+    The solver status is the cached result of a self-test refreshed in the
+    background, so the endpoint is cheap to call.
     """,
     response_description="Health status information",
 )
@@ -40,10 +47,8 @@ async def health_check() -> HealthResponse:
         HealthResponse: Current health status and dependency information
     """
     try:
-        logger.info("Health check requested")
-
-        # Check PuLP solver availability
-        solver_status = _check_solver_availability()
+        # Cached solver self-test (run in a thread only when there is no fresh result)
+        solver_status, checked_at = await run_in_threadpool(solver_health.current)
 
         # Check other dependencies as needed
         dependencies = {
@@ -59,16 +64,14 @@ async def health_check() -> HealthResponse:
             else "degraded"
         )
 
-        response = HealthResponse(
+        return HealthResponse(
             status=overall_status,
             timestamp=datetime.now(),
-            version="1.0.0",
+            version=settings.app_version,
             dependencies=dependencies,
+            solver_checked_at=checked_at,
         )
 
-        logger.info(f"Health check completed: {overall_status}")
-        return response
-
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
         raise HTTPException(
@@ -77,29 +80,64 @@ async def health_check() -> HealthResponse:
         )
 
 
-def _check_solver_availability() -> str:
+@router.get(
+    "/health/live",
+    response_model=HealthResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Liveness probe",
+    description="""
+    Report that the server process is up and serving requests. Does no other
+    work, so it can be probed as often as needed.
+    """,
+    response_description="Liveness status",
+)
+async def liveness() -> HealthResponse:
     """
-    Check if the optimization solver is available and working.
+    Answer the liveness probe.
 
     Returns:
-        str: Status of the solver ("healthy", "degraded", or "unhealthy")
+        HealthResponse: Status "alive"
     """
-    try:
-        # Create a simple test problem
-        test_problem = pulp.LpProblem("HealthTest", pulp.LpMaximize)
-        x = pulp.LpVariable("x", lowBound=0)
-        test_problem += x
-        test_problem += x <= 1
+    return HealthResponse(status="alive", timestamp=datetime.now(), version=settings.app_version)
 
-        # Try to solve it
-        solver = pulp.PULP_CBC_CMD(msg=0)
-        status = test_problem.solve(solver)
 
-        if status == pulp.LpStatusOptimal:
-            return "healthy"
-        else:
-            return "degraded"
+@router.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Readiness probe",
+    description="""
+    Report whether the service can take optimization requests: the cached
+    solver self-test passed and the worker pool queue has room. Answers 503
+    otherwise, so load balancers route new solves elsewhere. The body reports
+    pool saturation and queue depth either way.
+    """,
+    response_description="Readiness status with worker pool load",
+)
+async def readiness():
+    """
+    Answer the readiness probe.
 
-    except Exception as e:
-        logger.error(f"Solver health check failed: {str(e)}")
-        return "unhealthy"
+    Returns:
+        ReadinessResponse: Readiness with solver status and pool load, with status 503 when not ready
+    """
+    solver_status, checked_at = await run_in_threadpool(solver_health.current)
+    stats = job_manager.stats()
+    ready = solver_status == HEALTHY and not stats["queue_full"]
+
+    response = ReadinessResponse(
+        status="ready" if ready else "not_ready",
+        timestamp=datetime.now(),
+        solver=solver_status,
+        solver_checked_at=checked_at,
+        workers=stats["workers"],
+        running=stats["running"],
+        queued=stats["queued"],
+        max_queued=stats["max_queued"],
+        saturation=stats["running"] / stats["workers"],
+        queue_full=stats["queue_full"],
+    )
+    if not ready:
+        logger.warning(f"Not ready: solver {solver_status}, queue full: {stats['queue_full']}")
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=response.model_dump(mode="json"))
+    return response
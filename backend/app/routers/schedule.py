@@ -1,12 +1,43 @@
+import asyncio
+import json
+import time
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, status
+from typing import AsyncIterator, Callable, Dict, List, Optional, Type, Union
+from fastapi import APIRouter, Header, HTTPException, status
+from fastapi.responses import StreamingResponse
 from loguru import logger
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 
 from models.api_models import (
+    BatchItemResult,
+    BatchScheduleRequest,
+    BatchScheduleResponse,
+    BatchSummary,
+    CacheStatsResponse,
+    JobQueueStatsResponse,
+    JobResponse,
+    JobStatus,
+    SessionDelta,
+    SessionScheduleResponse,
     ShiftScheduleRequest,
-    ShiftScheduleResponse
+    ShiftScheduleResponse,
+    SweepRequest,
+    SweepResponse
 )
+from services.job_manager import (
+    FINISHED_STATUSES,
+    JobNotFoundError,
+    OptimizationJob,
+    QueueFullError,
+    job_manager,
+    run_sweep
+)
+from services.result_cache import canonical_request_key, result_cache
+from services.session_manager import ScheduleSession, SessionNotFoundError, session_manager
 from services.shift_scheduler import ShiftScheduler
+from services.sweep import validate_scenarios
+from core.settings import settings
 
 # Create router with prefix and tags for OpenAPI documentation
 router = APIRouter(
@@ -14,10 +45,14 @@ router = APIRouter(
     tags=["Schedule Optimization"],
     responses={
         500: {"description": "Internal server error"},
-        400: {"description": "Bad request"}
+        400: {"description": "Bad request"},
+        429: {"description": "Solver pool and queue are full, retry after the Retry-After seconds"}
     }
 )
 
+# Seconds without events after which an event stream sends a comment to keep proxies from closing it
+KEEPALIVE_SECONDS = 15.0
+
 
 def get_scheduler() -> ShiftScheduler:
     """
@@ -43,6 +78,9 @@ def get_scheduler() -> ShiftScheduler:
     This endpoint takes a list of employees, shifts, and constraints, then
     returns an optimized assignment that maximizes efficiency while
     respecting all specified constraints.
+    
+    The solve runs on the bounded worker pool shared with optimization jobs;
+    when the pool and its queue are full the request is rejected with 429.
     """,
     response_description="Optimized schedule with assignments and metrics"
 )
@@ -68,11 +106,8 @@ async def optimize_schedule(
         # Validate input data
         _validate_optimization_request(request)
         
-        # Create a new scheduler instance for this request (thread-safe)
-        scheduler = get_scheduler()
-        
-        # Perform optimization
-        result = scheduler.schedule(request)
+        # Perform optimization on the worker pool (cached rosters are answered at once)
+        result = await _solve_on_pool(request, _cache_key(request))
         
         if result.success:
             logger.info(f"Optimization successful: {len(result.assignments)} assignments")
@@ -81,6 +116,8 @@ async def optimize_schedule(
         
         return result
         
+    except QueueFullError as e:
+        raise _queue_full(e)
     except ValueError as e:
         logger.error(f"Validation error: {str(e)}")
         raise HTTPException(
@@ -95,6 +132,666 @@ async def optimize_schedule(
         )
 
 
+@router.post(
+    "/optimize/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Run an optimization and stream its progress",
+    description="""
+    Solve a request on the worker pool and stream progress as server-sent events.
+    
+    The first event ("job") carries the job ID. It is followed by "phase"
+    events (validate, build, solve, extract), a "model" event with the size of
+    the model, "incumbent" events with every improving solution and its gap,
+    and finally a "completed", "failed" or "cancelled" event with the job and
+    its schedule. Closing the connection cancels the solve, so a client can
+    stop early once an incumbent is good enough; the schedule of a stopped
+    solve is not returned, resubmit with time_limit_ms or mip_gap instead.
+    """,
+    response_description="Stream of text/event-stream progress events"
+)
+async def optimize_schedule_stream(request: ShiftScheduleRequest) -> StreamingResponse:
+    """
+    Optimize a schedule and stream its progress.
+    
+    Args:
+        request: Schedule optimization request containing employees, shifts, and constraints
+        
+    Returns:
+        StreamingResponse: Server-sent progress events ending with the job result
+        
+    Raises:
+        HTTPException: If the request is invalid or the worker pool is full
+    """
+    try:
+        _validate_optimization_request(request)
+    except ValueError as e:
+        logger.error(f"Validation error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid request data: {str(e)}"
+        )
+    
+    try:
+        job = await run_in_threadpool(job_manager.submit, request, _cache_key(request))
+    except QueueFullError as e:
+        raise _queue_full(e)
+    return _event_stream_response(job, cancel_on_disconnect=True)
+
+
+@router.post(
+    "/optimize/batch",
+    response_model=BatchScheduleResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Optimize many independent schedules in one call",
+    description="""
+    Solve a list of optimization requests in parallel on the worker pool.
+    
+    At most max_parallel items (capped by the server's batch core budget) are
+    solved at once. An item that is invalid, fails or finds the pool full gets
+    an error without affecting the others. By default the items are returned
+    in request order once all have finished; with ?stream=true each item is
+    sent as a line of NDJSON as soon as it finishes, followed by a last line
+    with the batch totals. Closing a streamed response cancels the remaining
+    items.
+    """,
+    response_description="Per-item schedules or errors with the batch wall time and throughput"
+)
+async def optimize_batch(
+    batch: BatchScheduleRequest,
+    stream: bool = False
+) -> Union[BatchScheduleResponse, StreamingResponse]:
+    """
+    Optimize a batch of schedules.
+    
+    Args:
+        batch: Requests to optimize and the parallelism to use
+        stream: Stream the items as NDJSON in completion order
+        
+    Returns:
+        BatchScheduleResponse: Items in request order with the batch totals, or a
+        StreamingResponse of NDJSON lines when streaming
+        
+    Raises:
+        HTTPException: If the batch is larger than the configured maximum
+    """
+    if len(batch.requests) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid request data: a batch holds at most {settings.batch_max_items} requests"
+        )
+    
+    budget = settings.batch_max_parallel or job_manager.max_workers
+    max_parallel = min(batch.max_parallel or budget, budget, len(batch.requests))
+    logger.info(f"Received batch of {len(batch.requests)} requests, solving {max_parallel} at once")
+    
+    if stream:
+        return StreamingResponse(_stream_batch(batch.requests, max_parallel), media_type="application/x-ndjson")
+    
+    started = time.perf_counter()
+    items = await _solve_batch(batch.requests, max_parallel)
+    return BatchScheduleResponse(**_batch_summary(items, max_parallel, started).model_dump(), items=items)
+
+
+@router.post(
+    "/sweep",
+    response_model=SweepResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Compare what-if scenarios of one roster",
+    description="""
+    Solve a base request under a list of parameter overrides, such as a common
+    max_hours cap for everyone, individual caps, or added and removed
+    constraint types.
+    
+    The model is compiled once for all scenarios; each solve only changes
+    column and row bounds and is warm started from the previous scenario's
+    schedule. The result is a compact table with the assigned shifts,
+    unassigned shifts and overtime hours (against the base request's caps) of
+    every scenario. Scenarios are always solved with the ILP; the base
+    request's mode and rolling horizon are not used.
+    
+    The sweep runs as one job on the bounded worker pool; when the pool and
+    its queue are full the request is rejected with 429.
+    """,
+    response_description="Objective, unassigned shifts and overtime per scenario"
+)
+async def sweep_scenarios(sweep: SweepRequest) -> SweepResponse:
+    """
+    Solve what-if scenarios of one roster.
+    
+    Args:
+        sweep: Base request and the scenario overrides
+        
+    Returns:
+        SweepResponse: One result row per scenario
+        
+    Raises:
+        HTTPException: If the base request or a scenario is invalid
+    """
+    try:
+        if len(sweep.scenarios) > settings.sweep_max_scenarios:
+            raise ValueError(f"a sweep holds at most {settings.sweep_max_scenarios} scenarios")
+        _validate_optimization_request(sweep.base)
+        validate_scenarios(sweep.base, sweep.scenarios)
+        logger.info(f"Received sweep of {len(sweep.scenarios)} scenarios for period: {sweep.base.period}")
+        return await _solve_on_pool(sweep, None, worker=run_sweep, result_type=SweepResponse)
+    except QueueFullError as e:
+        raise _queue_full(e)
+    except ValueError as e:
+        logger.error(f"Validation error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid request data: {str(e)}"
+        )
+    except Exception as e:
+        logger.error(f"Sweep service error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal optimization service error"
+        )
+
+
+@router.get(
+    "/cache/stats",
+    response_model=CacheStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Result cache statistics",
+    description="""
+    Report hit and miss counters and occupancy of the optimization result cache.
+    """,
+    response_description="Result cache counters"
+)
+async def cache_stats() -> CacheStatsResponse:
+    """
+    Return result cache statistics.
+    
+    Returns:
+        CacheStatsResponse: Hit/miss counters and occupancy
+    """
+    return CacheStatsResponse(**result_cache.stats())
+
+
+@router.post(
+    "/sessions",
+    response_model=SessionScheduleResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Start a stateful optimization session",
+    description="""
+    Upload a roster once, solve it and keep the compiled model on the server.
+    
+    The returned session ID accepts delta updates through PATCH, which re-solve
+    only after re-evaluating the edited employees and shifts. Idle sessions are
+    evicted after the configured idle time or when the memory cap is reached.
+    
+    Session solves take a slot of the bounded worker pool; when the pool and its
+    queue are full the request is rejected with 429.
+    """,
+    response_description="Session ID and the first optimized schedule"
+)
+async def create_session(request: ShiftScheduleRequest) -> SessionScheduleResponse:
+    """
+    Create an optimization session.
+    
+    Args:
+        request: Roster and constraints to keep in the session
+        
+    Returns:
+        SessionScheduleResponse: Session ID and the optimized schedule
+        
+    Raises:
+        HTTPException: If the roster is invalid or the session cannot be created
+    """
+    try:
+        _validate_optimization_request(request)
+        session = await run_in_threadpool(job_manager.run_local,
+                                          lambda: session_manager.create(request, get_scheduler()))
+        return _session_response(session)
+    except QueueFullError as e:
+        raise _queue_full(e)
+    except ValueError as e:
+        logger.error(f"Validation error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid request data: {str(e)}"
+        )
+
+
+@router.get(
+    "/sessions/{session_id}",
+    response_model=SessionScheduleResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get the current schedule of a session",
+    response_description="Last optimized schedule of the session"
+)
+async def get_session(session_id: str) -> SessionScheduleResponse:
+    """
+    Return the last schedule computed for a session.
+    
+    Raises:
+        HTTPException: If the session does not exist or has been evicted
+    """
+    try:
+        return _session_response(session_manager.get(session_id))
+    except SessionNotFoundError:
+        raise _session_not_found(session_id)
+
+
+@router.patch(
+    "/sessions/{session_id}",
+    response_model=SessionScheduleResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Apply roster edits to a session and re-optimize",
+    description="""
+    Add, update or remove employees, shifts and constraint types of a session.
+    
+    Only the edited employees and shifts are compiled and re-evaluated: overlap
+    cliques are updated around the edited shifts, the kept model is patched
+    instead of rebuilt, and the previous solution warm starts the solver. The
+    solve takes a slot of the bounded worker pool (429 when it is full).
+    """,
+    response_description="Re-optimized schedule of the session"
+)
+async def update_session(session_id: str, delta: SessionDelta) -> SessionScheduleResponse:
+    """
+    Apply a delta to a session and re-solve.
+    
+    Args:
+        session_id: ID of the session
+        delta: Roster and constraint edits
+        
+    Returns:
+        SessionScheduleResponse: The re-optimized schedule
+        
+    Raises:
+        HTTPException: If the session does not exist or the delta is invalid
+    """
+    try:
+        session = await run_in_threadpool(job_manager.run_local,
+                                          lambda: session_manager.apply_delta(session_id, delta, get_scheduler()))
+        return _session_response(session)
+    except QueueFullError as e:
+        raise _queue_full(e)
+    except SessionNotFoundError:
+        raise _session_not_found(session_id)
+    except ValueError as e:
+        logger.error(f"Validation error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid request data: {str(e)}"
+        )
+
+
+@router.delete(
+    "/sessions/{session_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Close an optimization session"
+)
+async def delete_session(session_id: str) -> None:
+    """
+    Drop a session and its compiled model.
+    
+    Raises:
+        HTTPException: If the session does not exist
+    """
+    try:
+        session_manager.delete(session_id)
+    except SessionNotFoundError:
+        raise _session_not_found(session_id)
+
+
+@router.post(
+    "/jobs",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Submit an optimization job",
+    description="""
+    Queue an optimization request and return its job ID immediately.
+    
+    Each job is solved in its own worker process once a worker slot is free, so
+    long solves do not hold up other requests. Poll the job with GET and cancel
+    it with DELETE.
+    """,
+    response_description="Job ID and queue status"
+)
+async def submit_job(request: ShiftScheduleRequest) -> JobResponse:
+    """
+    Queue an optimization request.
+    
+    Args:
+        request: Schedule optimization request containing employees, shifts, and constraints
+        
+    Returns:
+        JobResponse: The queued job
+        
+    Raises:
+        HTTPException: If the request is invalid
+    """
+    try:
+        _validate_optimization_request(request)
+    except ValueError as e:
+        logger.error(f"Validation error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid request data: {str(e)}"
+        )
+    
+    try:
+        # Starting a worker process may take a moment, so keep it off the event loop
+        job = await run_in_threadpool(job_manager.submit, request, _cache_key(request))
+    except QueueFullError as e:
+        raise _queue_full(e)
+    return _job_response(job)
+
+
+@router.get(
+    "/jobs/stats",
+    response_model=JobQueueStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Job queue statistics",
+    description="""
+    Report queue depth, running jobs, outcome counters and queue wait times.
+    """,
+    response_description="Job queue counters"
+)
+async def job_stats() -> JobQueueStatsResponse:
+    """
+    Return job queue statistics.
+    
+    Returns:
+        JobQueueStatsResponse: Queue depth, counters and wait times
+    """
+    return JobQueueStatsResponse(**job_manager.stats())
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=JobResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get the status and result of a job",
+    response_description="Job status, with the schedule once completed"
+)
+async def get_job(job_id: str) -> JobResponse:
+    """
+    Return the status of a job.
+    
+    Raises:
+        HTTPException: If the job does not exist or has expired
+    """
+    try:
+        return _job_response(job_manager.get(job_id))
+    except JobNotFoundError:
+        raise _job_not_found(job_id)
+
+
+@router.get(
+    "/jobs/{job_id}/events",
+    status_code=status.HTTP_200_OK,
+    summary="Stream the progress of a job",
+    description="""
+    Stream the progress events of a job as server-sent events, from the first
+    event or after the one named by the Last-Event-ID header, ending with a
+    "completed", "failed" or "cancelled" event. Disconnecting does not cancel
+    the job.
+    """,
+    response_description="Stream of text/event-stream progress events"
+)
+async def stream_job_events(job_id: str, last_event_id: Optional[str] = Header(None)) -> StreamingResponse:
+    """
+    Stream the progress of a job.
+    
+    Args:
+        job_id: ID of the job
+        last_event_id: ID of the last event a reconnecting client received
+        
+    Raises:
+        HTTPException: If the job does not exist or has expired
+    """
+    try:
+        job = job_manager.get(job_id)
+    except JobNotFoundError:
+        raise _job_not_found(job_id)
+    start = int(last_event_id) + 1 if last_event_id and last_event_id.isdigit() else 0
+    return _event_stream_response(job, start=start)
+
+
+@router.delete(
+    "/jobs/{job_id}",
+    response_model=JobResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Cancel a job",
+    description="""
+    Remove a queued job from the queue, or kill the worker process of a running
+    job together with its solver. Finished jobs are returned unchanged.
+    """,
+    response_description="Final status of the job"
+)
+async def cancel_job(job_id: str) -> JobResponse:
+    """
+    Cancel a job.
+    
+    Raises:
+        HTTPException: If the job does not exist or has expired
+    """
+    try:
+        return _job_response(job_manager.cancel(job_id))
+    except JobNotFoundError:
+        raise _job_not_found(job_id)
+
+
+def _cache_key(request: ShiftScheduleRequest) -> Optional[str]:
+    """Result cache key of a request for the configured backends, or None when caching is off."""
+    if not settings.result_cache_enabled:
+        return None
+    scheduler = get_scheduler()
+    return canonical_request_key(request, scheduler.model_backend, scheduler.solver_backend)
+
+
+async def _solve_on_pool(request: BaseModel,
+                         cache_key: Optional[str],
+                         worker: Optional[Callable] = None,
+                         result_type: Type[BaseModel] = ShiftScheduleResponse) -> BaseModel:
+    """
+    Solve a request on the worker pool without blocking the event loop.
+    
+    Schedule requests use the pool's default worker; other jobs pass their worker and
+    response model (see JobManager.submit).
+    
+    Raises:
+        QueueFullError: If the pool and its queue are full
+        RuntimeError: If the worker failed
+    """
+    loop = asyncio.get_running_loop()
+    finished = loop.create_future()
+    
+    def on_finish(job: OptimizationJob) -> None:
+        try:
+            loop.call_soon_threadsafe(lambda: finished.done() or finished.set_result(None))
+        except RuntimeError:
+            pass  # The event loop is gone, nobody is waiting any more
+    
+    job = await run_in_threadpool(job_manager.submit, request, cache_key, on_finish, worker, result_type)
+    try:
+        await finished
+    except asyncio.CancelledError:
+        job_manager.cancel(job.job_id)  # The client went away, free the worker
+        raise
+    if job.status != JobStatus.COMPLETED:
+        raise RuntimeError(job.error)
+    return job.result
+
+
+def _event_stream_response(job: OptimizationJob, start: int = 0,
+                           cancel_on_disconnect: bool = False) -> StreamingResponse:
+    """Wrap the progress events of a job in a server-sent event response."""
+    return StreamingResponse(
+        _job_events(job, start, cancel_on_disconnect),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _job_events(job: OptimizationJob, start: int, cancel_on_disconnect: bool) -> AsyncIterator[str]:
+    """
+    Yield the progress events of a job from index start, then its final status.
+    
+    Event IDs are the indices of the progress events, so a client resumes with
+    Last-Event-ID; the final event takes the next ID.
+    """
+    loop = asyncio.get_running_loop()
+    changed = asyncio.Event()
+    
+    def listener() -> None:
+        try:
+            loop.call_soon_threadsafe(changed.set)
+        except RuntimeError:
+            pass  # The event loop is gone, nobody is listening any more
+    
+    job_manager.subscribe(job, listener)
+    sent = start
+    try:
+        if start == 0 and cancel_on_disconnect:
+            yield _sse_event("job", _job_response(job).model_dump(mode="json"))
+        while True:
+            changed.clear()
+            # Read the status first: every progress event arrives before the job finishes
+            finished = job.status in FINISHED_STATUSES
+            for name, payload in job.events[sent:]:
+                yield _sse_event(name, payload, sent)
+                sent += 1
+            if finished:
+                yield _sse_event(job.status.value, _job_response(job).model_dump(mode="json"), sent)
+                return
+            try:
+                await asyncio.wait_for(changed.wait(), KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+    finally:
+        job_manager.unsubscribe(job, listener)
+        if cancel_on_disconnect and job.status not in FINISHED_STATUSES:
+            job_manager.cancel(job.job_id)  # The client stopped listening, free the worker
+
+
+def _sse_event(name: str, data: Dict, event_id: Optional[int] = None) -> str:
+    """Format one server-sent event."""
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines += [f"event: {name}", f"data: {json.dumps(data, default=str)}"]
+    return "\n".join(lines) + "\n\n"
+
+
+def _batch_tasks(requests: List[ShiftScheduleRequest], max_parallel: int) -> List[asyncio.Task]:
+    """Start one task per batch item, at most max_parallel of them solving at once."""
+    semaphore = asyncio.Semaphore(max_parallel)
+    
+    async def solve_item(index: int, request: ShiftScheduleRequest) -> BatchItemResult:
+        async with semaphore:
+            started = time.perf_counter()
+            result, error = None, None
+            try:
+                _validate_optimization_request(request)
+                result = await _solve_on_pool(request, _cache_key(request))
+            except QueueFullError as e:
+                logger.warning(str(e))
+                error = "Too many optimization requests, please retry later"
+            except ValueError as e:
+                error = f"Invalid request data: {str(e)}"
+            except Exception as e:
+                logger.error(f"Batch item {index} failed: {str(e)}")
+                error = str(e) or "Internal optimization service error"
+            return BatchItemResult(index=index, result=result, error=error,
+                                   time_ms=int((time.perf_counter() - started) * 1000))
+    
+    return [asyncio.create_task(solve_item(index, request)) for index, request in enumerate(requests)]
+
+
+async def _solve_batch(requests: List[ShiftScheduleRequest], max_parallel: int) -> List[BatchItemResult]:
+    """Solve batch items and return them in request order; cancelling cancels the unfinished items."""
+    tasks = _batch_tasks(requests, max_parallel)
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _stream_batch(requests: List[ShiftScheduleRequest], max_parallel: int) -> AsyncIterator[str]:
+    """Yield batch items as NDJSON lines as they finish, then the batch totals."""
+    started = time.perf_counter()
+    tasks = _batch_tasks(requests, max_parallel)
+    items = []
+    try:
+        for finished in asyncio.as_completed(tasks):
+            item = await finished
+            items.append(item)
+            yield item.model_dump_json() + "\n"
+        yield _batch_summary(items, max_parallel, started).model_dump_json() + "\n"
+    finally:
+        for task in tasks:
+            task.cancel()  # The client went away: free the workers of unfinished items
+
+
+def _batch_summary(items: List[BatchItemResult], max_parallel: int, started: float) -> BatchSummary:
+    """Count the outcomes of a finished batch and its throughput."""
+    elapsed = time.perf_counter() - started
+    failed = sum(item.error is not None for item in items)
+    return BatchSummary(
+        succeeded=len(items) - failed,
+        failed=failed,
+        max_parallel=max_parallel,
+        total_time_ms=int(elapsed * 1000),
+        throughput_per_second=len(items) / elapsed if elapsed > 0 else 0.0
+    )
+
+
+def _queue_full(error: QueueFullError) -> HTTPException:
+    """Build the 429 raised when the worker pool cannot take another solve."""
+    logger.warning(str(error))
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many optimization requests, please retry later",
+        headers={"Retry-After": str(error.retry_after_seconds)}
+    )
+
+
+def _job_response(job: OptimizationJob) -> JobResponse:
+    """Describe a job with its queue position and timings."""
+    wait_seconds, run_seconds = job_manager.timings(job)
+    return JobResponse(
+        job_id=job.job_id,
+        status=job.status,
+        submitted_at=job.submitted_at,
+        queue_position=job_manager.queue_position(job),
+        wait_ms=1000 * wait_seconds,
+        run_ms=1000 * run_seconds if run_seconds is not None else None,
+        result=job.result,
+        error=job.error
+    )
+
+
+def _job_not_found(job_id: str) -> HTTPException:
+    """Build the 404 raised for unknown or expired jobs."""
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Job not found: {job_id}"
+    )
+
+
+def _session_response(session: ScheduleSession) -> SessionScheduleResponse:
+    """Wrap the last response of a session with its ID and size."""
+    return SessionScheduleResponse(
+        **session.last_response.model_dump(),
+        session_id=session.session_id,
+        num_employees=len(session.employees),
+        num_shifts=len(session.shifts)
+    )
+
+
+def _session_not_found(session_id: str) -> HTTPException:
+    """Build the 404 raised for unknown or evicted sessions."""
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Session not found: {session_id}"
+    )
+
+
 def _validate_optimization_request(request: ShiftScheduleRequest) -> None:
     """
     Validate the optimization request for business logic constraints.
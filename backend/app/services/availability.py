@@ -0,0 +1,45 @@
+from typing import Iterable, List, Tuple
+
+
+class AvailabilityCalendar:
+    """
+    Minute-slot bitset of an employee's availability over the scheduling horizon.
+
+    Bit ``t`` is set when the employee is available during minute ``t`` after the
+    horizon origin. Any number of (possibly overlapping) windows collapse into one
+    Python int, so checking whether a shift fits is a single mask test.
+    """
+
+    __slots__ = ("horizon", "bits")
+
+    def __init__(self, windows: Iterable[Tuple[int, int]], horizon: int):
+        """
+        Args:
+            windows: (start, end) minute offsets from the horizon origin, end exclusive
+            horizon: Number of minute slots covered by the calendar
+        """
+        self.horizon = horizon
+        self.bits = 0
+        for start, end in windows:
+            start, end = max(start, 0), min(end, horizon)
+            if end > start:
+                self.bits |= ((1 << (end - start)) - 1) << start
+
+    def covers(self, start: int, end: int) -> bool:
+        """Check whether every minute slot in [start, end) is available."""
+        if start < 0 or end > self.horizon:
+            return False
+        mask = ((1 << (end - start)) - 1) << start
+        return self.bits & mask == mask
+
+    def runs(self) -> List[Tuple[int, int]]:
+        """Return the maximal runs of available minutes as sorted, disjoint (start, end) pairs."""
+        runs = []
+        bits = self.bits
+        while bits:
+            start = (bits & -bits).bit_length() - 1
+            shifted = bits >> start
+            length = (shifted ^ (shifted + 1)).bit_length() - 1
+            runs.append((start, start + length))
+            bits &= ~(((1 << length) - 1) << start)
+        return runs
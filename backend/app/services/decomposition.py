@@ -0,0 +1,157 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, Tuple
+import numpy as np
+
+from models.schemas import ConstraintType
+from services.eligibility import EligibilityMatrix
+from core.settings import settings
+
+# Worker pool shared by all requests, created on first use
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+# Cores a job worker process may use for component solves (None outside job workers)
+_job_cores: Optional[int] = None
+
+
+class Component:
+    """Employees and shifts of one connected component of the eligibility graph, as global indices."""
+
+    __slots__ = ("employees", "shifts", "num_pairs")
+
+    def __init__(self, employees: np.ndarray, shifts: np.ndarray, num_pairs: int):
+        self.employees = employees
+        self.shifts = shifts
+        self.num_pairs = num_pairs
+
+
+def connected_components(num_employees: int,
+                         num_shifts: int,
+                         rows: np.ndarray,
+                         cols: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Label the connected components of the bipartite employee-shift eligibility graph.
+
+    Runs a vectorized union-find over all edges at once: every round hooks the larger
+    root of each edge onto the smaller one and then compresses paths fully, until no
+    edge joins two different roots.
+
+    Args:
+        num_employees: Number of employee nodes
+        num_shifts: Number of shift nodes
+        rows: Employee index of every eligible pair
+        cols: Shift index of every eligible pair
+
+    Returns:
+        Tuple of (employee labels, shift labels) with components numbered from 0 in
+        order of their smallest node; nodes without eligible pairs are labelled -1
+    """
+    parent = np.arange(num_employees + num_shifts, dtype=np.int64)
+    u = rows.astype(np.int64)
+    v = cols.astype(np.int64) + num_employees
+
+    while True:
+        root_u, root_v = parent[u], parent[v]
+        joined = root_u != root_v
+        if not joined.any():
+            break
+        np.minimum.at(parent, np.maximum(root_u, root_v)[joined], np.minimum(root_u, root_v)[joined])
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+    has_edge = np.zeros(len(parent), dtype=bool)
+    has_edge[u] = True
+    has_edge[v] = True
+    _, labels = np.unique(parent[has_edge], return_inverse=True)
+    node_labels = np.full(len(parent), -1, dtype=np.int64)
+    node_labels[has_edge] = labels
+    return node_labels[:num_employees], node_labels[num_employees:]
+
+
+def find_components(eligibility: EligibilityMatrix) -> List[Component]:
+    """
+    Split the problem into independent components, largest first.
+
+    Every constraint row (shift capacity, hour caps, overlap cliques) only involves the
+    pairs of one employee or one shift, so components share no rows and can be solved
+    separately. Employees and shifts without eligible pairs are left out.
+    """
+    data = eligibility.data
+    employee_labels, shift_labels = connected_components(data.num_employees, data.num_shifts,
+                                                         eligibility.rows, eligibility.cols)
+    num_components = int(employee_labels.max()) + 1 if len(eligibility.rows) else 0
+    pair_counts = np.bincount(employee_labels[eligibility.rows], minlength=num_components)
+
+    employee_order = np.argsort(employee_labels, kind='stable')
+    shift_order = np.argsort(shift_labels, kind='stable')
+    employee_bounds = np.searchsorted(employee_labels[employee_order], np.arange(num_components + 1))
+    shift_bounds = np.searchsorted(shift_labels[shift_order], np.arange(num_components + 1))
+
+    components = [
+        Component(employee_order[employee_bounds[k]:employee_bounds[k + 1]],
+                  shift_order[shift_bounds[k]:shift_bounds[k + 1]],
+                  int(pair_counts[k]))
+        for k in range(num_components)
+    ]
+    components.sort(key=lambda component: component.num_pairs, reverse=True)
+    return components
+
+
+def component_problem(eligibility: EligibilityMatrix,
+                      component: Component,
+                      constraints: List[ConstraintType]) -> EligibilityMatrix:
+    """Restrict the compiled problem and its eligible pairs to one component."""
+    data = eligibility.data
+    sub_data = data.subset(component.employees, component.shifts)
+
+    employee_map = np.full(data.num_employees, -1, dtype=np.int64)
+    employee_map[component.employees] = np.arange(len(component.employees))
+    shift_map = np.full(data.num_shifts, -1, dtype=np.int64)
+    shift_map[component.shifts] = np.arange(len(component.shifts))
+
+    rows, cols = employee_map[eligibility.rows], shift_map[eligibility.cols]
+    inside = rows >= 0
+    rows, cols = rows[inside], cols[inside]
+    order = np.argsort(rows * sub_data.num_shifts + cols, kind='stable')
+    return EligibilityMatrix(sub_data, constraints, pairs=(rows[order], cols[order]))
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared worker pool for component solves (spawned, so no locks are inherited)."""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=settings.decomposition_workers or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def use_job_cores(cores: int) -> None:
+    """Mark this process as a job worker whose component solves may use the given number of cores."""
+    global _job_cores
+    _job_cores = max(1, cores)
+
+
+def map_components(function: Callable, tasks: Sequence[tuple], num_pairs: int) -> list:
+    """
+    Apply function to every task (a tuple of arguments) and return the results in order.
+
+    Problems below decomposition_min_pairs pairs are solved in-process. A job worker
+    (see use_job_cores) never starts the shared process pool: every process it started
+    would pay the interpreter start-up again and get its own copy of the job's resource
+    caps. It runs the tasks in-process when it has one core, and otherwise on as many
+    threads as it has cores, shut down once the tasks finish; the solvers spend their
+    time in native code or in CBC child processes. Elsewhere the shared process pool is
+    used.
+    """
+    if num_pairs < settings.decomposition_min_pairs or _job_cores == 1:
+        return [function(*task) for task in tasks]
+    if _job_cores is not None:
+        with ThreadPoolExecutor(max_workers=min(_job_cores, len(tasks))) as pool:
+            return list(pool.map(function, *zip(*tasks)))
+    return list(get_process_pool().map(function, *zip(*tasks)))
@@ -0,0 +1,186 @@
+from typing import Collection, Dict, List, Optional, Tuple
+from loguru import logger
+import numpy as np
+
+from models.schemas import ConstraintType
+from services.problem_data import ProblemData
+
+# Upper bound on the number of employee x shift cells evaluated per vectorized block
+BLOCK_CELLS = 4_000_000
+
+
+class EligibilityMatrix:
+    """
+    Vectorized employee-shift eligibility shared by the variable builder and constraint manager.
+
+    Skill checks test the interned skill bitmasks of the compiled ProblemData and
+    availability checks look shift minutes up in the runs of each employee's
+    AvailabilityCalendar. The eligible pairs are computed in a few array passes
+    and kept in sparse COO form.
+    """
+
+    def __init__(self,
+                 data: ProblemData,
+                 constraints: List[ConstraintType],
+                 pairs: Optional[Tuple[np.ndarray, np.ndarray]] = None):
+        """
+        Args:
+            data: Compiled problem columns
+            constraints: Active constraint types; only skill and availability filters apply here
+            pairs: Already known eligible (employee, shift) pairs sorted row-major, see updated()
+        """
+        self.data = data
+        self.check_skills = ConstraintType.SKILL_MATCHING in constraints
+        self.check_availability = ConstraintType.AVAILABILITY_WINDOWS in constraints
+
+        self._index_availability_runs()
+        self.rows, self.cols = pairs if pairs is not None else self._compute_pairs()
+        logger.info(f"Eligibility matrix: {len(self.rows)} of {data.num_employees * data.num_shifts} pairs eligible")
+
+    @classmethod
+    def updated(cls,
+                previous: "EligibilityMatrix",
+                data: ProblemData,
+                constraints: List[ConstraintType],
+                dirty_employees: Collection[str],
+                dirty_shifts: Collection[str]) -> "EligibilityMatrix":
+        """
+        Derive the eligibility of an edited problem from the previous one.
+
+        Pairs between unchanged employees and unchanged shifts are carried over by ID;
+        only the rows of added or updated employees and the columns of added or updated
+        shifts are evaluated again. Eligibility does not depend on the time origin, so
+        the carried pairs stay valid when the earliest shift moves.
+
+        Args:
+            previous: Eligibility of the problem before the edit
+            data: Compiled problem after the edit
+            constraints: Active constraint types after the edit
+            dirty_employees: IDs of added or updated employees
+            dirty_shifts: IDs of added or updated shifts
+        """
+        if (previous.check_skills != (ConstraintType.SKILL_MATCHING in constraints)
+                or previous.check_availability != (ConstraintType.AVAILABILITY_WINDOWS in constraints)):
+            return cls(data, constraints)
+
+        dirty_emp = np.zeros(data.num_employees, dtype=bool)
+        dirty_emp[[data.employee_index[emp_id] for emp_id in dirty_employees]] = True
+        dirty_shift = np.zeros(data.num_shifts, dtype=bool)
+        dirty_shift[[data.shift_index[shift_id] for shift_id in dirty_shifts]] = True
+
+        # Carry clean pairs over to the new indices
+        emp_map = np.array([data.employee_index.get(emp_id, -1) for emp_id in previous.data.employee_ids],
+                           dtype=np.int64)
+        shift_map = np.array([data.shift_index.get(shift_id, -1) for shift_id in previous.data.shift_ids],
+                             dtype=np.int64)
+        rows, cols = emp_map[previous.rows], shift_map[previous.cols]
+        keep = (rows >= 0) & (cols >= 0)
+        rows, cols = rows[keep], cols[keep]
+        keep = ~dirty_emp[rows] & ~dirty_shift[cols]
+
+        eligibility = cls(data, constraints, pairs=(rows[keep], cols[keep]))
+        all_shifts = np.arange(data.num_shifts)
+        dirty_rows = eligibility._pairs_between(np.flatnonzero(dirty_emp), all_shifts)
+        dirty_cols = eligibility._pairs_between(np.flatnonzero(~dirty_emp), np.flatnonzero(dirty_shift))
+
+        rows = np.concatenate((eligibility.rows, dirty_rows[0], dirty_cols[0]))
+        cols = np.concatenate((eligibility.cols, dirty_rows[1], dirty_cols[1]))
+        order = np.argsort(rows * data.num_shifts + cols, kind='stable')
+        eligibility.rows, eligibility.cols = rows[order], cols[order]
+        logger.info(f"Eligibility updated: {int(dirty_emp.sum())} employee rows and "
+                    f"{int(dirty_shift.sum())} shift columns re-evaluated")
+        return eligibility
+
+    def skill_mask(self, emp_idx: np.ndarray, shift_idx: np.ndarray) -> np.ndarray:
+        """Return whether each employee has the skill of the paired shift (broadcasting indices)."""
+        skill_ids = self.data.shift_skill_ids[shift_idx]
+        words = self.data.employee_skill_masks[emp_idx, skill_ids >> 6]
+        bits = np.left_shift(np.uint64(1), (skill_ids & 63).astype(np.uint64))
+        return (words & bits) != 0
+
+    def availability_mask(self, emp_idx: np.ndarray, shift_idx: np.ndarray) -> np.ndarray:
+        """Return whether each paired shift lies inside one of the employee's availability runs."""
+        emp_idx, shift_idx = np.broadcast_arrays(emp_idx, shift_idx)
+        if not len(self.run_keys):
+            return np.zeros(emp_idx.shape, dtype=bool)
+
+        # Locate the last run starting at or before the shift start, keyed per employee
+        keys = emp_idx * self.run_stride + self.data.shift_start[shift_idx]
+        pos = np.searchsorted(self.run_keys, keys, side='right') - 1
+        found = pos >= 0
+        pos = np.maximum(pos, 0)
+        return found & (self.run_employee[pos] == emp_idx) & (self.data.shift_end[shift_idx] <= self.run_end[pos])
+
+    def is_available(self, i: int, j: int) -> bool:
+        """Check a single employee/shift index pair against the employee's availability bitset."""
+        return self.data.calendars[i].covers(int(self.data.shift_start[j]), int(self.data.shift_end[j]))
+
+    def pair_mask(self, emp_idx: np.ndarray, shift_idx: np.ndarray) -> np.ndarray:
+        """Return the combined eligibility of the given pairs under the active filters."""
+        mask = np.ones(np.broadcast(emp_idx, shift_idx).shape, dtype=bool)
+        if self.check_skills:
+            mask &= self.skill_mask(emp_idx, shift_idx)
+        if self.check_availability:
+            mask &= self.availability_mask(emp_idx, shift_idx)
+        return mask
+
+    def pair_columns(self, emp_idx: np.ndarray, shift_idx: np.ndarray) -> np.ndarray:
+        """Return the COO position (model column) of each pair, or -1 for pairs that are not eligible."""
+        keys = self.rows * self.data.num_shifts + self.cols  # Sorted: pairs are collected row-major
+        query = np.asarray(emp_idx, dtype=np.int64) * self.data.num_shifts + np.asarray(shift_idx, dtype=np.int64)
+        position = np.minimum(np.searchsorted(keys, query), max(len(keys) - 1, 0))
+        found = (keys[position] == query) if len(keys) else np.zeros(len(query), dtype=bool)
+        return np.where(found, position, -1)
+
+    def dense(self) -> np.ndarray:
+        """Return the full boolean employee x shift eligibility matrix."""
+        matrix = np.zeros((self.data.num_employees, self.data.num_shifts), dtype=bool)
+        matrix[self.rows, self.cols] = True
+        return matrix
+
+    def coo(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the eligible pairs as (employee index, shift index) arrays, sorted by employee."""
+        return self.rows, self.cols
+
+    def as_dict(self) -> Dict[str, List[str]]:
+        """Return the eligible shift IDs of every employee, including employees with none."""
+        eligibility = {emp_id: [] for emp_id in self.data.employee_ids}
+        for i, j in zip(self.rows.tolist(), self.cols.tolist()):
+            eligibility[self.data.employee_ids[i]].append(self.data.shift_ids[j])
+        return eligibility
+
+    def _index_availability_runs(self) -> None:
+        """Flatten the calendar runs of all employees into sorted arrays for vectorized lookups."""
+        self.run_stride = self.data.horizon + 1
+        run_employee, run_start, run_end = [], [], []
+        for i, calendar in enumerate(self.data.calendars):
+            for start, end in calendar.runs():
+                run_employee.append(i)
+                run_start.append(start)
+                run_end.append(end)
+
+        self.run_employee = np.array(run_employee, dtype=np.int64)
+        self.run_end = np.array(run_end, dtype=np.int64)
+        self.run_keys = self.run_employee * self.run_stride + np.array(run_start, dtype=np.int64)
+
+    def _compute_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Evaluate the eligibility filters block by block and collect the eligible pairs."""
+        return self._pairs_between(np.arange(self.data.num_employees), np.arange(self.data.num_shifts))
+
+    def _pairs_between(self, employees: np.ndarray, shifts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Collect the eligible pairs of the given employee and shift indices, sorted row-major."""
+        if len(employees) == 0 or len(shifts) == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        block = max(1, BLOCK_CELLS // len(shifts))
+        shift_idx = shifts[None, :]
+        rows, cols = [], []
+
+        for first in range(0, len(employees), block):
+            emp_idx = employees[first:first + block, None]
+            block_rows, block_cols = np.nonzero(self.pair_mask(emp_idx, shift_idx))
+            rows.append(employees[block_rows + first])
+            cols.append(shifts[block_cols])
+
+        return np.concatenate(rows).astype(np.int64), np.concatenate(cols).astype(np.int64)
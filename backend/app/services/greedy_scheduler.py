@@ -0,0 +1,105 @@
+import heapq
+from typing import List, Tuple
+from loguru import logger
+import numpy as np
+
+from models.schemas import ConstraintType
+from services.problem_data import ProblemData
+
+
+class GreedyScheduler:
+    """
+    Fast greedy assignment honoring all constraint types, without building an ILP.
+
+    Mirrors the client-side offline scheduler: shifts are taken in start order and each
+    goes to the feasible employee with the fewest minutes worked so far (ties broken by
+    input order). Candidates come from per-skill min-heaps keyed by minutes worked, so a
+    shift usually costs O(log E); heap entries are invalidated lazily when an employee's
+    minutes change. Because shifts arrive in start order, an employee overlaps a new shift
+    exactly when the latest end among its assigned shifts is after the shift start.
+    """
+
+    def __init__(self, data: ProblemData, constraints: List[ConstraintType]):
+        self.data = data
+        self.check_skills = ConstraintType.SKILL_MATCHING in constraints
+        self.check_hours = ConstraintType.OVERTIME_LIMITS in constraints
+        self.check_availability = ConstraintType.AVAILABILITY_WINDOWS in constraints
+        self.check_overlap = ConstraintType.NO_OVERLAPPING in constraints
+
+    def run(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Assign shifts greedily.
+
+        Returns:
+            (employee index, shift index) arrays of the assignments, sorted by employee then shift
+        """
+        data = self.data
+        employee_skills = self._employee_skills()
+        worked = [0] * data.num_employees
+        busy_until = [-1] * data.num_employees
+        max_minutes = data.max_minutes.tolist()
+        starts, ends = data.shift_start.tolist(), data.shift_end.tolist()
+        durations, shift_skills = data.duration.tolist(), data.shift_skill_ids.tolist()
+
+        # One heap per skill (or a single shared heap) of (minutes worked, employee index)
+        heaps = {}
+        for i, skills in enumerate(employee_skills):
+            for skill in skills:
+                heaps.setdefault(skill, []).append((0, i))
+        for heap in heaps.values():
+            heapq.heapify(heap)
+
+        rows, cols = [], []
+        for j in np.argsort(data.shift_start, kind='stable').tolist():
+            heap = heaps.get(shift_skills[j] if self.check_skills else -1)
+            if not heap:
+                continue
+
+            chosen, rejected = None, []
+            while heap:
+                minutes, i = heapq.heappop(heap)
+                if minutes != worked[i]:
+                    continue  # Stale entry, the employee has been re-queued with new minutes
+                if self.check_hours and minutes >= max_minutes[i]:
+                    continue  # Nothing fits any more, drop the employee from this heap
+                if self._fits(i, j, minutes, durations[j], max_minutes[i], starts[j], ends[j], busy_until[i]):
+                    chosen = i
+                    break
+                rejected.append((minutes, i))
+
+            for entry in rejected:
+                heapq.heappush(heap, entry)
+            if chosen is None:
+                continue
+
+            rows.append(chosen)
+            cols.append(j)
+            worked[chosen] += durations[j]
+            busy_until[chosen] = max(busy_until[chosen], ends[j])
+            for skill in employee_skills[chosen]:
+                heapq.heappush(heaps[skill], (worked[chosen], chosen))
+
+        logger.info(f"Greedy engine assigned {len(rows)} of {data.num_shifts} shifts")
+        rows, cols = np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64)
+        order = np.lexsort((cols, rows))
+        return rows[order], cols[order]
+
+    def _fits(self, i: int, j: int, minutes: int, duration: int, max_minutes: int,
+              start: int, end: int, busy_until: int) -> bool:
+        """Check the hour cap, availability and overlap of one candidate."""
+        if self.check_hours and minutes + duration > max_minutes:
+            return False
+        if self.check_overlap and busy_until > start:
+            return False
+        if self.check_availability and not self.data.calendars[i].covers(start, end):
+            return False
+        return True
+
+    def _employee_skills(self) -> List[List[int]]:
+        """Skill ids of every employee from the interned bitmasks, or one shared key without skill matching."""
+        if not self.check_skills:
+            return [[-1] for _ in range(self.data.num_employees)]
+
+        masks = self.data.employee_skill_masks
+        bits = np.unpackbits(masks.view(np.uint8), axis=1, bitorder='little')
+        return [np.flatnonzero(row).tolist() for row in bits]
@@ -0,0 +1,135 @@
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Optional, Tuple
+from loguru import logger
+import numpy as np
+import pulp
+
+from services.matrix_model import MatrixModel
+from services.solvers.base import SolveOptions
+from services.solvers.registry import AUTO, select_solver
+from core.settings import settings
+
+# Statuses of the solver self-test
+HEALTHY, DEGRADED, UNHEALTHY, UNKNOWN = "healthy", "degraded", "unhealthy", "unknown"
+
+
+class SolverHealthMonitor:
+    """
+    Cached solver self-test for the health endpoints.
+
+    The self-test starts the solver binary, so it runs on a background thread every
+    interval instead of on every probe. Probes read the cached result; when no
+    background thread is running and the result is older than two intervals (or
+    missing), the next read refreshes it in the caller's thread.
+    """
+
+    def __init__(self,
+                 interval_seconds: float,
+                 check: Optional[Callable[[], str]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            interval_seconds: Time between background self-tests
+            check: Self-test returning HEALTHY, DEGRADED or UNHEALTHY (defaults to check_solver_availability)
+            clock: Source of the result ages
+        """
+        self.interval_seconds = interval_seconds
+        self._check = check or check_solver_availability
+        self._clock = clock
+        self._status = UNKNOWN
+        self._checked_time: Optional[float] = None
+        self._checked_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def current(self) -> Tuple[str, Optional[datetime]]:
+        """Return the cached (status, wall-clock time of the self-test), refreshing a stale result."""
+        stale = self._checked_time is None or self._clock() - self._checked_time > 2 * self.interval_seconds
+        if stale and not self.is_running():
+            self.refresh()
+        return self._status, self._checked_at
+
+    def refresh(self) -> str:
+        """Run the self-test now and cache its result."""
+        with self._lock:
+            try:
+                status = self._check()
+            except Exception as e:
+                logger.error(f"Solver self-test failed: {str(e)}")
+                status = UNHEALTHY
+            self._status, self._checked_time, self._checked_at = status, self._clock(), datetime.now()
+        if status != HEALTHY:
+            logger.warning(f"Solver self-test: {status}")
+        return status
+
+    def start(self) -> None:
+        """Start refreshing the result on a background thread, beginning with an immediate self-test."""
+        if self.is_running():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="solver-health", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def is_running(self) -> bool:
+        """Whether the background thread is refreshing the result."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        """Background loop: self-test, then wait for the interval or a stop."""
+        while not self._stop.is_set():
+            self.refresh()
+            self._stop.wait(self.interval_seconds)
+
+
+def check_solver_availability(backend: Optional[str] = None) -> str:
+    """
+    Check that the solver scheduling requests are routed to is available and working.
+
+    A two-column model (one employee, two shifts, room for one) is solved by the
+    solver that the registry selects for the configured backend, so under "auto" the
+    default MIP solver is tested rather than always CBC.
+
+    Args:
+        backend: Solver backend to test (defaults to settings.solver_backend)
+
+    Returns:
+        str: Status of the solver ("healthy", "degraded", or "unhealthy"); a configured
+        solver that is unavailable but replaced by a working fallback is "degraded"
+    """
+    backend = backend or settings.solver_backend
+    try:
+        # Create a simple test problem
+        test_model = MatrixModel(
+            np.zeros(2, dtype=np.int64), np.arange(2, dtype=np.int64),
+            [("overtime_limits", np.array([0, 2]), np.arange(2, dtype=np.int64), np.ones(2), np.ones(1))]
+        )
+        solver, reason = select_solver(backend, test_model.num_cols, [])
+
+        # Try to solve it
+        result = solver.solve(test_model, SolveOptions())
+
+        if result.status != pulp.LpStatusOptimal or round(result.objective_value) != 1:
+            logger.warning(f"Solver self-test of {solver.name} returned status {pulp.LpStatus[result.status]}")
+            return DEGRADED
+        if backend != AUTO and solver.name != backend:
+            logger.warning(f"Solver self-test: {reason}")
+            return DEGRADED
+        return HEALTHY
+
+    except Exception as e:
+        logger.error(f"Solver health check failed: {str(e)}")
+        return UNHEALTHY
+
+
+# Process-wide solver self-test used by the health router
+solver_health = SolverHealthMonitor(interval_seconds=settings.health_check_interval_seconds)
@@ -0,0 +1,119 @@
+from typing import Hashable, Iterable, List, Sequence, Tuple, TypeVar
+import numpy as np
+
+T = TypeVar("T", bound=Hashable)
+
+
+def find_maximal_cliques(intervals: Iterable[Tuple[T, object, object]]) -> List[List[T]]:
+    """
+    Enumerate the maximal cliques of an interval graph with a single sweep.
+
+    Intervals are half-open, so two intervals that merely touch do not overlap.
+    Endpoints are sorted once and the active set is emitted every time an interval
+    ends right after another one started, which yields exactly the maximal cliques
+    in O(n log n + output) time. Cliques of a single interval are skipped since
+    they never constrain anything.
+
+    Args:
+        intervals: Iterable of (key, start, end) tuples with comparable start/end
+
+    Returns:
+        List of maximal cliques, each a list of keys in order of their start
+    """
+    events = []
+    for key, start, end in intervals:
+        # Ends sort before starts at the same instant (0 < 1): touching is not overlapping
+        events.append((start, 1, key))
+        events.append((end, 0, key))
+    events.sort(key=lambda event: (event[0], event[1]))
+
+    cliques = []
+    active = {}
+    grew = False
+
+    for _, is_start, key in events:
+        if is_start:
+            active[key] = None
+            grew = True
+        else:
+            if grew and len(active) > 1:
+                cliques.append(list(active))
+            grew = False
+            del active[key]
+
+    return cliques
+
+
+def update_maximal_cliques(cliques: List[List[int]],
+                           previous_start: np.ndarray,
+                           previous_end: np.ndarray,
+                           index_map: np.ndarray,
+                           start: np.ndarray,
+                           end: np.ndarray,
+                           changed: Sequence[Tuple[int, int]]) -> Tuple[List[List[int]], List[List[int]], List[List[int]]]:
+    """
+    Update the maximal cliques of an interval graph after some intervals were edited.
+
+    A maximal clique is the set of intervals covering its common region, so it can only
+    change if that region meets an edited interval, old or new. Cliques whose region
+    misses every changed span are carried over; the others are dropped and the sweep
+    runs again over just the intervals meeting a changed span. A clique found there
+    is kept if its region meets a changed span and no other interval covers it.
+
+    Args:
+        cliques: Maximal cliques of the previous intervals
+        previous_start: Start of every previous interval
+        previous_end: End of every previous interval
+        index_map: New index of every previous interval, -1 for removed ones
+        start: Start of every interval after the edit
+        end: End of every interval after the edit
+        changed: (start, end) spans of the removed and updated intervals before the edit
+            and of the added and updated intervals after it
+
+    Returns:
+        (cliques after the edit, dropped previous cliques, added cliques); the
+        carried cliques come first, in their previous order, followed by the added ones
+    """
+    span_start, span_end = _merge_spans(changed)
+
+    def meets_changed(first: np.ndarray, last: np.ndarray) -> np.ndarray:
+        """Whether each [first, last) meets a changed span: the first span ending after first begins before last."""
+        if not len(span_end):
+            return np.zeros(len(first), dtype=bool)
+        k = np.searchsorted(span_end, first, side='right')
+        return (k < len(span_end)) & (span_start[np.minimum(k, len(span_end) - 1)] < last)
+
+    first, last = _regions(cliques, previous_start, previous_end)
+    touched = meets_changed(first, last).tolist()
+    carried = [index_map[clique].tolist() for clique, hit in zip(cliques, touched) if not hit]
+    dropped = [clique for clique, hit in zip(cliques, touched) if hit]
+
+    local = np.flatnonzero(meets_changed(start, end))
+    candidates = find_maximal_cliques(zip(local.tolist(), start[local].tolist(), end[local].tolist()))
+    first, last = _regions(candidates, start, end)
+    covering = np.searchsorted(np.sort(start), last, side='left') - np.searchsorted(np.sort(end), first, side='right')
+    keep = meets_changed(first, last) & (covering == np.array([len(clique) for clique in candidates], dtype=np.int64))
+    added = [clique for clique, kept in zip(candidates, keep.tolist()) if kept]
+    return carried + added, dropped, added
+
+
+def _merge_spans(spans: Sequence[Tuple[int, int]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Merge half-open spans into sorted, disjoint (starts, ends) arrays."""
+    merged = []
+    for first, last in sorted(spans):
+        if merged and first <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], last)
+        else:
+            merged.append([first, last])
+    bounds = np.array(merged, dtype=np.int64).reshape(-1, 2)
+    return bounds[:, 0], bounds[:, 1]
+
+
+def _regions(cliques: List[List[int]], start: np.ndarray, end: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the common region [latest start, earliest end) of every clique."""
+    if not cliques:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    members = np.fromiter((i for clique in cliques for i in clique), dtype=np.int64)
+    offsets = np.cumsum([0] + [len(clique) for clique in cliques[:-1]])
+    return np.maximum.reduceat(start[members], offsets), np.minimum.reduceat(end[members], offsets)
@@ -0,0 +1,129 @@
+import heapq
+from typing import List, Optional, Tuple
+import numpy as np
+
+from models.schemas import ConstraintType
+from services.problem_data import ProblemData
+
+
+def is_interval_problem(constraints: List[ConstraintType]) -> bool:
+    """Return whether only skill matching and no-overlap are active (no hour caps or availability)."""
+    return (ConstraintType.NO_OVERLAPPING in constraints
+            and ConstraintType.OVERTIME_LIMITS not in constraints
+            and ConstraintType.AVAILABILITY_WINDOWS not in constraints)
+
+
+def machine_pools(data: ProblemData, check_skills: bool) -> Optional[List[Tuple[np.ndarray, np.ndarray]]]:
+    """
+    Split employees and shifts into pools of identical machines.
+
+    Restricted to the skills some shift requires, employees with the same skill set can
+    take exactly the same shifts. When any two such skill sets are equal or disjoint, each
+    set defines an independent pool: its employees and the shifts needing one of its skills.
+
+    Returns:
+        List of (employee indices, shift indices) per pool, or None when skill sets overlap
+        partially and the problem does not split into identical machines
+    """
+    if not check_skills:
+        return [(np.arange(data.num_employees), np.arange(data.num_shifts))]
+
+    words = data.employee_skill_masks.shape[1]
+    required = np.zeros(words, dtype=np.uint64)
+    np.bitwise_or.at(required, data.shift_skill_ids >> 6,
+                     np.left_shift(np.uint64(1), (data.shift_skill_ids & 63).astype(np.uint64)))
+    masks = data.employee_skill_masks & required
+
+    pool_masks, pool_of_employee = np.unique(masks, axis=0, return_inverse=True)
+    pool_of_employee = pool_of_employee.reshape(-1)
+    bits = np.unpackbits(pool_masks.view(np.uint8), axis=1, bitorder='little')
+    if (bits.sum(axis=0) > 1).any():
+        return None
+
+    # Pool of every skill id; skills nobody has map to no pool
+    num_skills = bits.shape[1]
+    pool_of_skill = np.full(num_skills, -1, dtype=np.int64)
+    pool_idx, skill_idx = np.nonzero(bits)
+    pool_of_skill[skill_idx] = pool_idx
+    pool_of_shift = pool_of_skill[data.shift_skill_ids]
+
+    return [
+        (np.flatnonzero(pool_of_employee == k), np.flatnonzero(pool_of_shift == k))
+        for k in range(len(pool_masks)) if pool_masks[k].any()
+    ]
+
+
+def schedule_intervals(starts: List[int], ends: List[int], num_machines: int) -> List[Tuple[int, int]]:
+    """
+    Select a maximum number of intervals that fit on identical machines without overlapping.
+
+    Sweeps the intervals by start time (Faigle and Nawijn): an interval takes a free machine
+    if there is one; otherwise, when it ends before the running interval that ends last, it
+    replaces that interval on its machine. Touching intervals do not overlap. O(n log n).
+
+    Args:
+        starts: Interval start times
+        ends: Interval end times
+        num_machines: Number of identical machines
+
+    Returns:
+        (interval position, machine) of every selected interval
+    """
+    if num_machines <= 0:
+        return []
+
+    machine_of = [-1] * len(starts)
+    running_by_end: List[Tuple[int, int]] = []  # Min-heap of (end, interval)
+    running_by_last: List[Tuple[int, int]] = []  # Max-heap of (-end, -interval), lazily cleaned
+    running = set()
+    free = list(range(num_machines - 1, -1, -1))
+
+    for k in sorted(range(len(starts)), key=lambda position: (starts[position], ends[position])):
+        # Release the machines whose interval has ended
+        while running_by_end and running_by_end[0][0] <= starts[k]:
+            _, done = heapq.heappop(running_by_end)
+            if done in running:
+                running.discard(done)
+                free.append(machine_of[done])
+
+        if free:
+            machine_of[k] = free.pop()
+        else:
+            while (-running_by_last[0][1]) not in running:
+                heapq.heappop(running_by_last)
+            last_end, last = -running_by_last[0][0], -running_by_last[0][1]
+            if last_end <= ends[k]:
+                continue
+            heapq.heappop(running_by_last)
+            running.discard(last)
+            machine_of[k], machine_of[last] = machine_of[last], -1
+
+        running.add(k)
+        heapq.heappush(running_by_end, (ends[k], k))
+        heapq.heappush(running_by_last, (-ends[k], -k))
+
+    return [(k, machine) for k, machine in enumerate(machine_of) if machine >= 0]
+
+
+def solve_intervals(data: ProblemData, constraints: List[ConstraintType]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Solve a skill + no-overlap problem exactly as interval scheduling per machine pool.
+
+    Returns:
+        (employee index, shift index) arrays of the assignments sorted row-major, or None
+        when the employees do not split into pools of identical machines
+    """
+    pools = machine_pools(data, ConstraintType.SKILL_MATCHING in constraints)
+    if pools is None:
+        return None
+
+    rows, cols = [], []
+    for employees, shifts in pools:
+        selected = schedule_intervals(data.shift_start[shifts].tolist(), data.shift_end[shifts].tolist(),
+                                      len(employees))
+        rows.extend(int(employees[machine]) for _, machine in selected)
+        cols.extend(int(shifts[k]) for k, _ in selected)
+
+    rows, cols = np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64)
+    order = np.lexsort((cols, rows))
+    return rows[order], cols[order]
@@ -0,0 +1,509 @@
+import math
+import multiprocessing
+import os
+import signal
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Callable, Deque, Dict, List, Optional, Tuple, Type, TypeVar
+from loguru import logger
+from pydantic import BaseModel
+
+from models.api_models import JobStatus, ShiftScheduleRequest, ShiftScheduleResponse, SweepRequest, SweepResponse
+from services.decomposition import use_job_cores
+from services.result_cache import result_cache
+from services.shift_scheduler import ShiftScheduler
+from services.sweep import ScenarioSweep
+from core.settings import settings
+
+T = TypeVar("T")
+
+# Statuses after which a job no longer changes
+FINISHED_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+# Number of recent queue wait and run times kept for the statistics
+_WAIT_SAMPLES = 1000
+
+
+class JobNotFoundError(KeyError):
+    """Raised when a job ID is unknown or the finished job has been evicted."""
+
+
+class QueueFullError(RuntimeError):
+    """Raised when every worker is busy and the queue is at its maximum depth."""
+
+    def __init__(self, retry_after_seconds: int):
+        super().__init__(f"Job queue is full, retry after {retry_after_seconds}s")
+        self.retry_after_seconds = retry_after_seconds
+
+
+class OptimizationJob:
+    """
+    State of one queued optimization request.
+
+    Times are readings of the manager's clock in seconds; submitted_at is the wall-clock
+    submission time reported to clients. Events holds the (name, payload) progress events
+    the worker reported so far, in order. Worker and result_type select the process entry
+    point and the response model of jobs other than schedule solves; a job with a started
+    event instead runs in the submitting thread, which waits for the event.
+    """
+
+    __slots__ = (
+        "job_id", "request", "cache_key", "status", "submitted_at", "queued_time", "started_time",
+        "finished_time", "result", "error", "process", "on_finish", "events", "listeners",
+        "worker", "result_type", "started",
+    )
+
+    def __init__(self,
+                 job_id: str,
+                 request: Optional[BaseModel],
+                 cache_key: Optional[str],
+                 on_finish: Optional[Callable[["OptimizationJob"], None]],
+                 now: float,
+                 worker: Optional[Callable] = None,
+                 result_type: Type[BaseModel] = ShiftScheduleResponse,
+                 started: Optional[threading.Event] = None):
+        self.job_id = job_id
+        self.request: Optional[BaseModel] = request
+        self.cache_key = cache_key
+        self.on_finish = on_finish
+        self.worker = worker
+        self.result_type = result_type
+        self.started = started
+        self.status = JobStatus.QUEUED
+        self.submitted_at = datetime.now()
+        self.queued_time = now
+        self.started_time: Optional[float] = None
+        self.finished_time: Optional[float] = None
+        self.result: Optional[BaseModel] = None
+        self.error: Optional[str] = None
+        self.process: Optional[multiprocessing.Process] = None
+        self.events: List[Tuple[str, Dict]] = []
+        self.listeners: List[Callable[[], None]] = []
+
+
+class JobManager:
+    """
+    Queue of optimization jobs solved in worker processes.
+
+    Jobs wait in FIFO order until one of max_workers slots is free, then each runs
+    ShiftScheduler.schedule in its own process, started in a new process group so that
+    cancellation kills the solver binaries it launched as well. A watcher thread per
+    running job collects the result and starts the next queued job. Finished jobs are
+    kept for the retention time after they finish.
+
+    Workers stream progress events (phases, model size, incumbents) back over the same
+    pipe as the result; they are appended to the job and announced to its listeners.
+
+    Admission is bounded: when every worker is busy and max_queued jobs are waiting,
+    submit raises QueueFullError with an estimate of when a slot frees up, so that
+    overload turns into fast rejections instead of ever longer waits. Work that needs
+    state of the server process (sessions keep their compiled models there) goes
+    through run_local, which queues and is admitted the same way but runs in the
+    calling thread once it gets a slot.
+    """
+
+    def __init__(self,
+                 max_workers: int,
+                 retention_seconds: float,
+                 max_queued: Optional[int] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 worker: Optional[Callable] = None):
+        """
+        Args:
+            max_workers: Maximum number of jobs solved at once
+            retention_seconds: Time finished jobs are kept after they finish
+            max_queued: Maximum number of jobs waiting for a worker (None for no limit)
+            clock: Source of the queue and run times
+            worker: Entry point of the worker processes, called with the request JSON and the
+                sending end of a pipe (defaults to run_job)
+        """
+        self.max_workers = max_workers
+        self.retention_seconds = retention_seconds
+        self.max_queued = max_queued
+        self.worker = worker or run_job
+        self._clock = clock
+        self._jobs: "OrderedDict[str, OptimizationJob]" = OrderedDict()
+        self._queue: Deque[OptimizationJob] = deque()
+        self._running: Dict[str, OptimizationJob] = {}
+        self._lock = threading.Lock()
+        self._context = None
+        self._waits: Deque[float] = deque(maxlen=_WAIT_SAMPLES)
+        self._runs: Deque[float] = deque(maxlen=_WAIT_SAMPLES)
+        self.counters = {status: 0 for status in FINISHED_STATUSES}
+        self.rejected = 0
+
+    def submit(self,
+               request: BaseModel,
+               cache_key: Optional[str] = None,
+               on_finish: Optional[Callable[[OptimizationJob], None]] = None,
+               worker: Optional[Callable] = None,
+               result_type: Type[BaseModel] = ShiftScheduleResponse) -> OptimizationJob:
+        """
+        Queue a request and start it when a worker slot is free.
+
+        Args:
+            request: Validated scheduling request, or the request of the given worker
+            cache_key: Result cache key of the request; a cached response completes the job
+                at once and successful results are cached
+            on_finish: Called with the job once it reaches a final status (from a watcher
+                thread, or from this call for cached results)
+            worker: Process entry point for jobs other than schedule solves, e.g. run_sweep
+                (defaults to the manager's worker)
+            result_type: Response model the worker sends
+
+        Raises:
+            QueueFullError: If every worker is busy and the queue is full
+        """
+        with self._lock:
+            self._evict_finished()
+            cached = result_cache.get(cache_key) if cache_key is not None else None
+            if cached is None and self._is_full():
+                self.rejected += 1
+                raise QueueFullError(self._retry_after())
+
+            job = OptimizationJob(uuid.uuid4().hex, request, cache_key, on_finish, self._clock(), worker, result_type)
+            self._jobs[job.job_id] = job
+            if cached is not None:
+                job.started_time = job.queued_time
+                self._finish(job, JobStatus.COMPLETED, result=cached.model_copy(update={"cached": True}))
+            else:
+                self._queue.append(job)
+                self._dispatch()
+        logger.info(f"Submitted job {job.job_id}: {job.status.value}")
+        return job
+
+    def run_local(self, work: Callable[[], T]) -> T:
+        """
+        Run work in the calling thread once a worker slot is free.
+
+        The work queues in FIFO order with the submitted jobs, counts against max_workers
+        and is rejected the same way when the pool and its queue are full. It cannot be
+        cancelled once it runs; a shutdown while it waits cancels it.
+
+        Raises:
+            QueueFullError: If every worker is busy and the queue is full
+            RuntimeError: If the work was cancelled before it started
+        """
+        started = threading.Event()
+        with self._lock:
+            self._evict_finished()
+            if self._is_full():
+                self.rejected += 1
+                raise QueueFullError(self._retry_after())
+            job = OptimizationJob(uuid.uuid4().hex, None, None, None, self._clock(), started=started)
+            self._queue.append(job)
+            self._dispatch()
+
+        started.wait()
+        if job.status != JobStatus.RUNNING:
+            raise RuntimeError("Cancelled before it started")
+        try:
+            result = work()
+        except BaseException as e:
+            with self._lock:
+                self._finish(job, JobStatus.FAILED, error=str(e))
+                self._dispatch()
+            raise
+        with self._lock:
+            self._finish(job, JobStatus.COMPLETED)
+            self._dispatch()
+        return result
+
+    def get(self, job_id: str) -> OptimizationJob:
+        """Return a job that is queued, running or finished within the retention time."""
+        with self._lock:
+            self._evict_finished()
+            job = self._jobs.get(job_id)
+            if job is None:
+                raise JobNotFoundError(job_id)
+            return job
+
+    def cancel(self, job_id: str) -> OptimizationJob:
+        """
+        Cancel a queued or running job, killing its worker process; finished jobs are left as they are.
+
+        Raises:
+            JobNotFoundError: If the job does not exist
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                raise JobNotFoundError(job_id)
+            if job.status == JobStatus.QUEUED:
+                self._queue.remove(job)
+                self._finish(job, JobStatus.CANCELLED)
+            elif job.status == JobStatus.RUNNING and job.process is not None:
+                _kill(job.process)
+                self._finish(job, JobStatus.CANCELLED)
+                self._dispatch()
+        logger.info(f"Cancel of job {job_id}: {job.status.value}")
+        return job
+
+    def subscribe(self, job: OptimizationJob, listener: Callable[[], None]) -> None:
+        """
+        Call listener, from a watcher thread, whenever the job records a progress event or finishes.
+
+        The listener should only wake up its owner, which then reads job.events and job.status.
+        """
+        with self._lock:
+            job.listeners.append(listener)
+
+    def unsubscribe(self, job: OptimizationJob, listener: Callable[[], None]) -> None:
+        """Stop calling a listener registered with subscribe."""
+        with self._lock:
+            if listener in job.listeners:
+                job.listeners.remove(listener)
+
+    def queue_position(self, job: OptimizationJob) -> Optional[int]:
+        """Zero-based position of a queued job, or None when it is not queued."""
+        with self._lock:
+            return self._queue.index(job) if job.status == JobStatus.QUEUED else None
+
+    def timings(self, job: OptimizationJob) -> Tuple[float, Optional[float]]:
+        """Return (seconds queued, seconds solving or None before the start) of a job so far."""
+        end = job.finished_time if job.finished_time is not None else self._clock()
+        if job.started_time is None:
+            return end - job.queued_time, None  # Queued, or cancelled while queued
+        return job.started_time - job.queued_time, end - job.started_time
+
+    def stats(self) -> Dict:
+        """Return queue depth, running jobs, whether admission is closed, outcome counters and queue wait times."""
+        with self._lock:
+            self._evict_finished()
+            now = self._clock()
+            waits = list(self._waits)
+            return {
+                "queued": len(self._queue),
+                "running": len(self._running),
+                "workers": self.max_workers,
+                "max_queued": self.max_queued,
+                "completed": self.counters[JobStatus.COMPLETED],
+                "failed": self.counters[JobStatus.FAILED],
+                "cancelled": self.counters[JobStatus.CANCELLED],
+                "rejected": self.rejected,
+                "queue_full": self._is_full(),
+                "mean_wait_ms": 1000 * sum(waits) / len(waits) if waits else 0.0,
+                "max_wait_ms": 1000 * max(waits) if waits else 0.0,
+                "oldest_queued_wait_ms": 1000 * (now - self._queue[0].queued_time) if self._queue else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        """Cancel every queued and running job."""
+        with self._lock:
+            local = [job for job in self._queue if job.started is not None]
+            for job in local:
+                self._queue.remove(job)
+                self._finish(job, JobStatus.CANCELLED)
+            jobs = list(self._queue) + [job for job in self._running.values() if job.process is not None]
+        for job in jobs:
+            try:
+                self.cancel(job.job_id)
+            except JobNotFoundError:
+                pass
+
+    def _is_full(self) -> bool:
+        """Whether a new job could neither start nor queue (lock held)."""
+        return (self.max_queued is not None and len(self._running) >= self.max_workers
+                and len(self._queue) >= self.max_queued)
+
+    def _retry_after(self) -> int:
+        """Estimate the seconds until a queue slot frees up from recent run times (lock held)."""
+        mean_run = sum(self._runs) / len(self._runs) if self._runs else 1.0
+        return max(1, math.ceil(mean_run * (len(self._queue) + 1) / max(self.max_workers, 1)))
+
+    def _dispatch(self) -> None:
+        """Start queued jobs while worker slots are free (lock held)."""
+        while self._queue and len(self._running) < self.max_workers:
+            job = self._queue.popleft()
+            job.started_time = self._clock()
+            self._waits.append(job.started_time - job.queued_time)
+            if job.started is not None:
+                job.status = JobStatus.RUNNING
+                self._running[job.job_id] = job
+                job.started.set()  # The waiting thread in run_local does the work
+                continue
+
+            receiver, sender = self._get_context().Pipe(duplex=False)
+            job.process = self._get_context().Process(
+                target=job.worker or self.worker, args=(job.request.model_dump_json(), sender),
+                name=f"job-{job.job_id[:8]}"
+            )
+            job.process.start()
+            sender.close()
+            job.status = JobStatus.RUNNING
+            self._running[job.job_id] = job
+            threading.Thread(target=self._watch, args=(job, receiver), daemon=True).start()
+
+    def _watch(self, job: OptimizationJob, receiver) -> None:
+        """Record the progress events and the outcome of a running job, then start the next job."""
+        try:
+            while True:
+                outcome = receiver.recv()
+                if outcome[0] != "progress":
+                    break
+                with self._lock:
+                    job.events.append((outcome[1], outcome[2]))
+                    _notify(job)
+        except (EOFError, OSError):
+            outcome = None  # The process died or was killed before sending a result
+        finally:
+            receiver.close()
+        job.process.join()
+
+        with self._lock:
+            if job.status != JobStatus.RUNNING:
+                return  # Cancelled
+            if outcome is None:
+                self._finish(job, JobStatus.FAILED, error=_exit_reason(job.process.exitcode))
+            elif outcome[0] == "error":
+                self._finish(job, JobStatus.FAILED, error=outcome[1])
+            else:
+                result = job.result_type.model_validate_json(outcome[1])
+                if job.cache_key is not None and result.success:
+                    result_cache.put(job.cache_key, result)
+                self._finish(job, JobStatus.COMPLETED, result=result)
+            self._dispatch()
+        logger.info(f"Job {job.job_id} {job.status.value} after {job.finished_time - job.started_time:.2f}s")
+
+    def _finish(self,
+                job: OptimizationJob,
+                status: JobStatus,
+                result: Optional[BaseModel] = None,
+                error: Optional[str] = None) -> None:
+        """Move a job to a final status and release its request (lock held)."""
+        job.status, job.result, job.error = status, result, error
+        job.finished_time = self._clock()
+        job.request = None
+        if self._running.pop(job.job_id, None) is not None:
+            self._runs.append(job.finished_time - job.started_time)
+        self.counters[status] += 1
+        if job.on_finish is not None:
+            job.on_finish(job)
+        if job.started is not None:
+            job.started.set()  # Wake run_local if the job was cancelled while queued
+        _notify(job)
+
+    def _evict_finished(self) -> None:
+        """Drop jobs that finished longer than the retention time ago (lock held)."""
+        now = self._clock()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_time is not None and now - job.finished_time > self.retention_seconds
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def _get_context(self):
+        """Return the process start context, a fork server with the scheduler preloaded where available."""
+        if self._context is None:
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                self._context = multiprocessing.get_context("forkserver")
+                self._context.set_forkserver_preload(["services.job_manager"])
+            else:
+                self._context = multiprocessing.get_context("spawn")
+        return self._context
+
+
+def run_job(request_json: str, sender) -> None:
+    """
+    Worker process entry point: solve one request, sending ("progress", event, payload) messages
+    while it runs and finally ("ok", response JSON) or ("error", message).
+    """
+    _start_worker()
+    send_lock = threading.Lock()  # Solver callbacks may report from their own threads
+
+    def progress(event: str, payload: Dict) -> None:
+        with send_lock:
+            sender.send(("progress", event, payload))
+
+    _send_outcome(sender, lambda: ShiftScheduler(progress=progress).schedule(
+        ShiftScheduleRequest.model_validate_json(request_json)))
+
+
+def run_sweep(request_json: str, sender) -> None:
+    """Worker process entry point of a what-if sweep: sends ("ok", SweepResponse JSON) or ("error", message)."""
+    _start_worker()
+
+    def sweep() -> SweepResponse:
+        request = SweepRequest.model_validate_json(request_json)
+        return ScenarioSweep(request.base).run(request.scenarios)
+
+    _send_outcome(sender, sweep)
+
+
+def _start_worker() -> None:
+    """
+    Prepare a worker process: its own process group, so cancellation also reaches solver
+    binaries, resource caps and its share of the cores for component solves.
+    """
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+    _limit_resources()
+    use_job_cores(job_core_share())
+
+
+def job_core_share() -> int:
+    """Cores of one job when every job worker is busy."""
+    cores = os.cpu_count() or 1
+    return max(1, cores // (settings.job_workers or cores))
+
+
+def _send_outcome(sender, solve: Callable[[], BaseModel]) -> None:
+    """Run a worker's solve and send ("ok", response JSON) or ("error", message), then close the pipe."""
+    try:
+        sender.send(("ok", solve().model_dump_json()))
+    except MemoryError:
+        sender.send(("error", f"Solve exceeded the memory limit of {settings.solve_memory_limit_mb} MB"))
+    except Exception as e:
+        sender.send(("error", str(e)))
+    finally:
+        sender.close()
+
+
+def _limit_resources() -> None:
+    """Cap the address space and CPU time of a worker; solver binaries it starts inherit the caps."""
+    try:
+        import resource
+    except ImportError:
+        return  # Not available on Windows
+
+    if settings.solve_memory_limit_mb:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        limit = settings.solve_memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit if hard == resource.RLIM_INFINITY else min(limit, hard), hard))
+    if settings.solve_cpu_time_limit_seconds:
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        limit = settings.solve_cpu_time_limit_seconds
+        resource.setrlimit(resource.RLIMIT_CPU, (limit if hard == resource.RLIM_INFINITY else min(limit, hard), hard))
+
+
+def _exit_reason(exitcode: Optional[int]) -> str:
+    """Describe why a worker process ended without sending a result."""
+    if exitcode == -getattr(signal, "SIGXCPU", 0):
+        return f"Solve exceeded the CPU time limit of {settings.solve_cpu_time_limit_seconds}s"
+    return f"Worker process exited with code {exitcode}"
+
+
+def _notify(job: OptimizationJob) -> None:
+    """Call the listeners of a job (lock held)."""
+    for listener in job.listeners:
+        listener()
+
+
+def _kill(process: multiprocessing.Process) -> None:
+    """Kill a worker process together with its process group."""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (AttributeError, OSError):
+        process.kill()  # No process groups, or the worker has not created its group yet
+
+
+# Process-wide job queue used by the schedule router
+job_manager = JobManager(
+    max_workers=settings.job_workers or os.cpu_count() or 1,
+    retention_seconds=settings.job_retention_seconds,
+    max_queued=settings.job_queue_depth,
+)
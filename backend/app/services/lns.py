@@ -0,0 +1,185 @@
+import time
+from typing import Callable, List, Optional, Tuple
+from loguru import logger
+import numpy as np
+import pulp
+
+from services.matrix_model import MatrixModel
+from services.problem_data import ProblemData
+from services.rolling_horizon import MINUTES_PER_DAY
+from core.settings import settings
+
+# Neighborhood kinds, tried in rotation
+NEIGHBORHOODS = ("day", "skill", "employees")
+
+
+class LargeNeighborhoodSearch:
+    """
+    Large-neighborhood-search improver for the matrix model.
+
+    Starting from a feasible solution, every iteration frees the columns of one
+    neighborhood (the shifts of one day, the shifts of one skill, or a random set of
+    employees), keeps all other columns fixed and re-solves the freed part exactly as a
+    small pulp ILP whose rows are bounded by the capacity the fixed columns leave. The
+    current values are a feasible start of every sub-ILP, so the objective never drops.
+    Row activities are kept up to date incrementally, so an iteration only touches the
+    freed columns and their rows.
+    """
+
+    def __init__(self,
+                 model: MatrixModel,
+                 data: ProblemData,
+                 neighborhood_columns: Optional[int] = None,
+                 seed: int = 0):
+        """
+        Args:
+            model: Model to improve solutions of
+            data: Compiled problem the model was built from (for days and skills of shifts)
+            neighborhood_columns: Maximum number of columns freed per iteration
+                (defaults to settings.lns_neighborhood_columns)
+            seed: Seed of the neighborhood choices
+        """
+        self.model = model
+        self.neighborhood_columns = neighborhood_columns or settings.lns_neighborhood_columns
+        self.rng = np.random.default_rng(seed)
+
+        self.col_ptr, self.col_rows, self.col_values = model.to_csc()
+        self.col_day = data.shift_start[model.col_shift] // MINUTES_PER_DAY
+        self.col_skill = data.shift_skill_ids[model.col_shift]
+
+    def run(self,
+            initial: np.ndarray,
+            deadline: float,
+            upper_bound: float,
+            on_incumbent: Optional[Callable[[float, Optional[float]], None]] = None
+            ) -> Tuple[np.ndarray, List[Tuple[float, float]], bool]:
+        """
+        Improve a solution until the deadline or until it reaches the upper bound.
+
+        Args:
+            initial: Feasible 0/1 value of every column
+            deadline: time.perf_counter() value at which to stop
+            upper_bound: Objective value that cannot be exceeded
+            on_incumbent: Called with the objective value and the upper bound of the
+                initial solution and of every improvement
+
+        Returns:
+            Tuple of (best values, trace of (perf_counter time, objective) at the start and
+            after every improvement, whether the result is proven optimal)
+        """
+        model = self.model
+        values = initial.astype(np.float64).copy()
+        activity = np.bincount(model.row_ids(), weights=model.values * values[model.indices],
+                               minlength=model.num_rows)
+        objective = float(model.objective @ values)
+        trace = [(time.perf_counter(), objective)]
+        iterations = 0
+        if on_incumbent is not None:
+            on_incumbent(objective, upper_bound)
+
+        while objective < upper_bound and time.perf_counter() < deadline and model.num_cols:
+            kind = NEIGHBORHOODS[iterations % len(NEIGHBORHOODS)]
+            iterations += 1
+            free = self._neighborhood(kind)
+            if not len(free):
+                continue
+
+            new_values, proven = self._solve_neighborhood(free, values, activity, deadline)
+            if new_values is None:
+                continue
+
+            # Accept ties as well, which moves the search across plateaus
+            old_values = values[free]
+            entry_rows, entry_values, entry_cols = self._entries(free)
+            activity += np.bincount(entry_rows, weights=entry_values * (new_values - old_values)[entry_cols],
+                                    minlength=model.num_rows)
+            values[free] = new_values
+
+            new_objective = float(model.objective @ values)
+            if new_objective > objective:
+                objective = new_objective
+                trace.append((time.perf_counter(), objective))
+                logger.info(f"LNS iteration {iterations} ({kind}): objective {objective}")
+                if on_incumbent is not None:
+                    on_incumbent(objective, upper_bound)
+            if proven and len(free) == model.num_cols:
+                return values, trace, True  # The whole model was solved to optimality
+
+        logger.info(f"LNS stopped after {iterations} iterations with objective {objective}")
+        return values, trace, objective >= upper_bound
+
+    def _neighborhood(self, kind: str) -> np.ndarray:
+        """Pick the columns to free for one iteration, at most neighborhood_columns of them."""
+        if kind == "day":
+            day = self.rng.choice(np.unique(self.col_day))
+            free = np.flatnonzero(self.col_day == day)
+        elif kind == "skill":
+            skill = self.rng.choice(np.unique(self.col_skill))
+            free = np.flatnonzero(self.col_skill == skill)
+        else:
+            employees = np.unique(self.model.col_employee)
+            share = self.neighborhood_columns / max(self.model.num_cols, 1)
+            count = min(len(employees), max(1, int(round(share * len(employees)))))
+            chosen = self.rng.choice(employees, size=count, replace=False)
+            free = np.flatnonzero(np.isin(self.model.col_employee, chosen))
+
+        if len(free) > self.neighborhood_columns:
+            free = np.sort(self.rng.choice(free, size=self.neighborhood_columns, replace=False))
+        return free
+
+    def _entries(self, free: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the (row, value, position in free) of every stored coefficient of the free columns."""
+        counts = self.col_ptr[free + 1] - self.col_ptr[free]
+        entry = np.repeat(self.col_ptr[free] - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        return self.col_rows[entry], self.col_values[entry], np.repeat(np.arange(len(free)), counts)
+
+    def _solve_neighborhood(self,
+                            free: np.ndarray,
+                            values: np.ndarray,
+                            activity: np.ndarray,
+                            deadline: float) -> Tuple[Optional[np.ndarray], bool]:
+        """
+        Re-solve the free columns with every other column fixed.
+
+        Returns:
+            Tuple of (new values of the free columns or None when no solution came back,
+            whether the sub-ILP was solved to optimality)
+        """
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return None, False
+
+        entry_rows, entry_values, entry_cols = self._entries(free)
+        current = values[free]
+        residual = self.model.row_upper - activity + np.bincount(
+            entry_rows, weights=entry_values * current[entry_cols], minlength=self.model.num_rows
+        )
+
+        # Minimizing the negated objective keeps CBC from misreading the MIP start (see CbcSolver)
+        problem = pulp.LpProblem("LNS_Neighborhood", pulp.LpMinimize)
+        variables = [pulp.LpVariable(f"x{k}", cat='Binary') for k in range(len(free))]
+        for variable, value in zip(variables, current.tolist()):
+            variable.setInitialValue(value)
+        problem += pulp.lpSum(-coef * var for coef, var in zip(self.model.objective[free].tolist(), variables))
+
+        # Rows the free columns cannot exceed even all together are left out
+        order = np.argsort(entry_rows, kind='stable')
+        rows, row_values, row_cols = entry_rows[order], entry_values[order], entry_cols[order]
+        bounds = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1], True]) if len(rows) else np.zeros(0, dtype=np.int64)
+        for first, last in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+            row = rows[first]
+            if row_values[first:last].sum() <= residual[row]:
+                continue
+            problem += pulp.LpAffineExpression(
+                [(variables[k], v) for k, v in zip(row_cols[first:last].tolist(), row_values[first:last].tolist())]
+            ) <= residual[row]
+
+        status = problem.solve(pulp.PULP_CBC_CMD(msg=0, timeLimit=remaining, warmStart=True,
+                                                 threads=settings.solver_threads))
+        if status != pulp.LpStatusOptimal:
+            return None, False
+
+        new_values = np.array([round(var.varValue or 0.0) for var in variables], dtype=np.float64)
+        if self.model.objective[free] @ new_values < self.model.objective[free] @ current:
+            return None, False
+        return new_values, problem.sol_status == pulp.LpSolutionOptimal
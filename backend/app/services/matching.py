@@ -0,0 +1,119 @@
+from typing import List, Tuple
+import numpy as np
+
+from models.schemas import ConstraintType
+from services.eligibility import BLOCK_CELLS, EligibilityMatrix
+from services.problem_data import ProblemData
+
+# Constraint types that only filter pairs; without any others the model is a bipartite matching
+MATCHING_CONSTRAINTS = frozenset({ConstraintType.SKILL_MATCHING, ConstraintType.AVAILABILITY_WINDOWS})
+
+# Rotated candidates probed per shift before falling back to an exhaustive scan
+MATCHING_ROUNDS = 32
+
+
+def is_matching_problem(constraints: List[ConstraintType]) -> bool:
+    """Return whether no active constraint couples the shifts of an employee (hour caps or overlaps)."""
+    return set(constraints) <= MATCHING_CONSTRAINTS
+
+
+def solve_matching(eligibility: EligibilityMatrix, preferred_columns: np.ndarray) -> np.ndarray:
+    """
+    Solve the assignment model exactly when it is a bipartite matching.
+
+    Without hour caps or overlap rows an employee can take any number of shifts, so the
+    maximum matching of the eligibility graph (a max-flow with unbounded employee
+    capacities) covers every shift that has an eligible employee. Each such shift keeps
+    its preferred column if it has one and otherwise rotates over its eligible employees
+    by shift index, which spreads the load. Runs in O(P log P) for P eligible pairs.
+
+    Args:
+        eligibility: Eligible employee-shift pairs; their positions are the model columns
+        preferred_columns: Columns to keep when possible, e.g. current assignments (first per shift wins)
+
+    Returns:
+        0/1 value of every column
+    """
+    rows, cols = eligibility.coo()
+    values = np.zeros(len(cols))
+    if not len(cols):
+        return values
+
+    # Group the columns by shift and pick one per shift
+    order = np.argsort(cols, kind='stable')
+    sorted_cols = cols[order]
+    first = np.flatnonzero(np.r_[True, sorted_cols[1:] != sorted_cols[:-1]])
+    counts = np.diff(np.r_[first, len(cols)])
+    shifts = sorted_cols[first]
+
+    chosen = np.full(eligibility.data.num_shifts, -1, dtype=np.int64)
+    chosen[shifts] = order[first + shifts % counts]
+    if len(preferred_columns):
+        preferred_shifts, position = np.unique(cols[preferred_columns], return_index=True)
+        chosen[preferred_shifts] = preferred_columns[position]
+
+    values[chosen[chosen >= 0]] = 1.0
+    return values
+
+
+def match_shifts(data: ProblemData,
+                 constraints: List[ConstraintType],
+                 preferred_employees: np.ndarray,
+                 preferred_shifts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Solve a matching problem straight from the compiled columns, without listing every eligible pair.
+
+    Only one eligible employee per shift is needed. Preferred pairs are kept when eligible;
+    every other shift j then probes employees j, j + 1, ... (mod E) for a few rounds, which
+    spreads the load and covers most shifts after a handful of vectorized checks. Shifts
+    still open are scanned against all employees block by block, so every coverable shift
+    is covered and the result is optimal.
+
+    Args:
+        data: Compiled problem columns
+        constraints: Active constraint types, all of them in MATCHING_CONSTRAINTS
+        preferred_employees: Employee indices of pairs to keep when eligible (first per shift wins)
+        preferred_shifts: Shift indices of the same pairs
+
+    Returns:
+        (employee index, shift index) arrays of the assignments, sorted row-major
+    """
+    filters = EligibilityMatrix(data, constraints, pairs=(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)))
+    chosen = np.full(data.num_shifts, -1, dtype=np.int64)
+
+    if len(preferred_shifts):
+        eligible = filters.pair_mask(preferred_employees, preferred_shifts)
+        shifts, position = np.unique(preferred_shifts[eligible], return_index=True)
+        chosen[shifts] = preferred_employees[eligible][position]
+
+    remaining = np.flatnonzero(chosen < 0)
+    if ConstraintType.SKILL_MATCHING in constraints:
+        # Shifts needing a skill nobody has cannot be covered
+        known = np.bitwise_or.reduce(data.employee_skill_masks, axis=0)
+        skill_ids = data.shift_skill_ids[remaining]
+        bits = np.left_shift(np.uint64(1), (skill_ids & 63).astype(np.uint64))
+        remaining = remaining[(known[skill_ids >> 6] & bits) != 0]
+
+    for offset in range(min(MATCHING_ROUNDS, data.num_employees)):
+        if not len(remaining):
+            break
+        candidates = (remaining + offset) % data.num_employees
+        eligible = filters.pair_mask(candidates, remaining)
+        chosen[remaining[eligible]] = candidates[eligible]
+        remaining = remaining[~eligible]
+
+    if len(remaining) and data.num_employees > MATCHING_ROUNDS:
+        block = max(1, BLOCK_CELLS // len(remaining))
+        for first in range(0, data.num_employees, block):
+            if not len(remaining):
+                break
+            employees = np.arange(first, min(first + block, data.num_employees))
+            eligible = filters.pair_mask(employees[:, None], remaining[None, :])
+            covered = eligible.any(axis=0)
+            chosen[remaining[covered]] = employees[eligible.argmax(axis=0)[covered]]
+            remaining = remaining[~covered]
+
+    cols = np.flatnonzero(chosen >= 0)
+    rows = chosen[cols]
+    order = np.lexsort((cols, rows))
+    return rows[order], cols[order]
@@ -0,0 +1,439 @@
+from typing import List, Tuple
+from loguru import logger
+import numpy as np
+
+from models.schemas import ConstraintType
+from services.eligibility import EligibilityMatrix
+from services.problem_data import ProblemData
+
+class MatrixModel:
+    """
+    Assignment ILP in matrix form: maximize c'x subject to A x <= b, 0 <= x <= u, x integer.
+
+    Columns are the eligible (employee, shift) pairs of an EligibilityMatrix in COO order and
+    rows are stored as CSR arrays assembled straight from index arrays, so no per-variable
+    or per-constraint Python objects are created. Rows are grouped into named blocks
+    (``shift_capacity``, ``overtime_limits``, ``no_overlapping``).
+    """
+
+    __slots__ = (
+        "col_employee", "col_shift", "objective", "col_upper",
+        "indptr", "indices", "values", "row_upper", "blocks",
+    )
+
+    def __init__(self,
+                 col_employee: np.ndarray,
+                 col_shift: np.ndarray,
+                 blocks: List[Tuple[str, np.ndarray, np.ndarray, np.ndarray, np.ndarray]]):
+        """
+        Args:
+            col_employee: Employee index of every column
+            col_shift: Shift index of every column
+            blocks: (name, indptr, indices, values, row_upper) CSR pieces, one per row block
+        """
+        self.col_employee = col_employee
+        self.col_shift = col_shift
+        self.objective = np.ones(len(col_employee), dtype=np.float64)
+        self.col_upper = np.ones(len(col_employee), dtype=np.float64)
+
+        indptr, indices, values, row_upper = [np.zeros(1, dtype=np.int64)], [], [], []
+        self.blocks = {}
+        first_row, offset = 0, 0
+        for name, block_indptr, block_indices, block_values, block_upper in blocks:
+            indptr.append(block_indptr[1:] + offset)
+            indices.append(block_indices)
+            values.append(block_values)
+            row_upper.append(block_upper)
+            self.blocks[name] = (first_row, first_row + len(block_upper))
+            first_row += len(block_upper)
+            offset += len(block_indices)
+
+        self.indptr = np.concatenate(indptr)
+        self.indices = np.concatenate(indices) if indices else np.empty(0, dtype=np.int64)
+        self.values = np.concatenate(values) if values else np.empty(0, dtype=np.float64)
+        self.row_upper = np.concatenate(row_upper) if row_upper else np.empty(0, dtype=np.float64)
+
+    @classmethod
+    def build(cls,
+              data: ProblemData,
+              eligibility: EligibilityMatrix,
+              constraints: List[ConstraintType],
+              overlap_cliques: List[List[int]]) -> "MatrixModel":
+        """
+        Assemble the model for the given request data and active constraints.
+
+        Skill matching and availability windows are already reflected in the eligible
+        columns, so only coupling rows are generated here.
+        """
+        col_employee, col_shift = eligibility.coo()
+        num_cols = len(col_employee)
+        columns = np.arange(num_cols, dtype=np.int64)
+
+        # Each shift is assigned to at most one employee
+        blocks = [_capacity_block(col_shift, columns)]
+
+        if ConstraintType.OVERTIME_LIMITS in constraints:
+            blocks.append(_overtime_block(data, col_employee, col_shift, columns))
+
+        if ConstraintType.NO_OVERLAPPING in constraints:
+            blocks.append(_no_overlap_block(data, col_employee, col_shift, overlap_cliques))
+
+        model = cls(col_employee, col_shift, blocks)
+        logger.info(f"Built matrix model: {model.num_cols} columns, {model.num_rows} rows, "
+                    f"{model.num_nonzeros} nonzeros")
+        return model
+
+    @classmethod
+    def updated(cls,
+                previous: "MatrixModel",
+                column_map: np.ndarray,
+                data: ProblemData,
+                eligibility: EligibilityMatrix,
+                constraints: List[ConstraintType],
+                overlap_cliques: List[List[int]],
+                rebuild_employees: np.ndarray) -> "MatrixModel":
+        """
+        Derive the model of an edited problem from the previous one.
+
+        Shift capacity and overtime rows come from a few array passes and are rebuilt
+        from the new columns. No-overlap rows, whose deduplication runs row by row, are
+        carried over through column_map for every employee outside rebuild_employees
+        and assembled anew only for those employees. The previous model must have been
+        built for the same constraint types.
+
+        Args:
+            previous: Model before the edit
+            column_map: New column of every previous column, or -1 for columns that are gone
+            data: Compiled problem after the edit
+            eligibility: Eligible pairs after the edit
+            constraints: Active constraint types
+            overlap_cliques: Overlap cliques after the edit
+            rebuild_employees: Boolean mask of the employees whose no-overlap rows may have changed
+        """
+        if ConstraintType.NO_OVERLAPPING not in constraints:
+            return cls.build(data, eligibility, constraints, overlap_cliques)
+
+        col_employee, col_shift = eligibility.coo()
+        first, last = previous.blocks["no_overlapping"]
+        indptr = previous.indptr[first:last + 1] - previous.indptr[first]
+        indices = column_map[previous.indices[previous.indptr[first]:previous.indptr[last]]]
+        counts = np.diff(indptr)
+
+        # Rows whose columns all vanished belonged to removed employees; a carried row must keep every column
+        if len(counts):
+            lowest = np.minimum.reduceat(indices, indptr[:-1])
+            highest = np.maximum.reduceat(indices, indptr[:-1])
+        else:
+            lowest = highest = np.empty(0, dtype=np.int64)
+        live = highest >= 0
+        carried = np.zeros(len(counts), dtype=bool)
+        carried[live] = ~rebuild_employees[col_employee[highest[live]]]
+        if (lowest[carried] < 0).any():
+            logger.warning("Carried no-overlap rows lost columns, rebuilding the model")
+            return cls.build(data, eligibility, constraints, overlap_cliques)
+
+        # Fresh rows of the rebuilt employees, numbered as model columns
+        subset = np.flatnonzero(rebuild_employees[col_employee])
+        _, fresh_indptr, fresh_indices, _, _ = _no_overlap_block(data, col_employee[subset], col_shift[subset],
+                                                                 overlap_cliques)
+
+        row_counts = np.concatenate((counts[carried], np.diff(fresh_indptr)))
+        no_overlap_indptr = np.concatenate(([0], np.cumsum(row_counts))).astype(np.int64)
+        no_overlap_indices = np.concatenate((indices[np.repeat(carried, counts)], subset[fresh_indices]))
+
+        columns = np.arange(len(col_employee), dtype=np.int64)
+        blocks = [_capacity_block(col_shift, columns)]
+        if ConstraintType.OVERTIME_LIMITS in constraints:
+            blocks.append(_overtime_block(data, col_employee, col_shift, columns))
+        blocks.append(("no_overlapping", no_overlap_indptr, no_overlap_indices,
+                       np.ones(len(no_overlap_indices)), np.ones(len(row_counts))))
+
+        model = cls(col_employee, col_shift, blocks)
+        logger.info(f"Updated matrix model: {model.num_cols} columns, {model.num_rows} rows "
+                    f"({int(carried.sum())} no-overlap rows carried over)")
+        return model
+
+    @property
+    def num_cols(self) -> int:
+        """Number of decision variables."""
+        return len(self.col_employee)
+
+    @property
+    def num_rows(self) -> int:
+        """Number of constraint rows."""
+        return len(self.row_upper)
+
+    @property
+    def num_nonzeros(self) -> int:
+        """Number of nonzero coefficients in the constraint matrix."""
+        return len(self.indices)
+
+    def row_ids(self) -> np.ndarray:
+        """Return the row index of every stored coefficient."""
+        return np.repeat(np.arange(self.num_rows, dtype=np.int64), np.diff(self.indptr))
+
+    def to_csc(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the constraint matrix in column-wise (CSC) form as (indptr, row indices, values)."""
+        order = np.argsort(self.indices, kind='stable')
+        counts = np.bincount(self.indices, minlength=self.num_cols)
+        indptr = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        return indptr, self.row_ids()[order], self.values[order]
+
+    def pack(self, order: np.ndarray) -> np.ndarray:
+        """
+        Select columns greedily in the given order while every row stays within its bound.
+
+        Columns with an upper bound below one are never selected.
+
+        Args:
+            order: Column indices to try, first come first served
+
+        Returns:
+            0/1 value per column of a feasible solution
+        """
+        col_ptr, col_rows, col_values = self.to_csc()
+        col_ptr, col_rows, col_values = col_ptr.tolist(), col_rows.tolist(), col_values.tolist()
+        remaining = self.row_upper.tolist()
+        solution = np.zeros(self.num_cols)
+        for c in order[self.col_upper[order] >= 0.5].tolist():
+            if solution[c]:
+                continue
+            entries = range(col_ptr[c], col_ptr[c + 1])
+            if all(col_values[k] <= remaining[col_rows[k]] for k in entries):
+                for k in entries:
+                    remaining[col_rows[k]] -= col_values[k]
+                solution[c] = 1.0
+        return solution
+
+    def write_mps(self, path: str, negate_objective: bool = False) -> None:
+        """
+        Write the model to a fixed-format MPS file.
+
+        Columns are named ``C<index>`` and rows ``R<index>`` with base-36 indices so every
+        name fits the 8-character MPS field (see column_names/column_index). Each section
+        is assembled as fixed-width byte records and written in one call instead of
+        formatting one Python string per coefficient.
+
+        Args:
+            path: File to write
+            negate_objective: Write the negated objective, for solving the model as a minimization
+        """
+        col_ptr, col_rows, col_values = self.to_csc()
+        row_fields = row_names(self.num_rows)
+        col_fields = column_names(self.num_cols)
+
+        # One OBJ entry followed by the matrix entries of every column
+        counts = np.diff(col_ptr) + 1
+        starts = np.cumsum(counts) - counts
+        is_objective = np.zeros(int(counts.sum()), dtype=bool)
+        is_objective[starts] = True
+        entry_rows = np.empty(len(is_objective), dtype="S8")
+        entry_rows[is_objective] = b"OBJ     "
+        entry_rows[~is_objective] = row_fields[col_rows]
+        entry_values = np.empty(len(is_objective), dtype=np.float64)
+        entry_values[is_objective] = -self.objective if negate_objective else self.objective
+        entry_values[~is_objective] = col_values
+
+        with open(path, 'wb') as f:
+            f.write(b"NAME          SCHEDULE\nROWS\n N  OBJ\n")
+            f.write(_fixed_width_lines(_constant(b" L  ", self.num_rows), row_fields))
+
+            f.write(b"COLUMNS\n    MARKER                 'MARKER'                 'INTORG'\n")
+            f.write(_fixed_width_lines(
+                _constant(b"    ", len(entry_rows)), np.repeat(col_fields, counts),
+                _constant(b"  ", len(entry_rows)), entry_rows,
+                _constant(b"  ", len(entry_rows)), _formatted(entry_values)
+            ))
+            f.write(b"    MARKER                 'MARKER'                 'INTEND'\n")
+
+            f.write(b"RHS\n")
+            nonzero = np.flatnonzero(self.row_upper != 0)
+            f.write(_fixed_width_lines(
+                _constant(b"    RHS       ", len(nonzero)), row_fields[nonzero],
+                _constant(b"  ", len(nonzero)), _formatted(self.row_upper[nonzero])
+            ))
+
+            f.write(b"BOUNDS\n")
+            f.write(_fixed_width_lines(
+                _constant(b" UP BND       ", self.num_cols), col_fields,
+                _constant(b"  ", self.num_cols), _formatted(self.col_upper)
+            ))
+            f.write(b"ENDATA\n")
+
+
+BASE36_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def _base36(value: int) -> str:
+    """Encode a non-negative integer in base 36."""
+    encoded = ""
+    while True:
+        value, digit = divmod(value, 36)
+        encoded = BASE36_DIGITS[digit] + encoded
+        if not value:
+            return encoded
+
+
+def column_name(index: int) -> str:
+    """Return the MPS name of a model column."""
+    return "C" + _base36(index)
+
+
+def column_index(name: str) -> int:
+    """Return the model column index encoded in an MPS column name."""
+    return int(name[1:], 36)
+
+
+def column_names(count: int) -> np.ndarray:
+    """Return the MPS names of the first count columns as 8-byte, space-padded fields."""
+    return _names(b"C", np.arange(count, dtype=np.int64))
+
+
+def row_names(count: int) -> np.ndarray:
+    """Return the MPS names of the first count rows as 8-byte, space-padded fields."""
+    return _names(b"R", np.arange(count, dtype=np.int64))
+
+
+def _names(prefix: bytes, index: np.ndarray, width: int = 8) -> np.ndarray:
+    """Encode prefix + base-36 index for every index, one digit position at a time over the whole array."""
+    num_digits = np.ones(len(index), dtype=np.int64)
+    for power in range(1, width - len(prefix)):
+        num_digits += index >= 36 ** power
+
+    chars = np.full((len(index), width), ord(" "), dtype=np.uint8)
+    chars[:, :len(prefix)] = np.frombuffer(prefix, dtype=np.uint8)
+    alphabet = np.frombuffer(BASE36_DIGITS.encode(), dtype=np.uint8)
+    for power in range(width - len(prefix)):
+        has_digit = np.flatnonzero(num_digits > power)
+        if not len(has_digit):
+            break
+        # Digits are written most significant first, so the 36**power digit sits power places from the end
+        position = len(prefix) + num_digits[has_digit] - 1 - power
+        chars[has_digit, position] = alphabet[(index[has_digit] // 36 ** power) % 36]
+    return chars.view(f"S{width}").ravel()
+
+
+def _group_rows(keys: np.ndarray,
+                cols: np.ndarray,
+                coefs: np.ndarray,
+                min_size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Turn entries sorted by row key into CSR rows, keeping groups of at least min_size entries.
+
+    Returns:
+        (indptr, indices, values, row keys) of the kept rows
+    """
+    if len(keys) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return np.zeros(1, dtype=np.int64), empty, np.empty(0, dtype=np.float64), empty
+
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    counts = np.diff(np.concatenate((starts, [len(keys)])))
+    keep = counts >= min_size
+    entry_keep = np.repeat(keep, counts)
+
+    indptr = np.concatenate(([0], np.cumsum(counts[keep]))).astype(np.int64)
+    return indptr, cols[entry_keep], coefs[entry_keep].astype(np.float64), keys[starts[keep]]
+
+
+def _capacity_block(col_shift: np.ndarray, columns: np.ndarray):
+    """Build one <= 1 row per shift with at least two eligible employees: each shift is assigned at most once."""
+    order = np.argsort(col_shift, kind='stable')
+    indptr, indices, values, _ = _group_rows(col_shift[order], columns[order], np.ones(len(columns)), 2)
+    return ("shift_capacity", indptr, indices, values, np.ones(len(indptr) - 1))
+
+
+def clique_employees(data: ProblemData,
+                     col_employee: np.ndarray,
+                     col_shift: np.ndarray,
+                     cliques: List[List[int]]) -> np.ndarray:
+    """Return the employees with at least two columns in one of the cliques, i.e. with no-overlap rows on them."""
+    if not cliques:
+        return np.empty(0, dtype=np.int64)
+    members = np.zeros(data.num_shifts, dtype=bool)
+    members[np.fromiter((j for clique in cliques for j in clique), dtype=np.int64)] = True
+    subset = np.flatnonzero(members[col_shift])
+    _, indptr, indices, _, _ = _no_overlap_block(data, col_employee[subset], col_shift[subset], cliques)
+    return np.unique(col_employee[subset[indices[indptr[:-1]]]])
+
+
+def _overtime_block(data: ProblemData, col_employee: np.ndarray, col_shift: np.ndarray, columns: np.ndarray):
+    """Build one minutes <= cap row per employee whose eligible shifts could exceed the cap."""
+    # Columns are already sorted by employee
+    coefs = data.duration[col_shift]
+    indptr, indices, values, employees = _group_rows(col_employee, columns, coefs, 1)
+    upper = data.max_minutes[employees].astype(np.float64)
+
+    # Drop rows that can never bind because all eligible shifts together fit the cap
+    if len(employees):
+        totals = np.add.reduceat(values, indptr[:-1])
+        binding = totals > upper
+        counts = np.diff(indptr)
+        entry_keep = np.repeat(binding, counts)
+        indptr = np.concatenate(([0], np.cumsum(counts[binding]))).astype(np.int64)
+        indices, values, upper = indices[entry_keep], values[entry_keep], upper[binding]
+
+    return ("overtime_limits", indptr, indices, values, upper)
+
+
+def _no_overlap_block(data: ProblemData, col_employee: np.ndarray, col_shift: np.ndarray, cliques: List[List[int]]):
+    """Build one <= 1 row per employee and maximal clique with at least two eligible members."""
+    # Shift -> clique incidence in CSR form
+    clique_of = np.fromiter((k for k, clique in enumerate(cliques) for _ in clique), dtype=np.int64)
+    member = np.fromiter((j for clique in cliques for j in clique), dtype=np.int64, count=len(clique_of))
+    order = np.argsort(member, kind='stable')
+    shift_cliques = clique_of[order]
+    shift_ptr = np.concatenate(([0], np.cumsum(np.bincount(member, minlength=data.num_shifts)))).astype(np.int64)
+
+    # Expand every column into one entry per clique its shift belongs to
+    counts = np.diff(shift_ptr)[col_shift]
+    entry_col = np.repeat(np.arange(len(col_shift), dtype=np.int64), counts)
+    within = np.arange(counts.sum(), dtype=np.int64) - np.repeat(np.cumsum(counts) - counts, counts)
+    entry_clique = shift_cliques[np.repeat(shift_ptr[col_shift], counts) + within]
+
+    keys = col_employee[entry_col] * max(len(cliques), 1) + entry_clique
+    order = np.argsort(keys, kind='stable')
+    indptr, indices, _, _ = _group_rows(keys[order], entry_col[order], np.ones(len(keys)), 2)
+
+    # Distinct cliques can restrict to the same member set for one employee
+    seen = set()
+    keep = np.zeros(len(indptr) - 1, dtype=bool)
+    for r in range(len(indptr) - 1):
+        members = indices[indptr[r]:indptr[r + 1]].tobytes()
+        if members not in seen:
+            seen.add(members)
+            keep[r] = True
+
+    row_counts = np.diff(indptr)
+    indices = indices[np.repeat(keep, row_counts)]
+    indptr = np.concatenate(([0], np.cumsum(row_counts[keep]))).astype(np.int64)
+
+    return ("no_overlapping", indptr, indices, np.ones(len(indices)), np.ones(int(keep.sum())))
+
+
+def _padded(strings: List[str], width: int) -> np.ndarray:
+    """Return the strings as a fixed-width, space-padded byte array."""
+    return np.array([text.ljust(width) for text in strings], dtype=f"S{width}")
+
+
+def _constant(field: bytes, count: int) -> np.ndarray:
+    """Return a byte array repeating one fixed field."""
+    return np.full(count, field, dtype=f"S{len(field)}")
+
+
+def _formatted(values: np.ndarray) -> np.ndarray:
+    """Format numeric values as fixed-width byte fields, formatting each distinct value once."""
+    unique, inverse = np.unique(values, return_inverse=True)
+    texts = [f"{value:.12g}" for value in unique.tolist()]
+    width = max([12] + [len(text) for text in texts])
+    return _padded(texts, width)[inverse]
+
+
+def _fixed_width_lines(*fields: np.ndarray) -> bytes:
+    """Concatenate equal-length arrays of fixed-width byte fields into newline-terminated lines."""
+    dtype = [(f"f{k}", field.dtype) for k, field in enumerate(fields)] + [("newline", "S1")]
+    records = np.empty(len(fields[0]), dtype=dtype)
+    for k, field in enumerate(fields):
+        records[f"f{k}"] = field
+    records["newline"] = b"\n"
+    return records.tobytes()
@@ -0,0 +1,200 @@
+from datetime import datetime, timedelta
+from typing import Collection, Dict, List
+import numpy as np
+
+from models.schemas import Employee, Shift
+from services.availability import AvailabilityCalendar
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch_seconds(value: datetime) -> int:
+    """Convert a datetime to integer epoch seconds, treating naive values as UTC."""
+    if value.tzinfo is None:
+        return int((value - _EPOCH).total_seconds())
+    return int(value.timestamp())
+
+
+def from_epoch_seconds(seconds: int) -> datetime:
+    """Convert epoch seconds back to a naive UTC datetime."""
+    return _EPOCH + timedelta(seconds=seconds)
+
+
+class ProblemData:
+    """
+    Compiled, array-backed representation of a scheduling request.
+
+    Built once per request from the pydantic models, it holds employee and shift
+    columns indexed by position: integer-minute shift times relative to the earliest
+    shift start (rounded outwards to whole minutes), durations and hour caps in integer
+    minutes, interned skill ids with per-employee skill bitmasks, and availability
+    calendars. Every service works off these columns instead of re-reading the models.
+    """
+
+    __slots__ = (
+        "employee_ids", "employee_index", "max_minutes", "employee_skill_masks", "calendars",
+        "shift_ids", "shift_index", "shift_start", "shift_end", "duration", "shift_skill_ids",
+        "skill_ids", "origin", "horizon",
+    )
+
+    def __init__(self, employees: List[Employee], shifts: List[Shift]):
+        # Intern skills into dense integer ids
+        self.skill_ids: Dict[str, int] = {}
+        for emp in employees:
+            for skill in emp.skills:
+                self.skill_ids.setdefault(skill, len(self.skill_ids))
+        for shift in shifts:
+            self.skill_ids.setdefault(shift.required_skill, len(self.skill_ids))
+
+        # Shift columns
+        self.shift_ids: List[str] = [shift.id for shift in shifts]
+        self.shift_index: Dict[str, int] = {shift_id: j for j, shift_id in enumerate(self.shift_ids)}
+        start_seconds = np.array([to_epoch_seconds(shift.start_time) for shift in shifts], dtype=np.int64)
+        end_seconds = np.array([to_epoch_seconds(shift.end_time) for shift in shifts], dtype=np.int64)
+        self.origin = int(start_seconds.min()) // 60 * 60 if len(shifts) else 0
+        self.shift_start = (start_seconds - self.origin) // 60
+        self.shift_end = -((self.origin - end_seconds) // 60)
+        self.duration = -((start_seconds - end_seconds) // 60)
+        self.horizon = int(self.shift_end.max()) if len(shifts) else 0
+        self.shift_skill_ids = np.array([self.skill_ids[shift.required_skill] for shift in shifts], dtype=np.int64)
+
+        # Employee columns
+        self.employee_ids: List[str] = [emp.id for emp in employees]
+        self.employee_index: Dict[str, int] = {emp_id: i for i, emp_id in enumerate(self.employee_ids)}
+        self.max_minutes = np.array([emp.max_hours * 60 for emp in employees], dtype=np.int64)
+
+        self.employee_skill_masks = self._skill_masks(employees)
+        self.calendars: List[AvailabilityCalendar] = [self._calendar(emp) for emp in employees]
+
+    @classmethod
+    def updated(cls,
+                previous: "ProblemData",
+                employees: List[Employee],
+                shifts: List[Shift],
+                dirty_employees: Collection[str],
+                dirty_shifts: Collection[str]) -> "ProblemData":
+        """
+        Derive the compiled columns of an edited roster from the previous ones.
+
+        Only added or updated employees and shifts are read from their models; the
+        columns of the others are copied over by ID. The time origin and horizon are
+        kept, so copied shift times and calendars stay valid; they only have to
+        enclose every shift, not fit it tightly. When an edited shift starts before
+        the origin or ends after the horizon the roster is compiled anew.
+
+        Args:
+            previous: Compiled problem before the edit
+            employees: Employees after the edit
+            shifts: Shifts after the edit
+            dirty_employees: IDs of added or updated employees
+            dirty_shifts: IDs of added or updated shifts
+        """
+        edited_shifts = [shift for shift in shifts if shift.id in dirty_shifts]
+        start_seconds = np.array([to_epoch_seconds(shift.start_time) for shift in edited_shifts], dtype=np.int64)
+        end_seconds = np.array([to_epoch_seconds(shift.end_time) for shift in edited_shifts], dtype=np.int64)
+        if len(edited_shifts) and (start_seconds.min() < previous.origin
+                                   or -((previous.origin - end_seconds.max()) // 60) > previous.horizon):
+            return cls(employees, shifts)
+
+        data = cls.__new__(cls)
+        data.origin, data.horizon = previous.origin, previous.horizon
+        data.skill_ids = dict(previous.skill_ids)
+        for emp in employees:
+            if emp.id in dirty_employees:
+                for skill in emp.skills:
+                    data.skill_ids.setdefault(skill, len(data.skill_ids))
+        for shift in edited_shifts:
+            data.skill_ids.setdefault(shift.required_skill, len(data.skill_ids))
+
+        # Shift columns: copied by ID, edited shifts compiled
+        data.shift_ids = [shift.id for shift in shifts]
+        data.shift_index = {shift_id: j for j, shift_id in enumerate(data.shift_ids)}
+        source = np.array([-1 if shift_id in dirty_shifts else previous.shift_index[shift_id]
+                           for shift_id in data.shift_ids], dtype=np.int64)
+        data.shift_start = _merged(previous.shift_start, source, (start_seconds - data.origin) // 60)
+        data.shift_end = _merged(previous.shift_end, source, -((data.origin - end_seconds) // 60))
+        data.duration = _merged(previous.duration, source, -((start_seconds - end_seconds) // 60))
+        data.shift_skill_ids = _merged(previous.shift_skill_ids, source, np.array(
+            [data.skill_ids[shift.required_skill] for shift in edited_shifts], dtype=np.int64))
+
+        # Employee columns: copied by ID, edited employees compiled
+        data.employee_ids = [emp.id for emp in employees]
+        data.employee_index = {emp_id: i for i, emp_id in enumerate(data.employee_ids)}
+        source = np.array([-1 if emp_id in dirty_employees else previous.employee_index[emp_id]
+                           for emp_id in data.employee_ids], dtype=np.int64)
+        edited_employees = [emp for emp in employees if emp.id in dirty_employees]
+        data.max_minutes = _merged(previous.max_minutes, source,
+                                   np.array([emp.max_hours * 60 for emp in edited_employees], dtype=np.int64))
+
+        edited_masks = data._skill_masks(edited_employees)
+        data.employee_skill_masks = np.zeros((len(employees), edited_masks.shape[1]), dtype=np.uint64)
+        data.employee_skill_masks[source >= 0, :previous.employee_skill_masks.shape[1]] = \
+            previous.employee_skill_masks[source[source >= 0]]
+        data.employee_skill_masks[source < 0] = edited_masks
+
+        edited_calendars = iter([data._calendar(emp) for emp in edited_employees])
+        data.calendars = [previous.calendars[i] if i >= 0 else next(edited_calendars) for i in source.tolist()]
+        return data
+
+    def subset(self, employees: np.ndarray, shifts: np.ndarray) -> "ProblemData":
+        """
+        Return the problem restricted to the given employee and shift indices.
+
+        The time origin, horizon and skill ids are shared with this problem, so times
+        and skill masks keep their meaning and no model is re-read.
+        """
+        sub = ProblemData.__new__(ProblemData)
+        sub.skill_ids = self.skill_ids
+        sub.origin = self.origin
+        sub.horizon = self.horizon
+
+        sub.shift_ids = [self.shift_ids[j] for j in shifts.tolist()]
+        sub.shift_index = {shift_id: j for j, shift_id in enumerate(sub.shift_ids)}
+        sub.shift_start = self.shift_start[shifts]
+        sub.shift_end = self.shift_end[shifts]
+        sub.duration = self.duration[shifts]
+        sub.shift_skill_ids = self.shift_skill_ids[shifts]
+
+        sub.employee_ids = [self.employee_ids[i] for i in employees.tolist()]
+        sub.employee_index = {emp_id: i for i, emp_id in enumerate(sub.employee_ids)}
+        sub.max_minutes = self.max_minutes[employees]
+        sub.employee_skill_masks = self.employee_skill_masks[employees]
+        sub.calendars = [self.calendars[i] for i in employees.tolist()]
+        return sub
+
+    def _skill_masks(self, employees: List[Employee]) -> np.ndarray:
+        """Return the skill bitmask rows of the given employees over the interned skills."""
+        words = max(1, (len(self.skill_ids) + 63) // 64)
+        masks = np.zeros((len(employees), words), dtype=np.uint64)
+        for i, emp in enumerate(employees):
+            for skill in emp.skills:
+                skill_id = self.skill_ids[skill]
+                masks[i, skill_id >> 6] |= np.uint64(1) << np.uint64(skill_id & 63)
+        return masks
+
+    def _calendar(self, emp: Employee) -> AvailabilityCalendar:
+        """Compile an employee's availability; windows round inwards so a shift never fits a partial minute."""
+        return AvailabilityCalendar(
+            [(-((self.origin - to_epoch_seconds(window.start)) // 60),
+              (to_epoch_seconds(window.end) - self.origin) // 60)
+             for window in emp.availability],
+            self.horizon
+        )
+
+    @property
+    def num_employees(self) -> int:
+        """Number of employees in the problem."""
+        return len(self.employee_ids)
+
+    @property
+    def num_shifts(self) -> int:
+        """Number of shifts in the problem."""
+        return len(self.shift_ids)
+
+
+def _merged(previous: np.ndarray, source: np.ndarray, edited: np.ndarray) -> np.ndarray:
+    """Build a column from previous[source] where source >= 0 and the edited values, in order, elsewhere."""
+    column = np.empty(len(source), dtype=previous.dtype)
+    column[source >= 0] = previous[source[source >= 0]]
+    column[source < 0] = edited
+    return column
@@ -0,0 +1,198 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+from loguru import logger
+
+from models.api_models import ShiftScheduleRequest, ShiftScheduleResponse
+from services.problem_data import to_epoch_seconds
+from core.settings import settings
+
+
+def canonical_request_key(request: ShiftScheduleRequest, *scope: str) -> str:
+    """
+    Content hash of a scheduling request.
+
+    The request is normalized before hashing so that equivalent requests share a key:
+    employees, shifts, skills, availability windows, current assignments and constraints
+    are sorted, datetimes become epoch seconds (so equal instants in different time
+    zones match) and display-only fields (employee names, shift roles) are dropped. The
+    period is only hashed for rolling-horizon requests, whose windows start at the
+    period start. Any other request field is hashed as given.
+
+    Args:
+        request: The scheduling request
+        scope: Extra strings that change the result, such as the model and solver backends
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = request.model_dump(mode="json", exclude={"period", "employees", "shifts",
+                                                       "current_assignments", "constraints"})
+    payload["employees"] = sorted(
+        [emp.id, sorted(set(emp.skills)), emp.max_hours,
+         sorted([to_epoch_seconds(window.start), to_epoch_seconds(window.end)] for window in emp.availability)]
+        for emp in request.employees
+    )
+    payload["shifts"] = sorted(
+        [shift.id, shift.required_skill, to_epoch_seconds(shift.start_time), to_epoch_seconds(shift.end_time)]
+        for shift in request.shifts
+    )
+    payload["current_assignments"] = sorted(
+        [assignment.shift_id, assignment.employee_id] for assignment in request.current_assignments
+    )
+    payload["constraints"] = sorted({constraint.value for constraint in request.constraints})
+    payload["period"] = request.period if request.rolling_horizon is not None else None
+    payload["scope"] = list(scope)
+
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier cache of optimization responses keyed by canonical_request_key.
+
+    The first tier is an in-process LRU bounded by entry count and TTL. The optional
+    second tier is a SQLite file, which survives restarts and is shared by every
+    uvicorn worker pointing at the same path; entries found there are promoted into
+    the LRU. Only successful responses should be stored.
+    """
+
+    def __init__(self,
+                 max_entries: int,
+                 ttl_seconds: float,
+                 sqlite_path: Optional[str] = None,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            max_entries: Maximum number of responses held in memory (and on disk)
+            ttl_seconds: Seconds after which an entry is considered stale
+            sqlite_path: SQLite database file for the shared tier, or None for memory only
+            clock: Wall-clock source in seconds, shared with other workers through SQLite
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.sqlite_path = sqlite_path
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+        if sqlite_path:
+            with self._connect() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS results "
+                    "(key TEXT PRIMARY KEY, created REAL NOT NULL, response TEXT NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS results_created ON results (created)")
+
+    def get(self, key: str) -> Optional[ShiftScheduleResponse]:
+        """Return the cached response for a key, or None when it is missing or expired."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return ShiftScheduleResponse.model_validate_json(entry[1])
+
+        entry = self._disk_get(key, now)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._remember(key, entry)
+        return ShiftScheduleResponse.model_validate_json(entry[1])
+
+    def put(self, key: str, response: ShiftScheduleResponse) -> None:
+        """Store a response in every tier."""
+        entry = (self._clock(), response.model_dump_json())
+        with self._lock:
+            self._remember(key, entry)
+        self._disk_put(key, entry)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.disk_hits = 0
+        if self.sqlite_path:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM results")
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and occupancy."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "sqlite_enabled": bool(self.sqlite_path),
+            }
+
+    def _remember(self, key: str, entry: Tuple[float, str]) -> None:
+        """Insert into the LRU and evict the least recently used entries over capacity (lock held)."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a short-lived connection; SQLite handles locking between workers."""
+        return sqlite3.connect(self.sqlite_path, timeout=5.0)
+
+    def _disk_get(self, key: str, now: float) -> Optional[Tuple[float, str]]:
+        """Look a key up in the SQLite tier."""
+        if not self.sqlite_path:
+            return None
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT created, response FROM results WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Result cache read failed: {str(e)}")
+            return None
+        if row is None or now - row[0] > self.ttl_seconds:
+            return None
+        return row[0], row[1]
+
+    def _disk_put(self, key: str, entry: Tuple[float, str]) -> None:
+        """Write an entry to the SQLite tier, dropping stale and surplus rows."""
+        if not self.sqlite_path:
+            return
+        try:
+            with self._connect() as conn:
+                conn.execute("INSERT OR REPLACE INTO results (key, created, response) VALUES (?, ?, ?)",
+                             (key, entry[0], entry[1]))
+                conn.execute("DELETE FROM results WHERE created < ?", (entry[0] - self.ttl_seconds,))
+                conn.execute(
+                    "DELETE FROM results WHERE key NOT IN "
+                    "(SELECT key FROM results ORDER BY created DESC LIMIT ?)",
+                    (self.max_entries,)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Result cache write failed: {str(e)}")
+
+
+# Process-wide cache used by the schedule router
+result_cache = ResultCache(
+    max_entries=settings.result_cache_max_entries,
+    ttl_seconds=settings.result_cache_ttl_seconds,
+    sqlite_path=settings.result_cache_sqlite_path,
+)
@@ -0,0 +1,82 @@
+from typing import Iterator, List, Tuple
+import numpy as np
+
+from models.schemas import ConstraintType
+from services.eligibility import EligibilityMatrix
+from services.problem_data import ProblemData
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def plan_windows(first_minute: int,
+                 last_shift_start: int,
+                 window_minutes: int,
+                 overlap_minutes: int) -> Iterator[Tuple[int, int, int]]:
+    """
+    Yield the rolling-horizon windows covering every shift start.
+
+    Each window is solved over [start, end) and commits the shifts starting in
+    [start, commit_end); the rest of the window is look-ahead that the next window,
+    starting at commit_end, solves again. The last window commits everything.
+
+    Yields:
+        Tuples of (start, end, commit_end) in minutes from the problem origin
+    """
+    step = window_minutes - overlap_minutes
+    start = first_minute
+    while True:
+        end = start + window_minutes
+        if end > last_shift_start:
+            yield start, end, end
+            return
+        yield start, end, start + step
+        start += step
+
+
+def overlaps_commitments(emp_idx: np.ndarray,
+                         start: np.ndarray,
+                         end: np.ndarray,
+                         busy_emp: np.ndarray,
+                         busy_start: np.ndarray,
+                         busy_end: np.ndarray,
+                         stride: int) -> np.ndarray:
+    """
+    Return whether each (employee, [start, end)) overlaps an interval the employee is already committed to.
+
+    Committed intervals of one employee are disjoint when no-overlap is enforced, so the
+    interval with the latest start before ``end`` also has the latest end, and a single
+    searchsorted over (employee, start) keys decides every query.
+    """
+    if not len(busy_emp):
+        return np.zeros(len(emp_idx), dtype=bool)
+
+    keys = busy_emp * stride + busy_start
+    order = np.argsort(keys, kind='stable')
+    keys, busy_emp, busy_end = keys[order], busy_emp[order], busy_end[order]
+
+    pos = np.searchsorted(keys, emp_idx * stride + end, side='left') - 1
+    found = pos >= 0
+    pos = np.maximum(pos, 0)
+    return found & (busy_emp[pos] == emp_idx) & (busy_end[pos] > start)
+
+
+def assignment_upper_bound(data: ProblemData, eligibility: EligibilityMatrix, constraints: List[ConstraintType]) -> int:
+    """
+    Upper bound on the number of assignments of the full (monolithic) model.
+
+    No more shifts can be covered than have an eligible employee and, under overtime
+    limits, no employee can take more shifts than its shortest eligible shifts that
+    fit its cap. The smaller of the two counts is returned.
+    """
+    rows, cols = eligibility.coo()
+    coverable = int(np.unique(cols).size)
+    if ConstraintType.OVERTIME_LIMITS not in constraints or not len(rows):
+        return coverable
+
+    durations = data.duration[cols]
+    order = np.lexsort((durations, rows))
+    sorted_rows, cumulative = rows[order], np.cumsum(durations[order])
+    group_first = np.flatnonzero(np.r_[True, sorted_rows[1:] != sorted_rows[:-1]])
+    offsets = np.repeat(cumulative[group_first] - durations[order][group_first], np.diff(np.r_[group_first, len(rows)]))
+    fits = cumulative - offsets <= data.max_minutes[sorted_rows]
+    return min(coverable, int(fits.sum()))
@@ -0,0 +1,322 @@
+import threading
+import time
+import uuid
+from datetime import datetime
+from collections import OrderedDict
+from typing import Callable, Collection, Dict, List, Optional, Tuple
+from loguru import logger
+import numpy as np
+
+from models.schemas import Assignment, ConstraintType, Employee, Shift
+from models.api_models import SessionDelta, ShiftScheduleRequest, ShiftScheduleResponse
+from services.eligibility import EligibilityMatrix
+from services.interval_graph import find_maximal_cliques, update_maximal_cliques
+from services.matrix_model import MatrixModel, clique_employees
+from services.problem_data import ProblemData
+from services.shift_scheduler import ShiftScheduler
+from core.settings import settings
+
+# Rough per-entity overhead of the pydantic models and index dicts kept by a session
+_ENTITY_BYTES = 2048
+
+
+class SessionNotFoundError(KeyError):
+    """Raised when a session ID is unknown or the session has been evicted."""
+
+
+class ScheduleSession:
+    """
+    Server-side state of one optimization session.
+
+    Holds the roster keyed by ID, the compiled ProblemData, its eligibility, overlap
+    cliques and matrix model, and the last response, whose assignments warm start the
+    next solve.
+    """
+
+    __slots__ = (
+        "session_id", "period", "employees", "shifts", "constraints", "data", "eligibility",
+        "overlap_cliques", "model", "last_response", "last_used", "size_bytes", "lock",
+    )
+
+    def __init__(self, session_id: str, request: ShiftScheduleRequest):
+        self.session_id = session_id
+        self.period = request.period
+        self.employees: Dict[str, Employee] = {emp.id: emp for emp in request.employees}
+        self.shifts: Dict[str, Shift] = {shift.id: shift for shift in request.shifts}
+        self.constraints: List[ConstraintType] = list(dict.fromkeys(request.constraints))
+        self.data: Optional[ProblemData] = None
+        self.eligibility: Optional[EligibilityMatrix] = None
+        self.overlap_cliques: Optional[List[List[int]]] = None
+        self.model: Optional[MatrixModel] = None
+        self.last_response: Optional[ShiftScheduleResponse] = None
+        self.last_used = 0.0
+        self.size_bytes = 0
+        self.lock = threading.Lock()
+
+    @property
+    def assignments(self) -> List[Assignment]:
+        """Assignments of the last successful solve."""
+        return self.last_response.assignments if self.last_response is not None else []
+
+    def estimate_size(self) -> int:
+        """Approximate memory held by the session in bytes."""
+        size = _ENTITY_BYTES * (len(self.employees) + len(self.shifts))
+        if self.data is not None:
+            size += sum(getattr(self.data, name).nbytes for name in (
+                "max_minutes", "employee_skill_masks", "shift_start", "shift_end", "duration", "shift_skill_ids"
+            ))
+            size += sum(calendar.bits.bit_length() // 8 for calendar in self.data.calendars)
+        if self.eligibility is not None:
+            size += self.eligibility.rows.nbytes + self.eligibility.cols.nbytes + self.eligibility.run_keys.nbytes * 3
+        if self.overlap_cliques is not None:
+            size += 64 * sum(len(clique) for clique in self.overlap_cliques)
+        if self.model is not None:
+            size += sum(getattr(self.model, name).nbytes for name in (
+                "col_employee", "col_shift", "objective", "col_upper", "indptr", "indices", "values", "row_upper"
+            ))
+        return size
+
+
+class SessionManager:
+    """
+    Registry of optimization sessions with idle-time and memory-based eviction.
+
+    Sessions are kept in least-recently-used order. Sessions idle for longer than the
+    TTL are dropped on every access, then the least recently used ones are evicted
+    while the session count or the estimated memory exceeds its cap.
+    """
+
+    def __init__(self,
+                 idle_ttl_seconds: float,
+                 max_sessions: int,
+                 memory_cap_bytes: int,
+                 clock: Callable[[], float] = time.monotonic):
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.max_sessions = max_sessions
+        self.memory_cap_bytes = memory_cap_bytes
+        self._clock = clock
+        self._sessions: "OrderedDict[str, ScheduleSession]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evicted = 0
+
+    def create(self, request: ShiftScheduleRequest, scheduler: ShiftScheduler) -> ScheduleSession:
+        """Compile and solve an uploaded roster and register it as a new session."""
+        session = ScheduleSession(uuid.uuid4().hex, request)
+        if len(session.employees) != len(request.employees):
+            raise ValueError("Duplicate employee IDs found")
+        if len(session.shifts) != len(request.shifts):
+            raise ValueError("Duplicate shift IDs found")
+        with session.lock:
+            self._recompile(session, session.constraints, set(session.employees), set(session.shifts))
+            session.last_response = scheduler.schedule_compiled(
+                session.data, session.eligibility, session.constraints, request.current_assignments,
+                session.overlap_cliques, session.model
+            )
+            self._register(session)
+        logger.info(f"Created session {session.session_id}: {len(session.employees)} employees, "
+                    f"{len(session.shifts)} shifts")
+        return session
+
+    def get(self, session_id: str) -> ScheduleSession:
+        """Return a live session and mark it as used."""
+        with self._lock:
+            self._evict_idle()
+            session = self._sessions.get(session_id)
+            if session is None:
+                raise SessionNotFoundError(session_id)
+            session.last_used = self._clock()
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def apply_delta(self, session_id: str, delta: SessionDelta, scheduler: ShiftScheduler) -> ScheduleSession:
+        """
+        Apply roster edits to a session and re-solve, warm started from the last solution.
+
+        Raises:
+            SessionNotFoundError: If the session does not exist
+            ValueError: If the delta references missing IDs, re-adds existing ones or empties the roster
+        """
+        session = self.get(session_id)
+        with session.lock:
+            _check_period(session.period, delta.add_shifts + delta.update_shifts)
+            employees, shifts = dict(session.employees), dict(session.shifts)
+            dirty_employees = _apply_changes(employees, delta.add_employees, delta.update_employees,
+                                             delta.remove_employees, "employee")
+            dirty_shifts = _apply_changes(shifts, delta.add_shifts, delta.update_shifts,
+                                          delta.remove_shifts, "shift")
+            if not employees:
+                raise ValueError("No employees provided")
+            if not shifts:
+                raise ValueError("No shifts provided")
+
+            constraints = [c for c in session.constraints if c not in delta.remove_constraints]
+            constraints += [c for c in dict.fromkeys(delta.add_constraints) if c not in constraints]
+
+            session.employees, session.shifts = employees, shifts
+            self._recompile(session, constraints, dirty_employees, dirty_shifts)
+            session.last_response = scheduler.schedule_compiled(
+                session.data, session.eligibility, session.constraints, session.assignments,
+                session.overlap_cliques, session.model
+            )
+            self._register(session)
+        return session
+
+    def delete(self, session_id: str) -> None:
+        """Drop a session."""
+        with self._lock:
+            if self._sessions.pop(session_id, None) is None:
+                raise SessionNotFoundError(session_id)
+
+    def stats(self) -> Dict:
+        """Return the number of live sessions and their estimated memory use."""
+        with self._lock:
+            self._evict_idle()
+            return {
+                "sessions": len(self._sessions),
+                "memory_bytes": sum(session.size_bytes for session in self._sessions.values()),
+                "evicted": self.evicted,
+            }
+
+    def _recompile(self,
+                   session: ScheduleSession,
+                   constraints: List[ConstraintType],
+                   dirty_employees: Collection[str],
+                   dirty_shifts: Collection[str]) -> None:
+        """
+        Bring the compiled problem, eligibility, overlap cliques and model up to date with the roster.
+
+        Only edited employees and shifts are compiled and re-evaluated: ProblemData columns
+        and eligible pairs of the others are carried over by ID, overlap cliques are swept
+        again only around the old and new times of edited shifts, and the no-overlap rows
+        of employees the edit does not reach are carried into the new model. A change of
+        the time origin or of the constraint types recompiles the affected parts in full.
+
+        Args:
+            session: Session whose roster already holds the edit
+            constraints: Active constraint types after the edit
+            dirty_employees: IDs of added or updated employees
+            dirty_shifts: IDs of added or updated shifts
+        """
+        employees, shifts = list(session.employees.values()), list(session.shifts.values())
+        previous = session.data
+        if previous is None:
+            data = ProblemData(employees, shifts)
+            eligibility = EligibilityMatrix(data, constraints)
+        else:
+            data = ProblemData.updated(previous, employees, shifts, dirty_employees, dirty_shifts)
+            eligibility = EligibilityMatrix.updated(session.eligibility, data, constraints,
+                                                    dirty_employees, dirty_shifts)
+
+        if previous is None or data.origin != previous.origin:
+            cliques = find_maximal_cliques(
+                zip(range(data.num_shifts), data.shift_start.tolist(), data.shift_end.tolist())
+            )
+            model = MatrixModel.build(data, eligibility, constraints, cliques)
+        else:
+            cliques, model = self._patch_model(session, data, eligibility, constraints,
+                                               dirty_employees, dirty_shifts)
+
+        session.data, session.eligibility, session.overlap_cliques, session.model = data, eligibility, cliques, model
+        session.constraints = constraints
+        session.size_bytes = session.estimate_size()
+
+    def _patch_model(self,
+                     session: ScheduleSession,
+                     data: ProblemData,
+                     eligibility: EligibilityMatrix,
+                     constraints: List[ConstraintType],
+                     dirty_employees: Collection[str],
+                     dirty_shifts: Collection[str]) -> Tuple[List[List[int]], MatrixModel]:
+        """Update the overlap cliques and the model of a session whose time origin did not move."""
+        previous = session.data
+        shift_map = np.array([data.shift_index.get(shift_id, -1) for shift_id in previous.shift_ids], dtype=np.int64)
+        emp_map = np.array([data.employee_index.get(emp_id, -1) for emp_id in previous.employee_ids], dtype=np.int64)
+
+        # Old times of removed and updated shifts, new times of added and updated ones
+        changed = [(start, end) for start, end, shift_id, j in zip(
+            previous.shift_start.tolist(), previous.shift_end.tolist(), previous.shift_ids, shift_map.tolist())
+            if j < 0 or shift_id in dirty_shifts]
+        changed += [(int(data.shift_start[data.shift_index[shift_id]]), int(data.shift_end[data.shift_index[shift_id]]))
+                    for shift_id in dirty_shifts]
+        cliques, dropped, added = update_maximal_cliques(
+            session.overlap_cliques, previous.shift_start, previous.shift_end, shift_map,
+            data.shift_start, data.shift_end, changed
+        )
+        if set(constraints) != set(session.constraints):
+            return cliques, MatrixModel.build(data, eligibility, constraints, cliques)
+
+        # Previous columns on their new pairs; pairs of removed employees or shifts are gone
+        rows, cols = emp_map[session.model.col_employee], shift_map[session.model.col_shift]
+        present = (rows >= 0) & (cols >= 0)
+        column_map = np.full(len(rows), -1, dtype=np.int64)
+        column_map[present] = eligibility.pair_columns(rows[present], cols[present])
+
+        # No-overlap rows change for edited employees and for employees with rows on changed cliques
+        rebuild = np.zeros(data.num_employees, dtype=bool)
+        rebuild[[data.employee_index[emp_id] for emp_id in dirty_employees]] = True
+        previous_employees = emp_map[clique_employees(previous, session.model.col_employee,
+                                                      session.model.col_shift, dropped)]
+        rebuild[previous_employees[previous_employees >= 0]] = True
+        rebuild[clique_employees(data, *eligibility.coo(), added)] = True
+
+        model = MatrixModel.updated(session.model, column_map, data, eligibility, constraints, cliques, rebuild)
+        logger.info(f"Session {session.session_id}: {len(dropped)} overlap cliques replaced by {len(added)}, "
+                    f"no-overlap rows of {int(rebuild.sum())} employees rebuilt")
+        return cliques, model
+
+    def _register(self, session: ScheduleSession) -> None:
+        """Insert or refresh a session and enforce the caps."""
+        with self._lock:
+            session.last_used = self._clock()
+            self._sessions[session.session_id] = session
+            self._sessions.move_to_end(session.session_id)
+            self._evict_idle()
+            while len(self._sessions) > 1 and (
+                    len(self._sessions) > self.max_sessions
+                    or sum(s.size_bytes for s in self._sessions.values()) > self.memory_cap_bytes):
+                evicted_id, _ = self._sessions.popitem(last=False)
+                self.evicted += 1
+                logger.info(f"Evicted session {evicted_id} (capacity)")
+
+    def _evict_idle(self) -> None:
+        """Drop sessions idle for longer than the TTL (lock held)."""
+        now = self._clock()
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if now - session.last_used <= self.idle_ttl_seconds:
+                break
+            del self._sessions[session_id]
+            self.evicted += 1
+            logger.info(f"Evicted session {session_id} (idle)")
+
+
+def _check_period(period: str, shifts: List[Shift]) -> None:
+    """Reject edited shifts that fall outside the session period."""
+    start_date, end_date = (datetime.fromisoformat(part) for part in period.split('/'))
+    for shift in shifts:
+        if not (start_date <= shift.start_time.replace(tzinfo=None) and shift.end_time.replace(tzinfo=None) <= end_date):
+            raise ValueError(f"Shift {shift.id} is outside the specified period")
+
+
+def _apply_changes(entities: Dict, added: List, updated: List, removed: List[str], kind: str) -> set:
+    """Apply add/update/remove edits to an ID-keyed dict and return the IDs that need re-evaluation."""
+    for entity_id in removed:
+        if entities.pop(entity_id, None) is None:
+            raise ValueError(f"Unknown {kind} ID: {entity_id}")
+    for entity in added:
+        if entity.id in entities:
+            raise ValueError(f"Duplicate {kind} ID: {entity.id}")
+        entities[entity.id] = entity
+    for entity in updated:
+        if entity.id not in entities:
+            raise ValueError(f"Unknown {kind} ID: {entity.id}")
+        entities[entity.id] = entity
+    return {entity.id for entity in added} | {entity.id for entity in updated}
+
+
+# Process-wide session registry used by the schedule router
+session_manager = SessionManager(
+    idle_ttl_seconds=settings.session_idle_ttl_seconds,
+    max_sessions=settings.session_max_count,
+    memory_cap_bytes=settings.session_memory_cap_mb * 1024 * 1024,
+)
@@ -1,23 +1,71 @@
+import math
 import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Tuple, Set, Optional
+from typing import Callable, List, Dict, Tuple, Set, Optional
 from loguru import logger
+import numpy as np
 import pulp
 
 from models.schemas import (
-    Employee, Shift, Assignment, OptimizationMetrics, ConstraintType
+    Employee, Shift, Assignment, OptimizationMetrics, ConstraintType, ComponentMetrics, ObjectivePoint,
+    WindowMetrics
 )
 from models.api_models import (
-    ShiftScheduleRequest, ShiftScheduleResponse
+    RollingHorizon, ScheduleMode, ShiftScheduleRequest, ShiftScheduleResponse
 )
 from services.constraint_manager import ConstraintManager
+from services.decomposition import Component, component_problem, find_components, map_components
+from services.eligibility import EligibilityMatrix
+from services.greedy_scheduler import GreedyScheduler
+from services.interval_scheduling import is_interval_problem, solve_intervals
+from services.lns import LargeNeighborhoodSearch
+from services.matching import is_matching_problem, match_shifts, solve_matching
+from services.matrix_model import MatrixModel
+from services.problem_data import ProblemData, from_epoch_seconds, to_epoch_seconds
+from services.rolling_horizon import (
+    MINUTES_PER_DAY, assignment_upper_bound, overlaps_commitments, plan_windows
+)
+from services.solvers.base import MatrixSolver, SolveLimits, SolveOptions, SolveResult
+from services.solvers.registry import AUTO, get_solver, select_solver
+from core.settings import settings
+
+# Supported ways of building the optimization model
+MODEL_BACKENDS = ("matrix", "pulp")
 
 class ShiftScheduler:
     """Main scheduling service using Integer Linear Programming."""
     
-    def __init__(self):
-        """Initialize the shift scheduler."""
-        pass
+    def __init__(self,
+                 model_backend: Optional[str] = None,
+                 solver_backend: Optional[str] = None,
+                 decompose: bool = True,
+                 progress: Optional[Callable[[str, Dict], None]] = None):
+        """
+        Initialize the shift scheduler.
+        
+        Args:
+            model_backend: "matrix" to build the model directly from index arrays, or "pulp"
+                for the reference pulp expression path (defaults to settings.model_backend)
+            solver_backend: "auto" to pick a solver per instance, or the name of a solver in
+                services.solvers.registry (defaults to settings.solver_backend; an unavailable
+                solver falls back to the auto-selection policy)
+            decompose: Solve independent components of the eligibility graph separately
+                (also subject to settings.decomposition_enabled)
+            progress: Called with an event name ("phase", "model", "window" or "incumbent")
+                and its payload as the solve advances; payloads carry the elapsed_ms of
+                the request
+        """
+        self.model_backend = model_backend or settings.model_backend
+        if self.model_backend not in MODEL_BACKENDS:
+            raise ValueError(f"Unknown model backend: {self.model_backend}")
+        
+        self.solver_backend = solver_backend or settings.solver_backend
+        if self.solver_backend != AUTO:
+            get_solver(self.solver_backend)  # Reject unknown names up front
+        
+        self.decompose = decompose and settings.decomposition_enabled
+        self.progress = progress
+        self._started = time.perf_counter()
     
     def schedule(self, request: ShiftScheduleRequest) -> ShiftScheduleResponse:
         """
@@ -30,6 +78,8 @@ class ShiftScheduler:
             ShiftScheduleResponse with assignments and optimization details
         """
         start_time = datetime.now()
+        self._started = time.perf_counter()
+        limits = SolveLimits.from_request(request.time_limit_ms or settings.solver_time_limit_ms, request.mip_gap)
         
         # Extract data from request
         employees = request.employees
@@ -39,52 +89,499 @@ class ShiftScheduler:
         
         try:
             # Validate input data
+            self._report("phase", phase="validate")
             self._validate_input_data(employees, shifts)
             
-            # Initialize constraint manager with current data
-            constraint_manager = ConstraintManager(employees, shifts)
+            # Compile the request into array-backed columns shared by all later stages
+            self._report("phase", phase="build", employees=len(employees), shifts=len(shifts))
+            data = ProblemData(employees, shifts)
             
-            # Create the optimization problem
-            problem = self._create_problem()
+            if request.mode == ScheduleMode.FAST:
+                return self._solve_fast(data, constraints, start_time)
             
-            # Create decision variables
-            variables = self._create_variables(problem, employees, shifts)
+            # Matching problems only need one eligible employee per shift, not every eligible pair
+            if self.solver_backend == AUTO and is_matching_problem(constraints) and request.rolling_horizon is None:
+                return self._solve_matching_direct(data, constraints, current_assignments, start_time)
             
-            # Apply constraints
-            self._apply_constraints(problem, variables, constraints, constraint_manager, employees, shifts)
+            # Skill pools with no-overlap only are interval scheduling on identical machines
+            if self.solver_backend == AUTO and is_interval_problem(constraints) and request.rolling_horizon is None:
+                self._report("phase", phase="solve", solver="interval")
+                started = time.perf_counter()
+                solved = solve_intervals(data, constraints)
+                if solved is not None:
+                    return self._direct_response(data, constraints, *solved, start_time, pulp.LpSolutionOptimal,
+                                                 "interval", "skill pools with no-overlap only: interval scheduling",
+                                                 int((time.perf_counter() - started) * 1000))
             
-            # Set objective function
-            self._set_objective(problem, variables, employees, shifts)
+            # Precompute the eligible employee-shift pairs once for all later stages
+            eligibility = EligibilityMatrix(data, constraints)
             
-            # Configure solver
-            solver = self._configure_solver()
+            if request.mode == ScheduleMode.LNS:
+                return self._solve_lns(data, eligibility, constraints, current_assignments, start_time,
+                                       request.time_budget_ms or settings.lns_time_budget_ms)
             
-            # Solve the problem
-            logger.info("Starting optimization...")
-            status = problem.solve(solver)
+            # Optionally seed the MIP solves with the fast engine's assignments; the direct engines above need none
+            if settings.greedy_warm_start and not current_assignments:
+                current_assignments = self._greedy_assignments(data, constraints)
             
-            # Process results
-            result = self._process_results(problem, variables, status, start_time, employees, shifts, constraints)
+            if request.rolling_horizon is not None:
+                period_start = datetime.fromisoformat(request.period.split('/')[0])
+                return self._solve_rolling_horizon(data, eligibility, constraints, current_assignments,
+                                                   start_time, limits, request.rolling_horizon, period_start)
             
-            return result
+            return self._solve_compiled(data, eligibility, constraints, current_assignments, start_time, limits)
             
         except Exception as e:
-            logger.error(f"Error during scheduling: {str(e)}")
-            execution_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+            return self._error_response(e, [shift.id for shift in shifts], start_time)
+    
+    def schedule_compiled(self,
+                          data: ProblemData,
+                          eligibility: EligibilityMatrix,
+                          constraints: List[ConstraintType],
+                          current_assignments: List[Assignment],
+                          overlap_cliques: Optional[List[List[int]]] = None,
+                          model: Optional[MatrixModel] = None) -> ShiftScheduleResponse:
+        """
+        Schedule an already compiled problem, e.g. one kept and updated by an optimization session.
+        
+        Args:
+            data: Compiled problem columns
+            eligibility: Eligible employee-shift pairs of the compiled problem
+            constraints: Active constraint types
+            current_assignments: Assignments used as the warm start
+            overlap_cliques: Precomputed overlap cliques of the shifts, if known
+            model: Matrix model already built for these columns and constraints; it is
+                solved as a whole instead of being decomposed and rebuilt
+        
+        Returns:
+            ShiftScheduleResponse with assignments and optimization details
+        """
+        start_time = datetime.now()
+        self._started = time.perf_counter()
+        limits = SolveLimits.from_request(settings.solver_time_limit_ms, None)
+        try:
+            return self._solve_compiled(data, eligibility, constraints, current_assignments, start_time, limits,
+                                        overlap_cliques, model)
+        except Exception as e:
+            return self._error_response(e, list(data.shift_ids), start_time)
+    
+    def _solve_compiled(self,
+                        data: ProblemData,
+                        eligibility: EligibilityMatrix,
+                        constraints: List[ConstraintType],
+                        current_assignments: List[Assignment],
+                        start_time: datetime,
+                        limits: SolveLimits,
+                        overlap_cliques: Optional[List[List[int]]] = None,
+                        model: Optional[MatrixModel] = None) -> ShiftScheduleResponse:
+        """Build, solve and post-process the model of a compiled problem."""
+        solve_result, component_metrics = self._solve_eligible(
+            data, eligibility, constraints, current_assignments, limits, overlap_cliques, model
+        )
+        
+        # An unproven result gets the tighter of the solver bound and the combinatorial bound
+        if solve_result.status == pulp.LpStatusOptimal and not solve_result.proven_optimal:
+            bound = assignment_upper_bound(data, eligibility, constraints)
+            if solve_result.best_bound is not None:
+                bound = min(bound, math.floor(solve_result.best_bound + 1e-6))
+            solve_result.best_bound = float(bound)
+        
+        # Process results
+        return self._process_results(solve_result, start_time, data, eligibility, constraints, component_metrics)
+    
+    def _solve_eligible(self,
+                        data: ProblemData,
+                        eligibility: EligibilityMatrix,
+                        constraints: List[ConstraintType],
+                        current_assignments: List[Assignment],
+                        limits: SolveLimits,
+                        overlap_cliques: Optional[List[List[int]]] = None,
+                        model: Optional[MatrixModel] = None) -> Tuple[SolveResult, List[ComponentMetrics]]:
+        """Solve a compiled problem as one model or, when it splits and no model is given, one model per component."""
+        # Without hour caps or overlaps the model is a bipartite matching, solved exactly without a MIP
+        if self.solver_backend == AUTO and is_matching_problem(constraints):
+            return self._solve_matching(data, eligibility, current_assignments), []
+        
+        # Independent pieces of the eligibility graph are solved as separate models
+        components = find_components(eligibility) if self.decompose and model is None else []
+        if len(components) > 1:
+            return self._solve_components(components, eligibility, constraints, current_assignments, limits)
+        
+        return self._solve_problem(data, eligibility, constraints, current_assignments, limits, overlap_cliques,
+                                   model), []
+    
+    def _solve_problem(self,
+                       data: ProblemData,
+                       eligibility: EligibilityMatrix,
+                       constraints: List[ConstraintType],
+                       current_assignments: List[Assignment],
+                       limits: SolveLimits,
+                       overlap_cliques: Optional[List[List[int]]] = None,
+                       model: Optional[MatrixModel] = None) -> SolveResult:
+        """Build (unless given) and solve one model over all eligible pairs of a compiled problem."""
+        # Initialize constraint manager with current data
+        constraint_manager = ConstraintManager(data, eligibility, overlap_cliques)
+        
+        # Route the instance to a solver by size and constraint mix
+        solver, reason = select_solver(self.solver_backend, len(eligibility.rows), constraints)
+        logger.info(f"Selected solver {solver.name}: {reason}")
+        
+        # Current assignments that are still eligible seed the solver
+        warm_columns = self._warm_start_columns(current_assignments, data, eligibility)
+        
+        # Build and solve the model with the selected backend
+        if self.model_backend == "matrix":
+            solve_result = self._solve_matrix(data, eligibility, constraints, constraint_manager, solver,
+                                              warm_columns, limits, model)
+        else:
+            solve_result = self._solve_pulp(data, eligibility, constraints, constraint_manager, solver,
+                                            warm_columns, limits, model)
+        solve_result.solver_reason = reason
+        return solve_result
+    
+    def _solve_matching(self,
+                        data: ProblemData,
+                        eligibility: EligibilityMatrix,
+                        current_assignments: List[Assignment]) -> SolveResult:
+        """Cover every coverable shift, keeping eligible current assignments."""
+        self._report("phase", phase="solve", solver="matching")
+        started = time.perf_counter()
+        warm_columns = self._warm_start_columns(current_assignments, data, eligibility)
+        values = solve_matching(eligibility, warm_columns)
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+        
+        solve_result = SolveResult(pulp.LpStatusOptimal, values, float(values.sum()), pulp.LpSolutionOptimal,
+                                   solver="matching", time_to_first_incumbent_ms=elapsed_ms)
+        solve_result.solver_reason = "no hour caps or overlaps: bipartite matching"
+        solve_result.warm_start_assignments = int(values[np.unique(warm_columns)].sum())
+        return solve_result
+    
+    def _solve_matching_direct(self,
+                               data: ProblemData,
+                               constraints: List[ConstraintType],
+                               current_assignments: List[Assignment],
+                               start_time: datetime) -> ShiftScheduleResponse:
+        """Solve a matching problem without building the eligibility matrix."""
+        self._report("phase", phase="solve", solver="matching")
+        started = time.perf_counter()
+        preferred = np.array([
+            (data.employee_index[assignment.employee_id], data.shift_index[assignment.shift_id])
+            for assignment in current_assignments
+            if assignment.employee_id in data.employee_index and assignment.shift_id in data.shift_index
+        ], dtype=np.int64).reshape(-1, 2)
+        rows, cols = match_shifts(data, constraints, preferred[:, 0], preferred[:, 1])
+        
+        # Count the distinct current assignments that were kept
+        kept = np.unique(preferred, axis=0)
+        chosen = set(zip(rows.tolist(), cols.tolist()))
+        warm_start_assignments = sum((i, j) in chosen for i, j in kept.tolist())
+        return self._direct_response(data, constraints, rows, cols, start_time, pulp.LpSolutionOptimal,
+                                     "matching", "no hour caps or overlaps: bipartite matching",
+                                     int((time.perf_counter() - started) * 1000), warm_start_assignments)
+    
+    def _solve_components(self,
+                          components: List[Component],
+                          eligibility: EligibilityMatrix,
+                          constraints: List[ConstraintType],
+                          current_assignments: List[Assignment],
+                          limits: SolveLimits) -> Tuple[SolveResult, List[ComponentMetrics]]:
+        """
+        Solve every component as its own model and merge the column values.
+        
+        Large problems are solved in parallel (see map_components); small ones are solved
+        in-process, where worker start-up and pickling would cost more than they save.
+        """
+        subproblems = [component_problem(eligibility, component, constraints) for component in components]
+        self._report("phase", phase="solve", components=len(components))
+        tasks = [
+            (self.model_backend, self.solver_backend, sub, constraints,
+             [a for a in current_assignments if a.employee_id in sub.data.employee_index], limits)
+            for sub in subproblems
+        ]
+        logger.info(f"Solving {len(components)} components")
+        outcomes = map_components(_solve_component, tasks, len(eligibility.rows))
+        
+        # Scatter component solutions back to the global pair columns
+        values = np.zeros(len(eligibility.rows))
+        metrics = []
+        for component, sub, (result, elapsed_ms) in zip(components, subproblems, outcomes):
+            columns = eligibility.pair_columns(component.employees[sub.rows], component.shifts[sub.cols])
+            values[columns] = result.values
+            metrics.append(ComponentMetrics(
+                num_employees=len(component.employees),
+                num_shifts=len(component.shifts),
+                num_pairs=component.num_pairs,
+                solve_time_ms=elapsed_ms,
+                objective_value=result.objective_value,
+                solver=result.solver
+            ))
+        
+        results = [result for result, _ in outcomes]
+        failed = [result for result in results if result.status != pulp.LpStatusOptimal]
+        if failed:
+            status, sol_status = failed[0].status, failed[0].sol_status
+        elif all(result.proven_optimal for result in results):
+            status, sol_status = pulp.LpStatusOptimal, pulp.LpSolutionOptimal
+        else:
+            status, sol_status = pulp.LpStatusOptimal, pulp.LpSolutionIntegerFeasible
+        
+        # The bound of the whole problem is the sum of the component bounds, if all are known
+        bounds = [
+            result.best_bound if result.best_bound is not None
+            else result.objective_value if result.proven_optimal else None
+            for result in results
+        ]
+        
+        merged = SolveResult(
+            status, values, float(sum(result.objective_value for result in results)), sol_status,
+            solver=",".join(sorted({result.solver for result in results if result.solver})),
+            time_to_first_incumbent_ms=max(
+                (result.time_to_first_incumbent_ms for result in results
+                 if result.time_to_first_incumbent_ms is not None), default=None
+            ),
+            best_bound=float(sum(bounds)) if None not in bounds else None
+        )
+        merged.solver_reason = f"decomposed into {len(components)} components"
+        merged.warm_start_assignments = sum(result.warm_start_assignments for result in results)
+        return merged, metrics
+    
+    def _solve_rolling_horizon(self,
+                               data: ProblemData,
+                               eligibility: EligibilityMatrix,
+                               constraints: List[ConstraintType],
+                               current_assignments: List[Assignment],
+                               start_time: datetime,
+                               limits: SolveLimits,
+                               options: RollingHorizon,
+                               period_start: datetime) -> ShiftScheduleResponse:
+        """
+        Solve window by window, fixing each window's committed assignments before moving on.
+        
+        Windows start at the period start. Minutes already worked and, under the no-overlap
+        constraint, committed shift intervals carry over: later windows see reduced hour caps
+        and lose the pairs that would clash with a committed shift.
+        """
+        window_minutes = options.window_days * MINUTES_PER_DAY
+        first_minute = min(0, (to_epoch_seconds(period_start) - data.origin) // 60)
+        check_overlap = ConstraintType.NO_OVERLAPPING in constraints
+        rows, cols = eligibility.coo()
+        
+        values = np.zeros(len(rows))
+        committed = np.zeros(data.num_shifts, dtype=bool)
+        used_minutes = np.zeros(data.num_employees, dtype=np.int64)
+        results, window_metrics = [], []
+        
+        for window_start, window_end, commit_end in plan_windows(
+                first_minute, int(data.shift_start.max()), window_minutes, options.overlap_days * MINUTES_PER_DAY):
+            in_window = ~committed & (data.shift_start >= window_start) & (data.shift_start < window_end)
+            shifts = np.flatnonzero(in_window)
+            if not len(shifts):
+                continue
+            window_timer = time.perf_counter()
             
-            return ShiftScheduleResponse(
-                success=False,
-                assignments=[],
-                unassigned_shifts=[shift.id for shift in shifts],
-                metrics=OptimizationMetrics(
-                    total_overtime_minutes=0,
-                    constraint_violations=0,
-                    optimization_time_ms=execution_time_ms,
-                    objective_value=0.0
-                ),
-                constraints_applied=[],
-                message=f"Error: {str(e)}"
-            )
+            # Carry over hours already worked and drop pairs clashing with committed shifts
+            columns = np.flatnonzero(in_window[cols])
+            if check_overlap:
+                selected = np.flatnonzero(values > 0.5)
+                clash = overlaps_commitments(rows[columns], data.shift_start[cols[columns]], data.shift_end[cols[columns]],
+                                             rows[selected], data.shift_start[cols[selected]],
+                                             data.shift_end[cols[selected]], data.horizon + 1)
+                columns = columns[~clash]
+            
+            shift_map = np.full(data.num_shifts, -1, dtype=np.int64)
+            shift_map[shifts] = np.arange(len(shifts))
+            window_data = data.subset(np.arange(data.num_employees), shifts)
+            window_data.max_minutes = np.maximum(data.max_minutes - used_minutes, 0)
+            window_eligibility = EligibilityMatrix(window_data, constraints,
+                                                   pairs=(rows[columns], shift_map[cols[columns]]))
+            
+            # Offer each current assignment once, to the window that commits its shift
+            window_assignments = [
+                a for a in current_assignments
+                if a.shift_id in window_data.shift_index
+                and data.shift_start[data.shift_index[a.shift_id]] < commit_end
+            ]
+            self._report("window", start=from_epoch_seconds(data.origin + window_start * 60).isoformat(),
+                         end=from_epoch_seconds(data.origin + window_end * 60).isoformat(), shifts=len(shifts))
+            result, _ = self._solve_eligible(window_data, window_eligibility, constraints, window_assignments, limits)
+            results.append(result)
+            if result.status != pulp.LpStatusOptimal:
+                break
+            
+            # Commit the assignments of shifts starting before the commit boundary
+            commit = (result.values > 0.5) & (data.shift_start[cols[columns]] < commit_end)
+            chosen = columns[commit]
+            values[chosen] = 1.0
+            committed |= in_window & (data.shift_start < commit_end)
+            used_minutes += np.bincount(rows[chosen], weights=data.duration[cols[chosen]],
+                                        minlength=data.num_employees).astype(np.int64)
+            
+            window_metrics.append(WindowMetrics(
+                start=from_epoch_seconds(data.origin + window_start * 60),
+                end=from_epoch_seconds(data.origin + window_end * 60),
+                commit_end=from_epoch_seconds(data.origin + commit_end * 60),
+                num_shifts=len(shifts),
+                committed_assignments=len(chosen),
+                solve_time_ms=int((time.perf_counter() - window_timer) * 1000),
+                objective_value=result.objective_value
+            ))
+            logger.info(f"Window {len(window_metrics)}: {len(shifts)} shifts, {len(chosen)} assignments committed")
+        
+        # Windows are solved greedily in time, so optimality is only proven when the bound is met
+        bound = assignment_upper_bound(data, eligibility, constraints)
+        failed = [result for result in results if result.status != pulp.LpStatusOptimal]
+        if failed:
+            status, sol_status = failed[0].status, failed[0].sol_status
+        elif values.sum() >= bound:
+            status, sol_status = pulp.LpStatusOptimal, pulp.LpSolutionOptimal
+        else:
+            status, sol_status = pulp.LpStatusOptimal, pulp.LpSolutionIntegerFeasible
+        
+        solve_result = SolveResult(
+            status, values, float(values.sum()), sol_status,
+            solver=",".join(sorted({result.solver for result in results if result.solver}))
+        )
+        solve_result.solver_reason = f"rolling horizon over {len(window_metrics)} windows"
+        solve_result.warm_start_assignments = sum(result.warm_start_assignments for result in results)
+        
+        response = self._process_results(solve_result, start_time, data, eligibility, constraints)
+        if response.success:
+            response.metrics.windows = window_metrics
+            response.metrics.best_bound = float(bound)
+            response.metrics.gap = (bound - solve_result.objective_value) / bound if bound else 0.0
+        return response
+    
+    def _solve_fast(self,
+                    data: ProblemData,
+                    constraints: List[ConstraintType],
+                    start_time: datetime) -> ShiftScheduleResponse:
+        """Assign shifts with the greedy engine, skipping the eligibility matrix and the model."""
+        self._report("phase", phase="solve", solver="fast_greedy")
+        started = time.perf_counter()
+        rows, cols = GreedyScheduler(data, constraints).run()
+        return self._direct_response(data, constraints, rows, cols, start_time, pulp.LpSolutionIntegerFeasible,
+                                     "fast_greedy", "mode=fast", int((time.perf_counter() - started) * 1000))
+    
+    def _direct_response(self,
+                         data: ProblemData,
+                         constraints: List[ConstraintType],
+                         rows: np.ndarray,
+                         cols: np.ndarray,
+                         start_time: datetime,
+                         sol_status: int,
+                         solver: str,
+                         reason: str,
+                         elapsed_ms: int,
+                         warm_start_assignments: int = 0) -> ShiftScheduleResponse:
+        """Build the response of an engine that returns the chosen pairs directly instead of column values."""
+        # Only the chosen pairs become columns, all of them selected
+        chosen = EligibilityMatrix(data, constraints, pairs=(rows, cols))
+        solve_result = SolveResult(pulp.LpStatusOptimal, np.ones(len(rows)), float(len(rows)), sol_status,
+                                   solver=solver, time_to_first_incumbent_ms=elapsed_ms)
+        solve_result.solver_reason = reason
+        solve_result.warm_start_assignments = warm_start_assignments
+        return self._process_results(solve_result, start_time, data, chosen, constraints)
+    
+    def _greedy_assignments(self, data: ProblemData, constraints: List[ConstraintType]) -> List[Assignment]:
+        """Assignments of the greedy engine, used as a warm start for the ILP."""
+        rows, cols = GreedyScheduler(data, constraints).run()
+        return [
+            Assignment(shift_id=data.shift_ids[j], employee_id=data.employee_ids[i])
+            for i, j in zip(rows.tolist(), cols.tolist())
+        ]
+    
+    def _solve_lns(self,
+                   data: ProblemData,
+                   eligibility: EligibilityMatrix,
+                   constraints: List[ConstraintType],
+                   current_assignments: List[Assignment],
+                   start_time: datetime,
+                   time_budget_ms: int) -> ShiftScheduleResponse:
+        """
+        Start from the greedy schedule and improve it by large neighborhood search until the budget runs out.
+        
+        Eligible current assignments are packed first and the greedy schedule fills in
+        around them. The budget counts from the start of the request.
+        """
+        started = time.perf_counter() - (datetime.now() - start_time).total_seconds()
+        constraint_manager = ConstraintManager(data, eligibility)
+        model = self._build_matrix_model(data, eligibility, constraints, constraint_manager)
+        
+        greedy_rows, greedy_cols = GreedyScheduler(data, constraints).run()
+        greedy_columns = eligibility.pair_columns(greedy_rows, greedy_cols)
+        warm_columns = self._warm_start_columns(current_assignments, data, eligibility)
+        initial = model.pack(np.concatenate([warm_columns, greedy_columns[greedy_columns >= 0]]))
+        
+        bound = assignment_upper_bound(data, eligibility, constraints)
+        self._report_model(model)
+        self._report("phase", phase="solve", solver="lns")
+        values, trace, proven = LargeNeighborhoodSearch(model, data).run(
+            initial, started + time_budget_ms / 1000, bound, self._incumbent_reporter()
+        )
+        
+        solve_result = SolveResult(pulp.LpStatusOptimal, values, float(values.sum()),
+                                   pulp.LpSolutionOptimal if proven else pulp.LpSolutionIntegerFeasible,
+                                   solver="lns", time_to_first_incumbent_ms=int((trace[0][0] - started) * 1000))
+        solve_result.solver_reason = f"mode=lns, {time_budget_ms} ms budget"
+        solve_result.warm_start_assignments = int(initial[np.unique(warm_columns)].sum())
+        
+        response = self._process_results(solve_result, start_time, data, eligibility, constraints)
+        if response.success:
+            response.metrics.objective_trace = [
+                ObjectivePoint(elapsed_ms=max(0, int((moment - started) * 1000)), objective_value=objective)
+                for moment, objective in trace
+            ]
+            response.metrics.best_bound = float(bound)
+            response.metrics.gap = (bound - solve_result.objective_value) / bound if bound else 0.0
+        return response
+    
+    def _report(self, event: str, **payload) -> None:
+        """Send a progress event to the progress callback, if there is one."""
+        if self.progress is not None:
+            payload["elapsed_ms"] = int((time.perf_counter() - self._started) * 1000)
+            self.progress(event, payload)
+    
+    def _report_model(self, model: MatrixModel) -> None:
+        """Report the size of a built model."""
+        self._report("model", rows=model.num_rows, columns=model.num_cols, nonzeros=len(model.indices))
+    
+    def _incumbent_reporter(self) -> Optional[Callable[[float, Optional[float]], None]]:
+        """
+        Return the solver incumbent callback that reports improving incumbents with their gap,
+        or None without a progress callback (so solvers skip the reporting entirely).
+        """
+        if self.progress is None:
+            return None
+        best = [-1.0]
+        
+        def report(objective_value: float, bound: Optional[float]) -> None:
+            if objective_value <= best[0]:
+                return
+            best[0] = objective_value
+            gap = max(bound - objective_value, 0.0) / bound if bound else None
+            self._report("incumbent", objective_value=float(objective_value),
+                         best_bound=float(bound) if bound is not None else None, gap=gap)
+        
+        return report
+    
+    def _error_response(self, error: Exception, shift_ids: List[str], start_time: datetime) -> ShiftScheduleResponse:
+        """Build the failure response returned when scheduling raises."""
+        logger.error(f"Error during scheduling: {str(error)}")
+        execution_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+        
+        return ShiftScheduleResponse(
+            success=False,
+            assignments=[],
+            unassigned_shifts=shift_ids,
+            metrics=OptimizationMetrics(
+                total_overtime_minutes=0,
+                constraint_violations=0,
+                optimization_time_ms=execution_time_ms,
+                objective_value=0.0
+            ),
+            constraints_applied=[],
+            message=f"Error: {str(error)}"
+        )
     
     def _validate_input_data(self, employees: List[Employee], shifts: List[Shift]) -> None:
         """Validate input data for scheduling."""
@@ -103,24 +600,152 @@ class ShiftScheduler:
         if len(shift_ids) != len(set(shift_ids)):
             raise ValueError("Duplicate shift IDs found")
     
+    def _warm_start_columns(self,
+                            current_assignments: List[Assignment],
+                            data: ProblemData,
+                            eligibility: EligibilityMatrix) -> np.ndarray:
+        """Map current assignments onto model columns, dropping unknown IDs and ineligible pairs."""
+        pairs = [
+            (data.employee_index[assignment.employee_id], data.shift_index[assignment.shift_id])
+            for assignment in current_assignments
+            if assignment.employee_id in data.employee_index and assignment.shift_id in data.shift_index
+        ]
+        if not pairs:
+            return np.empty(0, dtype=np.int64)
+        
+        emp_idx, shift_idx = np.array(pairs, dtype=np.int64).T
+        columns = eligibility.pair_columns(emp_idx, shift_idx)
+        return columns[columns >= 0]
+    
+    def _warm_start(self, model: MatrixModel, warm_columns: np.ndarray) -> Optional[np.ndarray]:
+        """Keep the part of the warm start that fits the model rows (first come first served)."""
+        if len(warm_columns) == 0:
+            return None
+        
+        start = model.pack(warm_columns)
+        logger.info(f"Warm start: {int(start.sum())} of {len(warm_columns)} eligible current assignments kept")
+        return start
+    
+    def _solve_matrix(self,
+                      data: ProblemData,
+                      eligibility: EligibilityMatrix,
+                      constraints: List[ConstraintType],
+                      constraint_manager: ConstraintManager,
+                      solver: MatrixSolver,
+                      warm_columns: np.ndarray,
+                      limits: SolveLimits,
+                      model: Optional[MatrixModel] = None) -> SolveResult:
+        """Build the model straight from index arrays (unless given) and solve it without pulp expressions."""
+        if model is None:
+            model = self._build_matrix_model(data, eligibility, constraints, constraint_manager)
+        warm_start = self._warm_start(model, warm_columns)
+        kept = int(warm_start.sum()) if warm_start is not None else 0
+        
+        # Under a time limit the MIP start is completed greedily, so a stopped search still has an incumbent
+        if limits.deadline is not None and solver.capabilities.exact and solver.capabilities.warm_start:
+            warm_start = get_solver("greedy").solve(model, SolveOptions(warm_start=warm_start)).values
+        options = limits.options(settings.solver_threads, warm_start, self._incumbent_reporter())
+        
+        logger.info("Starting optimization...")
+        self._report_model(model)
+        self._report("phase", phase="solve", solver=solver.name)
+        solve_result = solver.solve(model, options)
+        solve_result.warm_start_assignments = kept
+        return solve_result
+    
+    def _build_matrix_model(self,
+                            data: ProblemData,
+                            eligibility: EligibilityMatrix,
+                            constraints: List[ConstraintType],
+                            constraint_manager: ConstraintManager) -> MatrixModel:
+        """Build the matrix-form model, computing overlap cliques only when needed."""
+        overlap_cliques = (constraint_manager.get_overlap_cliques()
+                           if ConstraintType.NO_OVERLAPPING in constraints else [])
+        return MatrixModel.build(data, eligibility, constraints, overlap_cliques)
+    
+    def _solve_pulp(self,
+                    data: ProblemData,
+                    eligibility: EligibilityMatrix,
+                    constraints: List[ConstraintType],
+                    constraint_manager: ConstraintManager,
+                    solver: MatrixSolver,
+                    warm_columns: np.ndarray,
+                    limits: SolveLimits,
+                    model: Optional[MatrixModel] = None) -> SolveResult:
+        """Build and solve the reference pulp model; a given matrix model only seeds the warm start."""
+        # Create the optimization problem
+        problem = self._create_problem()
+        
+        # Create decision variables for eligible pairs only
+        variables = self._create_variables(problem, eligibility)
+        
+        # Apply constraints
+        self._apply_constraints(problem, variables, constraints, constraint_manager, data)
+        
+        # Set objective function
+        self._set_objective(problem, variables)
+        
+        # Seed the variables with the feasible part of the current assignments, completed
+        # greedily under a time limit so that a stopped search still has an incumbent
+        warm_start = None
+        kept = 0
+        if len(warm_columns) or limits.deadline is not None:
+            if model is None:
+                model = self._build_matrix_model(data, eligibility, constraints, constraint_manager)
+            warm_start = self._warm_start(model, warm_columns)
+            kept = int(warm_start.sum()) if warm_start is not None else 0
+            if limits.deadline is not None:
+                warm_start = get_solver("greedy").solve(model, SolveOptions(warm_start=warm_start)).values
+            for c in np.flatnonzero(warm_start).tolist():
+                variables[int(model.col_employee[c])][int(model.col_shift[c])].setInitialValue(1)
+        
+        # Configure solver
+        options = limits.options(settings.solver_threads, warm_start)
+        lp_solver, solver_name = self._configure_solver(solver, options)
+        
+        # Solve the problem
+        logger.info("Starting optimization...")
+        if self.progress is not None:
+            self._report("model", rows=len(problem.constraints), columns=len(eligibility.rows),
+                         nonzeros=sum(len(constraint) for constraint in problem.constraints.values()))
+        self._report("phase", phase="solve", solver=solver_name)
+        status = problem.solve(lp_solver)
+        
+        rows, cols = eligibility.coo()
+        values = np.array([
+            variables[i][j].varValue or 0.0 for i, j in zip(rows.tolist(), cols.tolist())
+        ], dtype=np.float64)
+        objective_value = problem.objective.value()
+        
+        # Stopped without an incumbent of its own, or with a worse one (CBC books MIP starts of
+        # maximization problems with the wrong sign): the MIP start is the best solution known
+        if warm_start is not None and limits.deadline is not None and (
+                status != pulp.LpStatusOptimal or (objective_value or 0.0) < warm_start.sum()):
+            return SolveResult(pulp.LpStatusOptimal, warm_start, float(warm_start.sum()),
+                               pulp.LpSolutionIntegerFeasible, solver=solver_name)
+        solve_result = SolveResult(status, values, float(objective_value) if objective_value else 0.0,
+                                   problem.sol_status, solver=solver_name)
+        if kept and lp_solver.optionsDict.get("warmStart"):
+            solve_result.warm_start_assignments = kept
+        return solve_result
+    
     def _create_problem(self) -> pulp.LpProblem:
         """Create the linear programming problem."""
         sense = pulp.LpMaximize # We need to maximize number of shifts assigned (allows unassigned shifts)
         return pulp.LpProblem("Employee_Shift_Scheduling", sense)
     
-    def _create_variables(self, problem: pulp.LpProblem, employees: List[Employee], shifts: List[Shift]) -> Dict:
-        """Create binary decision variables for employee-shift assignments."""
-        variables = {}
-        
-        for employee in employees:
-            variables[employee.id] = {}
-            for shift in shifts:
-                var_name = f"assign_{employee.id}_{shift.id}"
-                variables[employee.id][shift.id] = pulp.LpVariable(
-                    var_name, cat='Binary'
-                )
-        
-        logger.info(f"Created {len(employees) * len(shifts)} decision variables")
+    def _create_variables(self, problem: pulp.LpProblem, eligibility: EligibilityMatrix) -> Dict:
+        """Create binary decision variables for the eligible employee-shift pairs only."""
+        variables = {i: {} for i in range(eligibility.data.num_employees)}
+        
+        rows, cols = eligibility.coo()
+        for i, j in zip(rows.tolist(), cols.tolist()):
+            var_name = f"assign_{i}_{j}"
+            variables[i][j] = pulp.LpVariable(
+                var_name, cat='Binary'
+            )
+        
+        logger.info(f"Created {sum(len(shift_vars) for shift_vars in variables.values())} decision variables")
         return variables
     
     def _apply_constraints(self, 
@@ -128,20 +753,22 @@ class ShiftScheduler:
                           variables: Dict, 
                           constraints: List[ConstraintType],
                           constraint_manager: ConstraintManager,
-                          employees: List[Employee],
-                          shifts: List[Shift]) -> None:
+                          data: ProblemData) -> None:
         """Apply specified constraints to the problem."""
         # Ensure each shift is assigned to at most one employee (allows unassigned shifts)
-        for shift in shifts:
-            problem += pulp.lpSum([
-                variables[emp.id][shift.id] for emp in employees
-            ]) <= 1
+        shift_vars = [[] for _ in range(data.num_shifts)]
+        for emp_vars in variables.values():
+            for j, var in emp_vars.items():
+                shift_vars[j].append(var)
         
-        # Apply user-specified constraints
+        for candidates in shift_vars:
+            if len(candidates) > 1:
+                problem += pulp.lpSum(candidates) <= 1
+        
+        # Apply user-specified constraints; skill matching and availability windows need no rows
+        # because _create_variables only creates the pairs the eligibility matrix admits
         constraint_methods = {
-            ConstraintType.SKILL_MATCHING: constraint_manager.apply_skill_matching,
             ConstraintType.OVERTIME_LIMITS: constraint_manager.apply_overtime_limits,
-            ConstraintType.AVAILABILITY_WINDOWS: constraint_manager.apply_availability_windows,
             ConstraintType.NO_OVERLAPPING: constraint_manager.apply_no_overlapping
         }
         
@@ -152,71 +779,79 @@ class ShiftScheduler:
     
     def _set_objective(self, 
                       problem: pulp.LpProblem, 
-                      variables: Dict,
-                      employees: List[Employee],
-                      shifts: List[Shift]) -> None:
+                      variables: Dict) -> None:
         """Set the objective function for optimization."""
         # Maximize number of assigned shifts (allows some shifts to remain unassigned if constraints prevent assignment)
         total_assignments = pulp.lpSum([
-            variables[emp.id][shift.id]
-            for emp in employees
-            for shift in shifts
+            var
+            for shift_vars in variables.values()
+            for var in shift_vars.values()
         ])
         problem += total_assignments
     
-    def _configure_solver(self) -> pulp.LpSolver:
-        """Configure the ILP solver."""
-        solver = pulp.PULP_CBC_CMD(msg=0)  # Silent mode
-
-        return solver
+    def _configure_solver(self, solver: MatrixSolver, options: SolveOptions) -> Tuple[pulp.LpSolver, str]:
+        """Configure the ILP solver, using CBC for backends without a pulp interface."""
+        lp_solver = solver.pulp_solver(options)
+        if lp_solver is None:
+            cbc = get_solver("cbc")
+            return cbc.pulp_solver(options), cbc.name
+        
+        return lp_solver, solver.name
     
     def _process_results(self, 
-                        problem: pulp.LpProblem, 
-                        variables: Dict, 
-                        status: int, 
+                        solve_result: SolveResult, 
                         start_time: datetime,
-                        employees: List[Employee],
-                        shifts: List[Shift],
-                        constraints: List[ConstraintType]) -> ShiftScheduleResponse:
+                        data: ProblemData,
+                        eligibility: EligibilityMatrix,
+                        constraints: List[ConstraintType],
+                        component_metrics: Optional[List[ComponentMetrics]] = None) -> ShiftScheduleResponse:
         """Process optimization results and create response."""
+        self._report("phase", phase="extract")
         execution_time_ms = int((datetime.now() - start_time).total_seconds() * 1000)
         
-        # Calculate metrics
-        total_overtime_minutes = self._calculate_overtime_minutes(variables, employees, shifts)
         constraint_violations = 0  # TODO: Implement constraint violation counting
         
-        if status == pulp.LpStatusOptimal:
-            assignments = []
-            assigned_shifts = set()
-            
-            for emp in employees:
-                for shift in shifts:
-                    if variables[emp.id][shift.id].varValue == 1:
-                        assignments.append(Assignment(
-                            shift_id=shift.id,
-                            employee_id=emp.id
-                        ))
-                        assigned_shifts.add(shift.id)
+        if solve_result.status == pulp.LpStatusOptimal:
+            selected = np.flatnonzero(solve_result.values > 0.5)
+            rows, cols = eligibility.rows[selected], eligibility.cols[selected]
             
-            unassigned_shifts = [
-                shift.id for shift in shifts 
-                if shift.id not in assigned_shifts
+            assignments = [
+                Assignment(shift_id=data.shift_ids[j], employee_id=data.employee_ids[i])
+                for i, j in zip(rows.tolist(), cols.tolist())
             ]
             
+            assigned = np.zeros(data.num_shifts, dtype=bool)
+            assigned[cols] = True
+            unassigned_shifts = [data.shift_ids[j] for j in np.flatnonzero(~assigned).tolist()]
+            
             metrics = OptimizationMetrics(
-                total_overtime_minutes=total_overtime_minutes,
+                total_overtime_minutes=self._calculate_overtime_minutes(rows, cols, data),
                 constraint_violations=constraint_violations,
                 optimization_time_ms=execution_time_ms,
-                objective_value=float(problem.objective.value()) if problem.objective.value() else 0.0
+                objective_value=solve_result.objective_value,
+                solver=solve_result.solver,
+                solver_reason=solve_result.solver_reason,
+                warm_start_assignments=solve_result.warm_start_assignments,
+                time_to_first_incumbent_ms=solve_result.time_to_first_incumbent_ms,
+                components=component_metrics or []
             )
             
+            # A proven optimum is its own bound
+            best_bound = solve_result.best_bound
+            if best_bound is None and solve_result.proven_optimal:
+                best_bound = solve_result.objective_value
+            if best_bound is not None:
+                metrics.best_bound = best_bound
+                metrics.gap = max(best_bound - solve_result.objective_value, 0.0) / best_bound if best_bound > 0 else 0.0
+            
             return ShiftScheduleResponse(
                 success=True,
                 assignments=assignments,
                 unassigned_shifts=unassigned_shifts,
                 metrics=metrics,
                 constraints_applied=[constraint.value for constraint in constraints],
-                message="Optimization completed successfully"
+                message=("Optimization completed successfully" if solve_result.proven_optimal
+                         else "Heuristic solution found (optimality not proven)")
             )
         
         else:
@@ -224,34 +859,35 @@ class ShiftScheduler:
                 total_overtime_minutes=0,
                 constraint_violations=0,
                 optimization_time_ms=execution_time_ms,
-                objective_value=0.0
+                objective_value=0.0,
+                solver=solve_result.solver,
+                solver_reason=solve_result.solver_reason
             )
             
             return ShiftScheduleResponse(
                 success=False,
                 assignments=[],
-                unassigned_shifts=[shift.id for shift in shifts],
+                unassigned_shifts=list(data.shift_ids),
                 metrics=metrics,
                 constraints_applied=[constraint.value for constraint in constraints],
-                message=f"Optimization failed with status: {pulp.LpStatus[status]}"
+                message=f"Optimization failed with status: {pulp.LpStatus[solve_result.status]}"
             )
     
-    def _calculate_overtime_minutes(self, 
-                                   variables: Dict, 
-                                   employees: List[Employee], 
-                                   shifts: List[Shift]) -> int:
-        """Calculate total overtime minutes for all employees."""
-        total_overtime = 0
-        
-        for emp in employees:
-            total_hours = 0
-            for shift in shifts:
-                if variables[emp.id][shift.id].varValue == 1:
-                    total_hours += shift.duration_hours
-            
-            # Calculate overtime (hours over max_hours)
-            if total_hours > emp.max_hours:
-                overtime_hours = total_hours - emp.max_hours
-                total_overtime += int(overtime_hours * 60)  # Convert to minutes
-        
-        return total_overtime
\ No newline at end of file
+    def _calculate_overtime_minutes(self, rows: np.ndarray, cols: np.ndarray, data: ProblemData) -> int:
+        """Calculate total overtime minutes for all employees from the assigned pairs."""
+        # Sum assigned minutes per employee and keep the part over max_hours
+        worked = np.bincount(rows, weights=data.duration[cols], minlength=data.num_employees)
+        return int(np.maximum(worked - data.max_minutes, 0).sum())
+
+
+def _solve_component(model_backend: str,
+                     solver_backend: str,
+                     eligibility: EligibilityMatrix,
+                     constraints: List[ConstraintType],
+                     current_assignments: List[Assignment],
+                     limits: SolveLimits) -> Tuple[SolveResult, int]:
+    """Solve one component of a decomposed problem (possibly in a pool worker or thread) and time it."""
+    started = time.perf_counter()
+    scheduler = ShiftScheduler(model_backend=model_backend, solver_backend=solver_backend, decompose=False)
+    result = scheduler._solve_problem(eligibility.data, eligibility, constraints, current_assignments, limits)
+    return result, int((time.perf_counter() - started) * 1000)
@@ -0,0 +1 @@
+# Solver backends package
@@ -0,0 +1,166 @@
+import math
+import time
+from typing import Callable, Optional
+import numpy as np
+import pulp
+
+from services.matrix_model import MatrixModel
+
+
+class SolveResult:
+    """
+    Solver-independent outcome of an optimization run.
+
+    ``status`` and ``sol_status`` use pulp's LpStatus/LpSolution codes and ``values``
+    holds one value per model column (eligible pair in COO order), so every backend
+    feeds the same result processing. As in pulp, a usable but unproven solution is
+    reported as LpStatusOptimal with sol_status LpSolutionIntegerFeasible.
+    ``best_bound`` is the solver's upper bound on the objective, when it reports one.
+    """
+
+    __slots__ = (
+        "status", "values", "objective_value", "sol_status", "solver", "solver_reason",
+        "time_to_first_incumbent_ms", "warm_start_assignments", "best_bound",
+    )
+
+    def __init__(self,
+                 status: int,
+                 values: np.ndarray,
+                 objective_value: float,
+                 sol_status: Optional[int] = None,
+                 solver: Optional[str] = None,
+                 time_to_first_incumbent_ms: Optional[int] = None,
+                 best_bound: Optional[float] = None):
+        self.status = status
+        self.values = values
+        self.objective_value = objective_value
+        self.sol_status = sol_status if sol_status is not None else pulp.LpStatusToSolution[status]
+        self.solver = solver
+        self.solver_reason: Optional[str] = None
+        self.time_to_first_incumbent_ms = time_to_first_incumbent_ms
+        self.warm_start_assignments = 0
+        self.best_bound = best_bound
+
+    @property
+    def proven_optimal(self) -> bool:
+        """Whether the solver proved the returned solution optimal."""
+        return self.status == pulp.LpStatusOptimal and self.sol_status == pulp.LpSolutionOptimal
+
+
+class SolverCapabilities:
+    """Features a solver backend supports."""
+
+    __slots__ = ("warm_start", "time_limit", "threads", "callbacks", "exact")
+
+    def __init__(self, warm_start: bool, time_limit: bool, threads: bool, callbacks: bool, exact: bool = True):
+        self.warm_start = warm_start
+        self.time_limit = time_limit
+        self.threads = threads
+        self.callbacks = callbacks
+        self.exact = exact
+
+    def as_dict(self) -> dict:
+        """Return the capabilities as a plain dict for reporting."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class SolveOptions:
+    """
+    Per-solve parameters passed to a solver backend.
+
+    ``warm_start`` is a feasible 0/1 value per column used as a MIP start by solvers
+    that support one; the others ignore it. ``time_limit`` (seconds) and ``mip_gap``
+    (relative) stop the search early; the best incumbent is then returned as an
+    integer-feasible solution. ``on_incumbent`` is called with the objective value and
+    the current bound (or None) of incumbents found during the search, by solvers
+    that report them.
+    """
+
+    __slots__ = ("threads", "warm_start", "time_limit", "mip_gap", "on_incumbent")
+
+    def __init__(self,
+                 threads: int = 1,
+                 warm_start: Optional[np.ndarray] = None,
+                 time_limit: Optional[float] = None,
+                 mip_gap: Optional[float] = None,
+                 on_incumbent: Optional[Callable[[float, Optional[float]], None]] = None):
+        self.threads = threads
+        self.warm_start = warm_start
+        self.time_limit = time_limit
+        self.mip_gap = mip_gap
+        self.on_incumbent = on_incumbent
+
+
+class SolveLimits:
+    """
+    Stopping criteria of one scheduling request, shared by all of its solves.
+
+    The deadline is wall-clock time (time.time()), so it keeps its meaning in the
+    worker processes that solve decomposed components.
+    """
+
+    __slots__ = ("deadline", "mip_gap")
+
+    def __init__(self, deadline: Optional[float] = None, mip_gap: Optional[float] = None):
+        self.deadline = deadline
+        self.mip_gap = mip_gap
+
+    @classmethod
+    def from_request(cls, time_limit_ms: Optional[int], mip_gap: Optional[float]) -> "SolveLimits":
+        """Start the clock of a request with an optional time limit in milliseconds."""
+        return cls(time.time() + time_limit_ms / 1000 if time_limit_ms else None, mip_gap)
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left until the deadline (never negative), or None without a time limit."""
+        return None if self.deadline is None else max(self.deadline - time.time(), 0.0)
+
+    def share(self, parts: int) -> "SolveLimits":
+        """Limits of the next of parts solves run one after another, splitting the remaining time evenly."""
+        remaining = self.remaining()
+        if remaining is None:
+            return self
+        return SolveLimits(time.time() + remaining / max(parts, 1), self.mip_gap)
+
+    def options(self,
+                threads: int,
+                warm_start: Optional[np.ndarray] = None,
+                on_incumbent: Optional[Callable[[float, Optional[float]], None]] = None) -> SolveOptions:
+        """Build the options of a solve started now (solvers read a zero limit as none, so 10 ms is the floor)."""
+        remaining = self.remaining()
+        return SolveOptions(threads=threads, warm_start=warm_start,
+                            time_limit=None if remaining is None else max(remaining, 0.01), mip_gap=self.mip_gap,
+                            on_incumbent=on_incumbent)
+
+
+def proves_optimality(objective_value: float, bound: Optional[float]) -> bool:
+    """
+    Whether a bound proves an objective value optimal.
+
+    Objective coefficients are integral (one per assignment), so any bound below the
+    next integer closes the gap.
+    """
+    return bound is not None and math.floor(bound + 1e-6) <= objective_value + 1e-6
+
+
+class MatrixSolver:
+    """Base class of the solver backends registered in services.solvers.registry."""
+
+    name: str = ""
+    capabilities = SolverCapabilities(warm_start=False, time_limit=False, threads=False, callbacks=False)
+
+    def is_available(self) -> bool:
+        """Check whether the solver can be used in this environment."""
+        return True
+
+    def solve(self, model: MatrixModel, options: SolveOptions) -> SolveResult:
+        """Solve a MatrixModel and return one value per column."""
+        raise NotImplementedError
+
+    def pulp_solver(self, options: SolveOptions) -> Optional[pulp.LpSolver]:
+        """Return the equivalent pulp solver for the reference model path, if there is one."""
+        return None
+
+    def _empty_result(self) -> SolveResult:
+        """Result for a model without columns, where nothing can be assigned."""
+        return SolveResult(pulp.LpStatusOptimal, np.zeros(0), 0.0, solver=self.name, time_to_first_incumbent_ms=0,
+                           best_bound=0.0)
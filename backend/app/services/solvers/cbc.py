@@ -0,0 +1,185 @@
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from typing import Callable, List, Optional, Tuple
+from loguru import logger
+import numpy as np
+import pulp
+
+from services.matrix_model import MatrixModel, column_index, column_names
+from services.solvers.base import (
+    MatrixSolver, SolveOptions, SolveResult, SolverCapabilities, proves_optimality
+)
+
+# Map the first word of a CBC solution file to pulp status codes
+CBC_STATUS = {
+    "Optimal": pulp.LpStatusOptimal,
+    "Infeasible": pulp.LpStatusInfeasible,
+    "Integer": pulp.LpStatusInfeasible,
+    "Unbounded": pulp.LpStatusUnbounded,
+    "Stopped": pulp.LpStatusNotSolved,
+}
+
+# CBC log lines announcing a new incumbent (heuristic, branch and bound or MIP start)
+INCUMBENT_LOG = re.compile(r"Integer solution of|Solution found of|MIPStart provided solution")
+
+# CBC result summary line with the bound on the (negated) objective
+BOUND_LOG = re.compile(r"^(?:Upper|Lower) bound:\s+(\S+)")
+
+# CBC log lines with the (negated) objective of a new incumbent and with the current bound
+INCUMBENT_VALUE_LOG = re.compile(r"Integer solution of (\S+) found")
+PROGRESS_BOUND_LOG = re.compile(r"best possible (-?[0-9.eE+]+)")
+
+# CBC block-buffers its log when writing to a pipe, so incumbents would only surface when it
+# exits; coreutils stdbuf switches it to line buffering where it is available
+LINE_BUFFERED = ["stdbuf", "-oL"] if shutil.which("stdbuf") else []
+
+
+class CbcSolver(MatrixSolver):
+    """
+    CBC command-line solver bundled with pulp.
+
+    The model is streamed to an MPS file and the solution file is read back into
+    a column value array, without creating pulp variables or constraints. The model is
+    passed as the minimization of the negated objective: with ``-max``, CBC 2.10 books
+    a MIP start with the wrong sign and then accepts worse solutions as improvements.
+    """
+
+    name = "cbc"
+    capabilities = SolverCapabilities(warm_start=True, time_limit=True, threads=True, callbacks=False)
+
+    def is_available(self) -> bool:
+        """Check that the CBC binary can be executed."""
+        solver = pulp.PULP_CBC_CMD()
+        return bool(solver.executable(solver.path))
+
+    def solve(self, model: MatrixModel, options: SolveOptions) -> SolveResult:
+        """Solve the model with the CBC binary."""
+        if model.num_cols == 0:
+            return self._empty_result()
+
+        with tempfile.TemporaryDirectory(prefix="schedule_cbc_") as tmp_dir:
+            mps_path = os.path.join(tmp_dir, "model.mps")
+            solution_path = os.path.join(tmp_dir, "model.sol")
+            model.write_mps(mps_path, negate_objective=True)
+
+            args = [pulp.PULP_CBC_CMD().path, mps_path, "-threads", str(options.threads)]
+            if options.time_limit is not None:
+                args += ["-sec", f"{max(options.time_limit, 0.01):.3f}"]
+            if options.mip_gap is not None:
+                args += ["-ratioGap", str(options.mip_gap)]
+            if options.warm_start is not None:
+                start_path = os.path.join(tmp_dir, "model.mst")
+                write_cbc_mip_start(start_path, options.warm_start)
+                args += ["-mips", start_path]
+            args += ["-branch", "-printingOptions", "normal", "-solution", solution_path]
+
+            returncode, first_incumbent_ms, best_bound = run_cbc(args, options.on_incumbent)
+            if returncode != 0 or not os.path.exists(solution_path):
+                raise RuntimeError(f"CBC failed with exit code {returncode}")
+
+            status, sol_status, values = read_cbc_solution(solution_path, model.num_cols)
+
+        # A search stopped before improving on the MIP start still has the start as its incumbent
+        if status == pulp.LpStatusNotSolved and options.warm_start is not None:
+            status, sol_status, values = pulp.LpStatusOptimal, pulp.LpSolutionIntegerFeasible, options.warm_start
+
+        objective_value = float(model.objective @ values)
+        if sol_status == pulp.LpSolutionOptimal:
+            best_bound = objective_value
+        elif sol_status == pulp.LpSolutionIntegerFeasible and proves_optimality(objective_value, best_bound):
+            sol_status = pulp.LpSolutionOptimal
+
+        logger.info(f"CBC finished with status: {pulp.LpStatus[status]}")
+        return SolveResult(status, values, objective_value, sol_status, solver=self.name,
+                           time_to_first_incumbent_ms=first_incumbent_ms, best_bound=best_bound)
+
+    def pulp_solver(self, options: SolveOptions) -> Optional[pulp.LpSolver]:
+        """Return the pulp CBC command solver."""
+        return pulp.PULP_CBC_CMD(msg=0, threads=options.threads,  # Silent mode
+                                 warmStart=options.warm_start is not None,
+                                 timeLimit=options.time_limit, gapRel=options.mip_gap)
+
+
+def run_cbc(args: List[str],
+            on_incumbent: Optional[Callable[[float, Optional[float]], None]] = None
+            ) -> Tuple[int, Optional[int], Optional[float]]:
+    """
+    Run the CBC binary and watch its log for the first incumbent and the final bound.
+
+    Args:
+        args: Command line of the CBC binary
+        on_incumbent: Called with the objective value and the last logged bound of every
+            incumbent announced in the log
+
+    Returns:
+        Tuple of (exit code, milliseconds until the first incumbent was logged or None,
+        bound from the result summary or None when the search completed)
+    """
+    start = time.monotonic()
+    first_incumbent_ms, best_bound, progress_bound = None, None, None
+    with subprocess.Popen(LINE_BUFFERED + args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                          stdin=subprocess.DEVNULL, text=True) as process:
+        for line in process.stdout:
+            if first_incumbent_ms is None and INCUMBENT_LOG.search(line):
+                first_incumbent_ms = int((time.monotonic() - start) * 1000)
+            bound = BOUND_LOG.match(line)
+            if bound:
+                best_bound = -float(bound.group(1))
+            if on_incumbent is not None:
+                progress = PROGRESS_BOUND_LOG.search(line)
+                if progress:
+                    progress_bound = -float(progress.group(1))
+                incumbent = INCUMBENT_VALUE_LOG.search(line)
+                if incumbent:
+                    on_incumbent(-float(incumbent.group(1)), progress_bound)
+    return process.returncode, first_incumbent_ms, best_bound
+
+
+def write_cbc_mip_start(path: str, values: np.ndarray) -> None:
+    """Write column values as a CBC solution file, the format read by its -mips option."""
+    # Format each distinct value once and assemble the lines with array string operations
+    unique, inverse = np.unique(values, return_inverse=True)
+    value_fields = np.array([f" {value:>15g} {0:>23}".encode() for value in unique.tolist()])[inverse]
+    index_fields = np.char.rjust(np.arange(len(values)).astype(bytes), 7)
+    lines = np.char.add(np.char.add(np.char.add(index_fields, b" "), column_names(len(values))), value_fields)
+    with open(path, "wb") as f:
+        f.write(b"Stopped on time - objective value 0\n")
+        f.write(b"".join(np.char.add(lines, b"\n").tolist()))
+
+
+def read_cbc_solution(path: str, num_cols: int):
+    """
+    Parse a CBC solution file written for a model with generated column names.
+
+    Returns:
+        Tuple of (pulp status code, pulp solution status code, column value array)
+    """
+    values = np.zeros(num_cols, dtype=np.float64)
+    with open(path) as f:
+        words = f.readline().split()
+        status = CBC_STATUS.get(words[0], pulp.LpStatusUndefined) if words else pulp.LpStatusUndefined
+        sol_status = pulp.LpStatusToSolution[status]
+        # "Stopped on time - objective value ..." still carries an integer solution, and
+        # "Optimal (within gap tolerance)" one that is not proven optimal
+        if status == pulp.LpStatusNotSolved and len(words) >= 5 and words[4] == "objective":
+            status = pulp.LpStatusOptimal
+            sol_status = pulp.LpSolutionIntegerFeasible
+        elif status == pulp.LpStatusOptimal and len(words) >= 2 and words[1] == "(within":
+            sol_status = pulp.LpSolutionIntegerFeasible
+
+        for line in f:
+            fields = line.split()
+            if fields and fields[0] == "**":
+                fields = fields[1:]
+            if len(fields) >= 3 and fields[1].startswith("C"):
+                values[column_index(fields[1])] = float(fields[2])
+
+    # A search stopped inside the LP relaxation writes fractional values, which are no solution
+    if sol_status == pulp.LpSolutionIntegerFeasible and not np.allclose(values, np.round(values), atol=1e-6):
+        return pulp.LpStatusNotSolved, pulp.LpSolutionNoSolutionFound, np.zeros(num_cols, dtype=np.float64)
+
+    return status, sol_status, values
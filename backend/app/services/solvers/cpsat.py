@@ -0,0 +1,116 @@
+import time
+from typing import Optional
+from loguru import logger
+import numpy as np
+import pulp
+
+from services.matrix_model import MatrixModel
+from services.solvers.base import (
+    MatrixSolver, SolveOptions, SolveResult, SolverCapabilities, proves_optimality
+)
+
+try:
+    from ortools.sat.python import cp_model
+except ImportError:  # Optional dependency: the registry skips CP-SAT when OR-Tools is missing
+    cp_model = None
+
+
+class CpSatSolver(MatrixSolver):
+    """
+    OR-Tools CP-SAT solver.
+
+    Every column is a Boolean literal. Unit rows with a right-hand side of one (shift
+    capacity and overlap cliques) become AddAtMostOne constraints, which CP-SAT
+    propagates natively; weighted rows such as the minute caps become linear constraints.
+    All matrix coefficients are integers, so the model is exact.
+    """
+
+    name = "cpsat"
+    capabilities = SolverCapabilities(warm_start=True, time_limit=True, threads=True, callbacks=True)
+
+    def is_available(self) -> bool:
+        """Check whether OR-Tools is installed."""
+        return cp_model is not None
+
+    def solve(self, model: MatrixModel, options: SolveOptions) -> SolveResult:
+        """Solve the model with CP-SAT."""
+        if cp_model is None:
+            raise RuntimeError("OR-Tools is not installed (pip install ortools)")
+
+        if model.num_cols == 0:
+            return self._empty_result()
+
+        sat_model = cp_model.CpModel()
+        literals = [sat_model.NewBoolVar(f"x{k}") for k in range(model.num_cols)]
+        for k in np.flatnonzero(model.col_upper < 0.5).tolist():
+            sat_model.Add(literals[k] == 0)
+
+        indptr = model.indptr.tolist()
+        indices = model.indices.tolist()
+        values = model.values.astype(np.int64).tolist()
+        row_upper = model.row_upper.astype(np.int64).tolist()
+        unit_rows = (np.bincount(model.row_ids(), weights=model.values != 1, minlength=model.num_rows) == 0).tolist()
+        for r in range(model.num_rows):
+            row = [literals[c] for c in indices[indptr[r]:indptr[r + 1]]]
+            if unit_rows[r] and row_upper[r] == 1:
+                sat_model.AddAtMostOne(row)
+            else:
+                sat_model.Add(sum(v * x for v, x in zip(values[indptr[r]:indptr[r + 1]], row)) <= row_upper[r])
+
+        sat_model.Maximize(sum(literals))
+        if options.warm_start is not None:
+            for literal, value in zip(literals, options.warm_start.tolist()):
+                sat_model.AddHint(literal, value > 0.5)
+
+        solver = cp_model.CpSolver()
+        solver.parameters.num_workers = options.threads
+        if options.time_limit is not None:
+            solver.parameters.max_time_in_seconds = options.time_limit
+        if options.mip_gap is not None:
+            solver.parameters.relative_gap_limit = options.mip_gap
+        first_solution = _FirstSolutionTimer(options.on_incumbent)
+        sat_status = solver.Solve(sat_model, first_solution)
+
+        status, sol_status = _pulp_status(sat_status)
+        solution = np.zeros(model.num_cols)
+        best_bound = None
+        if status == pulp.LpStatusOptimal:
+            solution = np.fromiter((solver.BooleanValue(x) for x in literals), dtype=np.float64,
+                                   count=model.num_cols)
+            best_bound = float(solver.BestObjectiveBound())
+        objective_value = float(model.objective @ solution)
+
+        # OPTIMAL within a requested gap is only proven when the bound closes it
+        if sol_status == pulp.LpSolutionOptimal and not proves_optimality(objective_value, best_bound):
+            sol_status = pulp.LpSolutionIntegerFeasible
+
+        logger.info(f"CP-SAT finished with status: {solver.StatusName(sat_status)}")
+        return SolveResult(status, solution, objective_value, sol_status, solver=self.name,
+                           time_to_first_incumbent_ms=first_solution.elapsed_ms, best_bound=best_bound)
+
+
+class _FirstSolutionTimer(cp_model.CpSolverSolutionCallback if cp_model else object):
+    """Solution callback recording when the first non-empty solution is found and reporting every solution."""
+
+    def __init__(self, on_incumbent=None):
+        super().__init__()
+        self._start = time.monotonic()
+        self._on_incumbent = on_incumbent
+        self.elapsed_ms: Optional[int] = None
+
+    def on_solution_callback(self):
+        if self.elapsed_ms is None and self.ObjectiveValue() > 0:
+            self.elapsed_ms = int((time.monotonic() - self._start) * 1000)
+        if self._on_incumbent is not None:
+            self._on_incumbent(float(self.ObjectiveValue()), float(self.BestObjectiveBound()))
+
+
+def _pulp_status(sat_status):
+    """Translate a CP-SAT status into pulp (status, solution status) codes."""
+    if sat_status == cp_model.OPTIMAL:
+        return pulp.LpStatusOptimal, pulp.LpSolutionOptimal
+    if sat_status == cp_model.FEASIBLE:
+        return pulp.LpStatusOptimal, pulp.LpSolutionIntegerFeasible
+    if sat_status == cp_model.INFEASIBLE:
+        return pulp.LpStatusInfeasible, pulp.LpSolutionInfeasible
+    return pulp.LpStatusNotSolved, pulp.LpSolutionNoSolutionFound
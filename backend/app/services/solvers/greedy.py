@@ -0,0 +1,46 @@
+import time
+from loguru import logger
+import numpy as np
+import pulp
+
+from services.matrix_model import MatrixModel
+from services.solvers.base import MatrixSolver, SolveOptions, SolveResult, SolverCapabilities
+
+
+class GreedySolver(MatrixSolver):
+    """
+    Packing heuristic over the constraint matrix.
+
+    Columns are visited cheapest first, where the cost of a column is the share of row
+    capacity it consumes, and a column is selected whenever every row it touches still
+    has room. Warm-start columns are visited before all others. The result is always
+    feasible but carries no optimality proof, so it is reported as an integer-feasible
+    solution. Used for instances too large to solve exactly.
+    """
+
+    name = "greedy"
+    capabilities = SolverCapabilities(warm_start=True, time_limit=False, threads=False, callbacks=False,
+                                      exact=False)
+
+    def solve(self, model: MatrixModel, options: SolveOptions) -> SolveResult:
+        """Build a feasible assignment in one pass over the columns."""
+        if model.num_cols == 0:
+            return self._empty_result()
+
+        start = time.monotonic()
+        indptr, rows, values = model.to_csc()
+        with np.errstate(divide='ignore'):
+            load = values / model.row_upper[rows]
+        cost = np.bincount(np.repeat(np.arange(model.num_cols), np.diff(indptr)), weights=load,
+                           minlength=model.num_cols)
+        order = np.lexsort((model.col_shift, cost))
+
+        # A warm start is kept as far as it stays feasible and completed greedily
+        if options.warm_start is not None:
+            order = np.concatenate((np.flatnonzero(options.warm_start > 0.5), order))
+        solution = model.pack(order)
+
+        logger.info(f"Greedy heuristic selected {int(solution.sum())} of {model.num_cols} columns")
+        return SolveResult(pulp.LpStatusOptimal, solution, float(model.objective @ solution),
+                           pulp.LpSolutionIntegerFeasible, solver=self.name,
+                           time_to_first_incumbent_ms=int((time.monotonic() - start) * 1000))
@@ -0,0 +1,138 @@
+import time
+from typing import Optional
+from loguru import logger
+import numpy as np
+import pulp
+
+from services.matrix_model import MatrixModel
+from services.solvers.base import (
+    MatrixSolver, SolveOptions, SolveResult, SolverCapabilities, proves_optimality
+)
+
+try:
+    import highspy
+except ImportError:  # Optional dependency: CBC is used when HiGHS is not installed
+    highspy = None
+
+
+def highs_available() -> bool:
+    """Check whether the in-process HiGHS bindings are installed."""
+    return highspy is not None
+
+
+class HighsSolver(MatrixSolver):
+    """
+    In-process HiGHS MIP solver.
+
+    The CSR arrays are handed to HiGHS directly, so no subprocess is forked and no
+    model or solution file touches the disk.
+    """
+
+    name = "highs"
+    capabilities = SolverCapabilities(warm_start=True, time_limit=True, threads=True, callbacks=True)
+
+    def is_available(self) -> bool:
+        """Check whether highspy is installed."""
+        return highs_available()
+
+    def solve(self, model: MatrixModel, options: SolveOptions) -> SolveResult:
+        """Solve the model in-process with HiGHS."""
+        if highspy is None:
+            raise RuntimeError("HiGHS is not installed (pip install highspy)")
+
+        if model.num_cols == 0:
+            return self._empty_result()
+
+        highs = highspy.Highs()
+        highs.setOptionValue("output_flag", False)
+        highs.setOptionValue("threads", options.threads)
+        if options.time_limit is not None:
+            highs.setOptionValue("time_limit", float(options.time_limit))
+        if options.mip_gap is not None:
+            highs.setOptionValue("mip_rel_gap", float(options.mip_gap))
+        highs.passModel(_to_highs_lp(model))
+        if options.warm_start is not None:
+            start_solution = highspy.HighsSolution()
+            start_solution.col_value = options.warm_start.tolist()
+            start_solution.value_valid = True
+            highs.setSolution(start_solution)
+
+        # Record when the first non-empty incumbent appears, and report every incumbent
+        start = time.monotonic()
+        incumbent_times = []
+
+        def on_improving_solution(event) -> None:
+            objective_value = event.data_out.objective_function_value
+            if objective_value > 0 and not incumbent_times:
+                incumbent_times.append(time.monotonic())
+            if options.on_incumbent is not None:
+                bound = event.data_out.mip_dual_bound
+                options.on_incumbent(float(objective_value), float(bound) if np.isfinite(bound) else None)
+
+        highs.cbMipImprovingSolution.subscribe(on_improving_solution)
+        highs.run()
+
+        model_status = highs.getModelStatus()
+        info = highs.getInfo()
+        status = _pulp_status(model_status)
+        sol_status = pulp.LpStatusToSolution[status]
+        best_bound = None
+        if status == pulp.LpStatusNotSolved and info.primal_solution_status == highspy.kSolutionStatusFeasible:
+            # Stopped early (time limit) with an incumbent
+            status, sol_status = pulp.LpStatusOptimal, pulp.LpSolutionIntegerFeasible
+
+        values = np.zeros(model.num_cols)
+        if status == pulp.LpStatusOptimal:
+            values = np.round(np.asarray(highs.getSolution().col_value, dtype=np.float64))
+            if np.isfinite(info.mip_dual_bound):
+                best_bound = float(info.mip_dual_bound)
+        objective_value = float(model.objective @ values)
+
+        # Optimal within a requested gap is only proven when the bound closes it
+        if model_status == highspy.HighsModelStatus.kOptimal:
+            if options.mip_gap is not None and not proves_optimality(objective_value, best_bound):
+                sol_status = pulp.LpSolutionIntegerFeasible
+            elif best_bound is None:
+                best_bound = objective_value
+
+        logger.info(f"HiGHS finished with status: {highs.modelStatusToString(model_status)}")
+        first_incumbent_ms = int((incumbent_times[0] - start) * 1000) if incumbent_times else None
+        return SolveResult(status, values, objective_value, sol_status, solver=self.name,
+                           time_to_first_incumbent_ms=first_incumbent_ms, best_bound=best_bound)
+
+    def pulp_solver(self, options: SolveOptions) -> Optional[pulp.LpSolver]:
+        """Return pulp's in-process HiGHS interface."""
+        return pulp.HiGHS(msg=False, threads=options.threads,  # In-process, silent mode
+                          timeLimit=options.time_limit, gapRel=options.mip_gap)
+
+
+def _to_highs_lp(model: MatrixModel):
+    """Build a HighsLp that references the model arrays."""
+    lp = highspy.HighsLp()
+    lp.num_col_ = model.num_cols
+    lp.num_row_ = model.num_rows
+    lp.sense_ = highspy.ObjSense.kMaximize
+    lp.col_cost_ = model.objective
+    lp.col_lower_ = np.zeros(model.num_cols)
+    lp.col_upper_ = model.col_upper
+    lp.row_lower_ = np.full(model.num_rows, -highspy.kHighsInf)
+    lp.row_upper_ = model.row_upper
+    lp.integrality_ = [highspy.HighsVarType.kInteger] * model.num_cols
+    lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+    lp.a_matrix_.num_col_ = model.num_cols
+    lp.a_matrix_.num_row_ = model.num_rows
+    lp.a_matrix_.start_ = model.indptr
+    lp.a_matrix_.index_ = model.indices
+    lp.a_matrix_.value_ = model.values
+    return lp
+
+
+def _pulp_status(model_status) -> int:
+    """Translate a HiGHS model status into a pulp status code."""
+    if model_status == highspy.HighsModelStatus.kOptimal:
+        return pulp.LpStatusOptimal
+    if model_status == highspy.HighsModelStatus.kInfeasible:
+        return pulp.LpStatusInfeasible
+    if model_status in (highspy.HighsModelStatus.kUnbounded, highspy.HighsModelStatus.kUnboundedOrInfeasible):
+        return pulp.LpStatusUnbounded
+    return pulp.LpStatusNotSolved
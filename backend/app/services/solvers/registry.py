@@ -0,0 +1,67 @@
+from typing import Dict, List, Tuple
+
+from models.schemas import ConstraintType
+from services.solvers.base import MatrixSolver
+from services.solvers.cbc import CbcSolver
+from services.solvers.cpsat import CpSatSolver
+from services.solvers.greedy import GreedySolver
+from services.solvers.highs import HighsSolver
+from core.settings import settings
+
+# Registered solver backends by name
+SOLVERS: Dict[str, MatrixSolver] = {
+    solver.name: solver for solver in (HighsSolver(), CbcSolver(), CpSatSolver(), GreedySolver())
+}
+
+# Let the policy below choose per instance
+AUTO = "auto"
+
+
+def get_solver(name: str) -> MatrixSolver:
+    """Return the registered solver with the given name."""
+    if name not in SOLVERS:
+        raise ValueError(f"Unknown solver backend: {name}")
+    return SOLVERS[name]
+
+
+def available_solvers() -> List[str]:
+    """Names of the registered solvers usable in this environment."""
+    return [name for name, solver in SOLVERS.items() if solver.is_available()]
+
+
+def select_solver(requested: str, num_columns: int, constraints: List[ConstraintType]) -> Tuple[MatrixSolver, str]:
+    """
+    Pick the solver for one instance.
+
+    An explicitly requested solver is used when it is available. Otherwise the policy
+    routes very large instances to the greedy heuristic, overlap-dominated instances
+    without minute caps (pure packing rows) to CP-SAT, and everything else to HiGHS,
+    with CBC as the fallback that is always present.
+
+    Args:
+        requested: Solver name or "auto"
+        num_columns: Number of eligible employee-shift pairs
+        constraints: Active constraint types
+
+    Returns:
+        Tuple of (solver, human-readable reason for the choice)
+    """
+    prefix = ""
+    if requested != AUTO:
+        solver = get_solver(requested)
+        if solver.is_available():
+            return solver, "requested"
+        prefix = f"{requested} unavailable; "
+
+    if num_columns > settings.greedy_min_columns:
+        return SOLVERS["greedy"], f"{prefix}{num_columns} columns exceed greedy_min_columns"
+
+    if (ConstraintType.NO_OVERLAPPING in constraints
+            and ConstraintType.OVERTIME_LIMITS not in constraints
+            and num_columns <= settings.cpsat_max_columns
+            and SOLVERS["cpsat"].is_available()):
+        return SOLVERS["cpsat"], f"{prefix}packing rows only with {num_columns} columns"
+
+    if SOLVERS["highs"].is_available():
+        return SOLVERS["highs"], f"{prefix}default MIP solver"
+    return SOLVERS["cbc"], f"{prefix}fallback MIP solver"
@@ -0,0 +1,220 @@
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from loguru import logger
+import numpy as np
+import pulp
+
+from models.api_models import ShiftScheduleRequest, SweepResponse, SweepScenario, SweepScenarioResult
+from models.schemas import ConstraintType
+from services.constraint_manager import ConstraintManager
+from services.eligibility import EligibilityMatrix
+from services.matrix_model import MatrixModel
+from services.problem_data import ProblemData
+from services.solvers.base import SolveLimits, SolveOptions
+from services.solvers.registry import get_solver, select_solver
+from core.settings import settings
+
+# Constraint types that remove eligible pairs instead of adding model rows
+COLUMN_FILTERS = (ConstraintType.SKILL_MATCHING, ConstraintType.AVAILABILITY_WINDOWS)
+
+
+class ScenarioSweep:
+    """
+    What-if scenarios of one roster solved on a single compiled model.
+
+    The model is built once to cover every scenario: its columns are the pairs eligible
+    under the column filters every scenario shares, it has an overtime row for every
+    employee whose tightest cap over all scenarios binds, and it has the overlap rows
+    whenever a scenario uses them. Between solves only bounds change: columns excluded
+    by a scenario's own filters get an upper bound of zero, overtime rows take the
+    scenario's caps, and the rows of a deactivated block are relaxed to their row total,
+    which no solution exceeds. Each solve is warm started from the previous scenario's
+    schedule, packed to fit the new bounds.
+    """
+
+    def __init__(self, request: ShiftScheduleRequest, solver_backend: Optional[str] = None):
+        """
+        Args:
+            request: Base request with the roster, constraints and solve limits of every scenario
+            solver_backend: Solver name or "auto" (defaults to the server setting)
+        """
+        self.request = request
+        self.solver_backend = solver_backend or settings.solver_backend
+        self.data = ProblemData(request.employees, request.shifts)
+
+    def run(self, scenarios: List[SweepScenario]) -> SweepResponse:
+        """
+        Solve every scenario in order.
+
+        The base request's time limit covers the whole sweep: each scenario may use an even
+        share of the time still left, so time one scenario leaves unused goes to the rest.
+
+        Raises:
+            ValueError: If a scenario caps the hours of an unknown employee
+        """
+        started = time.perf_counter()
+        constraint_sets = [self._constraints(scenario) for scenario in scenarios]
+        caps = np.array([self._max_minutes(scenario) for scenario in scenarios], dtype=np.int64)
+
+        shared_filters = [c for c in COLUMN_FILTERS if all(c in constraints for constraints in constraint_sets)]
+        eligibility = EligibilityMatrix(self.data, shared_filters)
+        model = self._build_model(eligibility, set().union(*constraint_sets), caps.min(axis=0))
+        base_upper = model.row_upper.copy()
+        row_totals = np.add.reduceat(model.values, model.indptr[:-1]) if model.num_rows else base_upper
+        build_time_ms = int((time.perf_counter() - started) * 1000)
+
+        # One time limit covers the whole sweep; time a scenario leaves unused passes to the next
+        limits = SolveLimits.from_request(self.request.time_limit_ms or settings.solver_time_limit_ms,
+                                          self.request.mip_gap)
+        filter_masks: Dict[ConstraintType, np.ndarray] = {}
+        values = self._current_assignment_values(eligibility)
+        results = []
+        for k, (scenario, constraints, scenario_caps) in enumerate(zip(scenarios, constraint_sets, caps)):
+            model.col_upper = self._column_bounds(eligibility, constraints, shared_filters, filter_masks)
+            model.row_upper = self._row_bounds(model, base_upper, row_totals, constraints, scenario_caps)
+            solve_started = time.perf_counter()
+            values, optimal = self._solve(model, constraints, values, limits.share(len(scenarios) - k))
+            results.append(self._scenario_result(scenario.name or f"scenario {k + 1}", model, values, optimal,
+                                                 int((time.perf_counter() - solve_started) * 1000)))
+            logger.info(f"Sweep {results[-1].name}: {results[-1].objective_value:.0f} assigned, "
+                        f"{results[-1].overtime_hours:.1f} overtime hours")
+
+        return SweepResponse(
+            scenarios=results,
+            num_columns=model.num_cols,
+            num_rows=model.num_rows,
+            build_time_ms=build_time_ms,
+            total_time_ms=int((time.perf_counter() - started) * 1000)
+        )
+
+    def _constraints(self, scenario: SweepScenario) -> Set[ConstraintType]:
+        """Constraint types active in a scenario."""
+        return (set(self.request.constraints) - set(scenario.remove_constraints)) | set(scenario.add_constraints)
+
+    def _max_minutes(self, scenario: SweepScenario) -> np.ndarray:
+        """Hour caps of every employee in a scenario, in minutes."""
+        minutes = self.data.max_minutes.copy()
+        if scenario.max_hours is not None:
+            minutes[:] = scenario.max_hours * 60
+        for employee_id, hours in scenario.employee_max_hours.items():
+            if employee_id not in self.data.employee_index:
+                raise ValueError(f"Unknown employee ID: {employee_id}")
+            minutes[self.data.employee_index[employee_id]] = hours * 60
+        return minutes
+
+    def _build_model(self, eligibility: EligibilityMatrix, constraints: Set[ConstraintType],
+                     tightest_caps: np.ndarray) -> MatrixModel:
+        """
+        Build the shared model, pruning overtime rows only if they cannot bind under any scenario's caps.
+
+        An overtime row is dropped when all eligible shifts of its employee fit the cap, so
+        the rows are pruned against the tightest cap of every employee; looser scenarios
+        only raise the right-hand sides.
+        """
+        data = self.data.subset(np.arange(self.data.num_employees), np.arange(self.data.num_shifts))
+        data.max_minutes = tightest_caps
+        overlap_cliques = (ConstraintManager(data, eligibility).get_overlap_cliques()
+                           if ConstraintType.NO_OVERLAPPING in constraints else [])
+        return MatrixModel.build(data, eligibility, list(constraints), overlap_cliques)
+
+    def _column_bounds(self,
+                       eligibility: EligibilityMatrix,
+                       constraints: Set[ConstraintType],
+                       shared_filters: List[ConstraintType],
+                       filter_masks: Dict[ConstraintType, np.ndarray]) -> np.ndarray:
+        """Upper bound of every column: zero for pairs the scenario's own column filters exclude."""
+        rows, cols = eligibility.coo()
+        allowed = np.ones(len(rows), dtype=bool)
+        for constraint in COLUMN_FILTERS:
+            if constraint in constraints and constraint not in shared_filters:
+                if constraint not in filter_masks:
+                    mask = eligibility.skill_mask if constraint == ConstraintType.SKILL_MATCHING \
+                        else eligibility.availability_mask
+                    filter_masks[constraint] = mask(rows, cols)
+                allowed &= filter_masks[constraint]
+        return allowed.astype(np.float64)
+
+    def _row_bounds(self,
+                    model: MatrixModel,
+                    base_upper: np.ndarray,
+                    row_totals: np.ndarray,
+                    constraints: Set[ConstraintType],
+                    caps: np.ndarray) -> np.ndarray:
+        """Right-hand sides of a scenario: its hour caps, with the rows of inactive blocks relaxed."""
+        upper = base_upper.copy()
+        if "overtime_limits" in model.blocks:
+            first, last = model.blocks["overtime_limits"]
+            if ConstraintType.OVERTIME_LIMITS in constraints:
+                upper[first:last] = caps[model.col_employee[model.indices[model.indptr[first:last]]]]
+            else:
+                upper[first:last] = row_totals[first:last]
+        if "no_overlapping" in model.blocks and ConstraintType.NO_OVERLAPPING not in constraints:
+            first, last = model.blocks["no_overlapping"]
+            upper[first:last] = row_totals[first:last]
+        return upper
+
+    def _solve(self,
+               model: MatrixModel,
+               constraints: Set[ConstraintType],
+               previous: Optional[np.ndarray],
+               limits: SolveLimits) -> Tuple[np.ndarray, bool]:
+        """Solve the model under the current bounds and limits, warm started from the previous values."""
+        solver, reason = select_solver(self.solver_backend, model.num_cols, list(constraints))
+        warm_start = model.pack(np.flatnonzero(previous > 0.5)) if previous is not None else None
+
+        repaired = None
+        if limits.deadline is not None and solver.capabilities.exact and solver.capabilities.warm_start:
+            warm_start = repaired = get_solver("greedy").solve(model, SolveOptions(warm_start=warm_start)).values
+        result = solver.solve(model, limits.options(settings.solver_threads, warm_start))
+
+        if result.status != pulp.LpStatusOptimal:
+            # Stopped without an incumbent: fall back to the previous schedule, repaired greedily to fit the bounds
+            if repaired is None:
+                repaired = get_solver("greedy").solve(model, SolveOptions(warm_start=warm_start)).values
+            return repaired, False
+        return result.values, result.proven_optimal
+
+    def _current_assignment_values(self, eligibility: EligibilityMatrix) -> Optional[np.ndarray]:
+        """Column values of the base request's current assignments, the warm start of the first scenario."""
+        pairs = [
+            (self.data.employee_index[a.employee_id], self.data.shift_index[a.shift_id])
+            for a in self.request.current_assignments
+            if a.employee_id in self.data.employee_index and a.shift_id in self.data.shift_index
+        ]
+        if not pairs:
+            return None
+        emp_idx, shift_idx = np.array(pairs, dtype=np.int64).T
+        columns = eligibility.pair_columns(emp_idx, shift_idx)
+        values = np.zeros(len(eligibility.rows))
+        values[columns[columns >= 0]] = 1.0
+        return values
+
+    def _scenario_result(self, name: str, model: MatrixModel, values: np.ndarray, optimal: bool,
+                         solve_time_ms: int) -> SweepScenarioResult:
+        """Summarize the schedule of one scenario, measuring overtime against the base request's caps."""
+        selected = values > 0.5
+        shifts = model.col_shift[selected]
+        minutes = np.bincount(model.col_employee[selected], weights=self.data.duration[shifts],
+                              minlength=self.data.num_employees)
+        return SweepScenarioResult(
+            name=name,
+            objective_value=float(model.objective @ values),
+            unassigned_shifts=self.data.num_shifts - len(np.unique(shifts)),
+            overtime_hours=float(np.maximum(minutes - self.data.max_minutes, 0).sum() / 60),
+            optimal=optimal,
+            solve_time_ms=solve_time_ms
+        )
+
+
+def validate_scenarios(request: ShiftScheduleRequest, scenarios: List[SweepScenario]) -> None:
+    """
+    Check that every scenario only caps employees of the base request.
+
+    Raises:
+        ValueError: If a scenario caps the hours of an unknown employee
+    """
+    employee_ids = {employee.id for employee in request.employees}
+    for scenario in scenarios:
+        for employee_id in scenario.employee_max_hours:
+            if employee_id not in employee_ids:
+                raise ValueError(f"Unknown employee ID: {employee_id}")
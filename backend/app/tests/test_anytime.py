@@ -0,0 +1,65 @@
+import numpy as np
+import pulp
+import pytest
+from pydantic import ValidationError
+
+from services.shift_scheduler import ShiftScheduler
+from services.solvers.base import proves_optimality
+from services.solvers.cbc import read_cbc_solution, write_cbc_mip_start
+
+from .test_utils import ALL_CONSTRAINTS, assert_feasible, random_request
+
+
+def test_stopped_cbc_solution_must_be_integral(tmp_path):
+    path = str(tmp_path / "solution.sol")
+
+    write_cbc_mip_start(path, np.array([1.0, 0.0, 1.0]))
+    status, sol_status, values = read_cbc_solution(path, 3)
+    assert (status, sol_status) == (pulp.LpStatusOptimal, pulp.LpSolutionIntegerFeasible)
+    assert values.tolist() == [1.0, 0.0, 1.0]
+
+    # Stopped while solving the LP relaxation: the values are not a schedule
+    write_cbc_mip_start(path, np.array([0.5, 0.0, 1.0]))
+    status, _, _ = read_cbc_solution(path, 3)
+    assert status == pulp.LpStatusNotSolved
+
+
+def test_integral_objective_bounds():
+    assert proves_optimality(12.0, 12.7)
+    assert not proves_optimality(12.0, 13.0)
+    assert not proves_optimality(12.0, None)
+
+
+@pytest.mark.parametrize("solver_backend", ["cbc", "highs"])
+@pytest.mark.parametrize("model_backend", ["matrix", "pulp"])
+def test_time_limited_solve_returns_incumbent_and_bound(model_backend, solver_backend):
+    request = random_request(91, ALL_CONSTRAINTS).model_copy(update={"time_limit_ms": 1})
+    response = ShiftScheduler(model_backend=model_backend, solver_backend=solver_backend,
+                              decompose=False).schedule(request)
+
+    assert response.success
+    assert_feasible(request, response)
+    assert response.metrics.objective_value <= response.metrics.best_bound
+    assert response.metrics.gap == pytest.approx(
+        (response.metrics.best_bound - response.metrics.objective_value) / response.metrics.best_bound
+    )
+
+
+@pytest.mark.parametrize("solver_backend", ["cbc", "highs"])
+def test_mip_gap_bounds_the_reported_gap(solver_backend):
+    request = random_request(92, ALL_CONSTRAINTS)
+    optimal = ShiftScheduler(solver_backend=solver_backend).schedule(request)
+    relaxed = ShiftScheduler(solver_backend=solver_backend).schedule(request.model_copy(update={"mip_gap": 0.2}))
+
+    assert relaxed.success
+    assert_feasible(request, relaxed)
+    assert relaxed.metrics.gap <= 0.2 + 1e-9
+    assert relaxed.metrics.objective_value >= 0.8 * optimal.metrics.objective_value - 1e-9
+
+
+def test_limits_are_validated():
+    request = random_request(93, ALL_CONSTRAINTS)
+    with pytest.raises(ValidationError):
+        type(request)(**{**request.model_dump(), "mip_gap": 1.5})
+    with pytest.raises(ValidationError):
+        type(request)(**{**request.model_dump(), "time_limit_ms": 0})
@@ -0,0 +1,75 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from main import app
+from services.job_manager import JobManager
+from services.shift_scheduler import ShiftScheduler
+from core.settings import settings
+
+from .test_job_manager import _sleeping_worker
+from .test_utils import ALL_CONSTRAINTS, random_request
+
+
+def _batch_body(seeds, invalid_index=None):
+    requests = [random_request(seed, ALL_CONSTRAINTS).model_dump(mode="json") for seed in seeds]
+    if invalid_index is not None:
+        requests[invalid_index]["period"] = "2025-07-14/2025-07-07"
+    return requests
+
+
+def test_batch_returns_items_in_order_with_per_item_errors(monkeypatch):
+    monkeypatch.setattr(settings, "result_cache_enabled", False)
+    monkeypatch.setattr(settings, "batch_max_parallel", 3)
+    seeds = (131, 132, 133, 134)
+    response = TestClient(app).post("/api/schedule/optimize/batch",
+                                    json={"requests": _batch_body(seeds, invalid_index=2), "max_parallel": 2})
+    assert response.status_code == 200
+    body = response.json()
+
+    assert [item["index"] for item in body["items"]] == [0, 1, 2, 3]
+    assert body["items"][2]["result"] is None
+    assert body["items"][2]["error"].startswith("Invalid request data")
+    for seed, item in zip(seeds, body["items"]):
+        if item["error"] is None:
+            expected = ShiftScheduler().schedule(random_request(seed, ALL_CONSTRAINTS))
+            assert item["result"]["metrics"]["objective_value"] == expected.metrics.objective_value
+
+    assert (body["succeeded"], body["failed"]) == (3, 1)
+    assert body["max_parallel"] == 2
+    assert body["total_time_ms"] >= 0
+    assert body["throughput_per_second"] > 0
+
+
+def test_streamed_batch_sends_items_as_they_finish_then_totals(monkeypatch):
+    monkeypatch.setattr(settings, "result_cache_enabled", False)
+    response = TestClient(app).post("/api/schedule/optimize/batch?stream=true",
+                                    json={"requests": _batch_body((135, 136, 137))})
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(line["index"] for line in lines[:-1]) == [0, 1, 2]
+    assert all(line["result"]["success"] for line in lines[:-1])
+    assert lines[-1]["succeeded"] == 3
+
+
+def test_batch_parallelism_is_capped_by_the_core_budget(monkeypatch):
+    manager = JobManager(max_workers=4, retention_seconds=60, max_queued=0, worker=_sleeping_worker)
+    monkeypatch.setattr("routers.schedule.job_manager", manager)
+    monkeypatch.setattr(settings, "result_cache_enabled", False)
+    monkeypatch.setattr(settings, "batch_max_parallel", 1)
+    for _ in range(4):
+        manager.submit(random_request(138, ALL_CONSTRAINTS))
+
+    # Every worker is busy and nothing may queue: each item fails fast instead of waiting
+    body = TestClient(app).post("/api/schedule/optimize/batch",
+                                json={"requests": _batch_body((139, 140)), "max_parallel": 8}).json()
+    assert body["max_parallel"] == 1
+    assert [item["error"] for item in body["items"]] == ["Too many optimization requests, please retry later"] * 2
+    manager.shutdown()
+
+
+def test_oversized_batch_is_rejected(monkeypatch):
+    monkeypatch.setattr(settings, "batch_max_items", 1)
+    response = TestClient(app).post("/api/schedule/optimize/batch", json={"requests": _batch_body((141, 142))})
+    assert response.status_code == 400
@@ -0,0 +1,94 @@
+import copy
+import json
+
+import pytest
+
+from benchmarks.__main__ import main
+from benchmarks.generator import generate_request
+from benchmarks.runner import PHASES, compare_results, run_case
+from models.schemas import ConstraintType
+
+
+def test_generator_is_seeded():
+    first = generate_request(20, 60, skills=3, overlap_density=0.8, seed=7)
+    assert first == generate_request(20, 60, skills=3, overlap_density=0.8, seed=7)
+    assert first != generate_request(20, 60, skills=3, overlap_density=0.8, seed=8)
+    assert (len(first.employees), len(first.shifts)) == (20, 60)
+    assert {shift.required_skill for shift in first.shifts} <= {"skill0", "skill1", "skill2"}
+
+    subset = generate_request(5, 5, constraints=[ConstraintType.SKILL_MATCHING])
+    assert subset.constraints == [ConstraintType.SKILL_MATCHING]
+
+
+def test_run_case_times_every_phase():
+    result = run_case(10, 10, repeat=2)
+    assert result["name"] == "10x10"
+    assert set(result["phases_ms"]) == set(PHASES)
+    assert all(value >= 0 for value in result["phases_ms"].values())
+    assert result["total_ms"] >= result["phases_ms"]["solve"]
+    assert result["model"]["columns"] > 0
+    assert result["objective_value"] > 0
+    assert (result["optimal"], result["hit_limit"]) == (True, False)
+
+
+def _suite(**case):
+    result = {
+        "name": "10x10", "employees": 10, "shifts": 10, "skills": 4, "overlap_density": 0.5,
+        "constraints": ["skill_matching"], "seed": 0, "mode": "optimal", "time_limit_ms": 60000,
+        "phases_ms": {"validate": 1.0, "build": 100.0, "solve": 2.0, "extract": 1.0},
+        "total_ms": 104.0, "objective_value": 8.0, "gap": 0.0, "optimal": True, "hit_limit": False,
+    }
+    result.update(case)
+    return {"meta": {"model_backend": "matrix", "solver_backend": "auto"}, "results": [result]}
+
+
+def test_compare_flags_regressions_above_noise(tmp_path):
+    baseline = _suite()
+    current = copy.deepcopy(baseline)
+    current["results"][0]["phases_ms"].update(build=150.0, solve=6.0)
+    current["results"][0]["total_ms"] = 158.0
+
+    flagged = {(f["case"], f["metric"]) for f in compare_results(baseline, current) if f["regression"]}
+    assert flagged == {("10x10", "build"), ("10x10", "total")}
+
+    current["results"][0]["objective_value"] = 7.0
+    assert ("10x10", "objective_value") in {
+        (f["case"], f["metric"]) for f in compare_results(baseline, current) if f["regression"]}
+
+    (tmp_path / "baseline.json").write_text(json.dumps(baseline))
+    (tmp_path / "current.json").write_text(json.dumps(current))
+    assert main(["compare", str(tmp_path / "baseline.json"), str(tmp_path / "baseline.json")]) == 0
+    assert main(["compare", str(tmp_path / "baseline.json"), str(tmp_path / "current.json")]) == 1
+
+
+def test_compare_only_matches_cases_with_the_same_parameters(tmp_path):
+    baseline = _suite(total_ms=60037.0)
+    other_constraints = _suite(constraints=[], total_ms=2.6)
+    other_constraints["results"] += _suite(seed=1)["results"] + _suite(mode="fast")["results"]
+
+    findings = compare_results(baseline, other_constraints)
+    assert [f["mismatch"] for f in findings] == [True, True, True]
+    assert not any(f["regression"] for f in findings)
+
+    (tmp_path / "baseline.json").write_text(json.dumps(baseline))
+    (tmp_path / "current.json").write_text(json.dumps(other_constraints))
+    assert main(["compare", str(tmp_path / "baseline.json"), str(tmp_path / "current.json")]) == 1
+
+    other_backend = _suite()
+    other_backend["meta"]["solver_backend"] = "cbc"
+    with pytest.raises(ValueError):
+        compare_results(baseline, other_backend)
+    (tmp_path / "current.json").write_text(json.dumps(other_backend))
+    assert main(["compare", str(tmp_path / "baseline.json"), str(tmp_path / "current.json")]) == 2
+
+
+def test_compare_uses_the_gap_of_cases_that_hit_the_time_limit():
+    baseline = _suite(total_ms=60000.0, gap=0.02, optimal=False, hit_limit=True)
+    slower = _suite(total_ms=60500.0, gap=0.025, optimal=False, hit_limit=True)
+
+    findings = compare_results(baseline, slower)
+    assert {f["metric"] for f in findings} == {"gap", "objective_value"}
+    assert not any(f["regression"] for f in findings)
+
+    worse = _suite(total_ms=60000.0, gap=0.1, optimal=False, hit_limit=True)
+    assert {f["metric"] for f in compare_results(baseline, worse) if f["regression"]} == {"gap"}
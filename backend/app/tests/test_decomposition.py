@@ -0,0 +1,97 @@
+import multiprocessing
+
+import numpy as np
+
+from services import decomposition
+from services.decomposition import connected_components, find_components, use_job_cores
+from services.eligibility import EligibilityMatrix
+from services.problem_data import ProblemData
+from services.job_manager import JobManager, _start_worker
+from services.shift_scheduler import ShiftScheduler
+from models.api_models import ShiftScheduleRequest
+from core.settings import settings
+
+from .test_job_manager import _wait
+from .test_utils import ALL_CONSTRAINTS, random_request
+
+
+def _departments_request(seed: int, departments: int = 4) -> ShiftScheduleRequest:
+    """Departments with disjoint skills, so skill matching splits the roster into components."""
+    parts = [
+        random_request(seed * departments + d, ALL_CONSTRAINTS, num_employees=6, num_shifts=20,
+                       skills=(f"dept{d}_a", f"dept{d}_b"), max_hours=(16, 24, 40), availability_offset=(0, 0),
+                       availability_hours=(168, 168), shift_offset=(0, 150), id_prefix=f"d{d}_")
+        for d in range(departments)
+    ]
+    return parts[0].model_copy(update={
+        "employees": [employee for part in parts for employee in part.employees],
+        "shifts": [shift for part in parts for shift in part.shifts],
+    })
+
+
+def test_connected_components_of_bipartite_graph():
+    # Employees 0-1 share shift 0, employee 2 works shifts 2-3, shift 1 and employee 3 are isolated
+    rows = np.array([0, 1, 2, 2])
+    cols = np.array([0, 0, 2, 3])
+    employee_labels, shift_labels = connected_components(4, 4, rows, cols)
+
+    assert employee_labels.tolist() == [0, 0, 1, -1]
+    assert shift_labels.tolist() == [0, -1, 1, 1]
+
+
+def test_components_partition_the_eligible_pairs():
+    request = _departments_request(1)
+    eligibility = EligibilityMatrix(ProblemData(request.employees, request.shifts), request.constraints)
+    components = find_components(eligibility)
+
+    assert len(components) >= 4
+    assert sum(component.num_pairs for component in components) == len(eligibility.rows)
+    assert [c.num_pairs for c in components] == sorted((c.num_pairs for c in components), reverse=True)
+
+
+def test_decomposed_solve_matches_single_model():
+    request = _departments_request(2)
+    decomposed = ShiftScheduler(solver_backend="cbc").schedule(request)
+    single = ShiftScheduler(solver_backend="cbc", decompose=False).schedule(request)
+
+    assert decomposed.success and single.success
+    assert decomposed.metrics.objective_value == single.metrics.objective_value
+    assert len(decomposed.metrics.components) >= 4
+    assert sum(c.objective_value for c in decomposed.metrics.components) == decomposed.metrics.objective_value
+    assert not single.metrics.components
+    assert len(decomposed.assignments) + len(decomposed.unassigned_shifts) == len(request.shifts)
+
+
+def test_components_are_solved_on_the_process_pool(monkeypatch):
+    monkeypatch.setattr(settings, "decomposition_min_pairs", 0)
+    request = _departments_request(3)
+
+    pooled = ShiftScheduler(solver_backend="cbc").schedule(request)
+    single = ShiftScheduler(solver_backend="cbc", decompose=False).schedule(request)
+
+    assert pooled.success
+    assert pooled.metrics.objective_value == single.metrics.objective_value
+    assert pooled.metrics.solver_reason.startswith("decomposed into")
+
+
+def _decomposing_worker(request_json, sender):
+    # Report what a job worker starts for a decomposition that would use the process pool elsewhere
+    _start_worker()
+    settings.decomposition_min_pairs = 0
+    request = _departments_request(3)
+    objectives = []
+    for cores in (1, 2):
+        use_job_cores(cores)
+        response = ShiftScheduler(solver_backend="cbc").schedule(request)
+        objectives.append(response.metrics.objective_value)
+    sender.send(("error", repr((objectives, decomposition._process_pool is None,
+                                len(multiprocessing.active_children())))))
+
+
+def test_decomposition_in_a_job_stays_within_the_worker_budget():
+    manager = JobManager(max_workers=1, retention_seconds=60, worker=_decomposing_worker)
+    job = _wait(manager.submit(_departments_request(3)))
+
+    # Same schedule value as one model, without the process pool or any other child process
+    expected = ShiftScheduler(solver_backend="cbc", decompose=False).schedule(_departments_request(3))
+    assert job.error == repr(([expected.metrics.objective_value] * 2, True, 0))
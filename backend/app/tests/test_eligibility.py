@@ -0,0 +1,109 @@
+from datetime import datetime
+
+import numpy as np
+
+from services.availability import AvailabilityCalendar
+from services.eligibility import EligibilityMatrix
+from services.problem_data import ProblemData
+from services.shift_scheduler import ShiftScheduler
+from models.schemas import Availability, ConstraintType
+from models.api_models import ShiftScheduleRequest
+
+from .test_utils import print_metrics, create_employee, create_shift, random_request
+
+
+def _random_instance(seed: int, num_employees: int, num_shifts: int, num_skills: int):
+    request = random_request(seed, [], num_employees=num_employees, num_shifts=num_shifts,
+                             skills=[f"skill{k}" for k in range(num_skills)], skills_per_employee=(1, 3),
+                             max_hours=(40,), availability_offset=(0, 48), availability_hours=(4, 48),
+                             shift_hours=(1, 10))
+    return request.employees, request.shifts
+
+
+def test_matrix_matches_pairwise_checks():
+    # More than 64 skills exercises multi-word bitmasks
+    employees, shifts = _random_instance(7, 30, 80, 70)
+    constraints = [ConstraintType.SKILL_MATCHING, ConstraintType.AVAILABILITY_WINDOWS]
+    matrix = EligibilityMatrix(ProblemData(employees, shifts), constraints).dense()
+
+    for i, emp in enumerate(employees):
+        for j, shift in enumerate(shifts):
+            window = emp.availability[0]
+            expected = (shift.required_skill in emp.skills
+                        and window.start <= shift.start_time
+                        and shift.end_time <= window.end)
+            assert matrix[i, j] == expected
+
+
+def test_inactive_filters_keep_all_pairs():
+    employees, shifts = _random_instance(3, 5, 12, 4)
+    eligibility = EligibilityMatrix(ProblemData(employees, shifts), [ConstraintType.OVERTIME_LIMITS])
+    assert eligibility.dense().all()
+    assert len(eligibility.rows) == len(employees) * len(shifts)
+
+
+def test_coo_is_blocked_consistently(monkeypatch):
+    employees, shifts = _random_instance(11, 25, 40, 6)
+    constraints = [ConstraintType.SKILL_MATCHING, ConstraintType.AVAILABILITY_WINDOWS]
+    full = EligibilityMatrix(ProblemData(employees, shifts), constraints)
+
+    # Force one employee per block and check the sparse result is unchanged
+    monkeypatch.setattr("services.eligibility.BLOCK_CELLS", 1)
+    blocked = EligibilityMatrix(ProblemData(employees, shifts), constraints)
+    assert np.array_equal(full.rows, blocked.rows)
+    assert np.array_equal(full.cols, blocked.cols)
+
+
+def test_calendar_merges_windows_into_runs():
+    calendar = AvailabilityCalendar([(10, 20), (15, 30), (30, 40), (50, 60), (-5, 2), (95, 120)], 100)
+    assert calendar.runs() == [(0, 2), (10, 40), (50, 60), (95, 100)]
+    assert calendar.covers(10, 40)
+    assert calendar.covers(52, 58)
+    assert not calendar.covers(38, 52)
+    assert not calendar.covers(95, 101)
+
+
+def test_multiple_availability_windows():
+    """One employee with a morning and an evening window covers shifts in both"""
+    base_datetime = datetime(2025, 7, 7, 0, 0)
+    employee = create_employee("emp1", ["nursing"], 40, 8, 4, base_datetime=base_datetime)
+    employee.availability.append(Availability(
+        start=datetime(2025, 7, 7, 18, 0),
+        end=datetime(2025, 7, 7, 23, 0)
+    ))
+    shifts = [
+        create_shift("morning", "nursing", 8, 4, base_datetime=base_datetime),
+        create_shift("noon", "nursing", 12, 4, base_datetime=base_datetime),
+        create_shift("evening", "nursing", 18, 4, base_datetime=base_datetime)
+    ]
+    constraints = [ConstraintType.SKILL_MATCHING, ConstraintType.AVAILABILITY_WINDOWS]
+
+    eligibility = EligibilityMatrix(ProblemData([employee], shifts), constraints)
+    assert eligibility.as_dict() == {"emp1": ["morning", "evening"]}
+    assert eligibility.is_available(0, 2)
+    assert not eligibility.is_available(0, 1)
+
+    response = ShiftScheduler().schedule(ShiftScheduleRequest(
+        period="2025-07-07/2025-07-14",
+        employees=[employee],
+        shifts=shifts,
+        constraints=constraints
+    ))
+    print_metrics(response)
+    assert response.success
+    assert response.unassigned_shifts == ["noon"]
+
+
+def test_single_window_object_is_accepted():
+    employee = ShiftScheduleRequest.model_validate({
+        "period": "2025-07-07/2025-07-14",
+        "employees": [{
+            "id": "emp1", "name": "Employee 1", "skills": ["nursing"], "max_hours": 40,
+            "availability": {"start": "2025-07-07T08:00:00", "end": "2025-07-07T16:00:00"}
+        }],
+        "shifts": [{
+            "id": "shift1", "role": "Nurse", "required_skill": "nursing",
+            "start_time": "2025-07-07T08:00:00", "end_time": "2025-07-07T12:00:00"
+        }]
+    }).employees[0]
+    assert len(employee.availability) == 1
@@ -0,0 +1,82 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from models.api_models import ScheduleMode, ShiftScheduleRequest
+from models.schemas import ConstraintType
+from services.shift_scheduler import ShiftScheduler
+
+from .test_utils import ALL_CONSTRAINTS, assert_feasible, create_employee, create_shift, random_request
+
+BASE = datetime(2025, 7, 7, 0, 0)
+
+
+@pytest.mark.parametrize("seed,constraints", [
+    (51, ALL_CONSTRAINTS),
+    (52, [ConstraintType.SKILL_MATCHING, ConstraintType.NO_OVERLAPPING]),
+    (53, [ConstraintType.OVERTIME_LIMITS, ConstraintType.AVAILABILITY_WINDOWS]),
+    (54, [])
+])
+def test_fast_mode_is_feasible_and_bounded_by_ilp(seed, constraints):
+    request = random_request(seed, constraints)
+    fast = ShiftScheduler(solver_backend="cbc").schedule(request.model_copy(update={"mode": ScheduleMode.FAST}))
+    optimal = ShiftScheduler(solver_backend="cbc").schedule(request)
+
+    assert fast.success and optimal.success
+    assert_feasible(request, fast)
+    assert fast.metrics.solver == "fast_greedy"
+    assert fast.metrics.objective_value == len(fast.assignments)
+    assert fast.metrics.objective_value <= optimal.metrics.objective_value
+    assert len(fast.assignments) + len(fast.unassigned_shifts) == len(request.shifts)
+
+
+def test_fast_mode_prefers_least_worked_employee():
+    employees = [
+        create_employee("E1", ["cook"], 40, 0, 48, base_datetime=BASE),
+        create_employee("E2", ["cook"], 40, 0, 48, base_datetime=BASE),
+        create_employee("E3", ["waiter"], 40, 0, 48, base_datetime=BASE),
+    ]
+    shifts = [
+        create_shift("S1", "cook", 0, 4, base_datetime=BASE),
+        create_shift("S2", "cook", 2, 4, base_datetime=BASE),  # Overlaps S1
+        create_shift("S3", "cook", 8, 4, base_datetime=BASE),
+        create_shift("S4", "baker", 8, 4, base_datetime=BASE),  # Nobody has the skill
+    ]
+    request = ShiftScheduleRequest(period="2025-07-07/2025-07-08", employees=employees, shifts=shifts,
+                                   constraints=ALL_CONSTRAINTS, mode=ScheduleMode.FAST)
+    response = ShiftScheduler().schedule(request)
+
+    assignments = {a.shift_id: a.employee_id for a in response.assignments}
+    assert assignments == {"S1": "E1", "S2": "E2", "S3": "E1"}
+    assert response.unassigned_shifts == ["S4"]
+
+
+def test_greedy_warm_start_seeds_the_ilp(monkeypatch):
+    monkeypatch.setattr("services.shift_scheduler.settings.greedy_warm_start", True)
+    request = random_request(55, ALL_CONSTRAINTS)
+    seeded = ShiftScheduler(solver_backend="cbc", decompose=False).schedule(request)
+
+    assert seeded.success
+    assert seeded.metrics.warm_start_assignments > 0
+
+
+def test_greedy_warm_start_skips_the_direct_engines(monkeypatch):
+    monkeypatch.setattr("services.shift_scheduler.settings.greedy_warm_start", True)
+    monkeypatch.setattr(ShiftScheduler, "_greedy_assignments", lambda *args: pytest.fail("greedy warm start computed"))
+
+    matching = ShiftScheduler().schedule(random_request(57, [ConstraintType.SKILL_MATCHING]))
+    interval = ShiftScheduler().schedule(random_request(
+        58, [ConstraintType.SKILL_MATCHING, ConstraintType.NO_OVERLAPPING], skill_sets=[["nursing"], ["doctor"]],
+        shift_skills=["nursing", "doctor"]))
+    assert (matching.metrics.solver, interval.metrics.solver) == ("matching", "interval")
+
+
+def test_fast_mode_endpoint():
+    client = TestClient(app)
+    request = random_request(56, ALL_CONSTRAINTS).model_copy(update={"mode": ScheduleMode.FAST})
+
+    response = client.post("/api/schedule/optimize", json=request.model_dump(mode="json"))
+    assert response.status_code == 200
+    assert response.json()["metrics"]["solver"] == "fast_greedy"
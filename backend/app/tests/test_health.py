@@ -0,0 +1,113 @@
+import time
+
+from fastapi.testclient import TestClient
+
+from main import app
+from services.health_monitor import (
+    DEGRADED, HEALTHY, UNHEALTHY, SolverHealthMonitor, check_solver_availability
+)
+from services.job_manager import JobManager
+from services.solvers.base import MatrixSolver
+from services.solvers.registry import SOLVERS
+
+from .test_job_manager import _sleeping_worker
+from .test_utils import ALL_CONSTRAINTS, random_request
+
+
+def _monitor(statuses, now):
+    calls = []
+
+    def check():
+        calls.append(now[0])
+        return statuses[min(len(calls), len(statuses)) - 1]
+
+    return SolverHealthMonitor(interval_seconds=10, check=check, clock=lambda: now[0]), calls
+
+
+def test_self_test_result_is_cached_until_stale():
+    now = [0.0]
+    monitor, calls = _monitor([HEALTHY, DEGRADED], now)
+
+    assert monitor.current()[0] == HEALTHY
+    now[0] = 15.0
+    assert monitor.current()[0] == HEALTHY
+    assert calls == [0.0]
+
+    now[0] = 25.0
+    assert monitor.current()[0] == DEGRADED
+    assert calls == [0.0, 25.0]
+
+
+def test_background_refresh_and_failing_self_test():
+    def broken():
+        raise RuntimeError("solver binary missing")
+
+    monitor = SolverHealthMonitor(interval_seconds=0.05, check=broken)
+    monitor.start()
+    deadline = time.monotonic() + 5
+    while monitor._checked_at is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert monitor.is_running()
+    assert monitor.current()[0] == UNHEALTHY
+    monitor.stop()
+    assert not monitor.is_running()
+
+
+def test_liveness_and_readiness(monkeypatch):
+    monitor = SolverHealthMonitor(interval_seconds=60, check=lambda: HEALTHY)
+    monkeypatch.setattr("routers.health.solver_health", monitor)
+    client = TestClient(app)
+
+    assert client.get("/api/health/live").json()["status"] == "alive"
+    health = client.get("/api/health").json()
+    assert health["status"] == "healthy"
+    assert health["solver_checked_at"] is not None
+
+    ready = client.get("/api/health/ready")
+    assert ready.status_code == 200
+    body = ready.json()
+    assert body["status"] == "ready"
+    assert body["solver"] == HEALTHY
+    assert 0 <= body["saturation"] <= 1
+    assert not body["queue_full"]
+
+
+def test_not_ready_when_queue_is_full_or_solver_fails(monkeypatch):
+    manager = JobManager(max_workers=1, retention_seconds=60, max_queued=0, worker=_sleeping_worker)
+    monkeypatch.setattr("routers.health.job_manager", manager)
+    monkeypatch.setattr("routers.health.solver_health", SolverHealthMonitor(60, check=lambda: HEALTHY))
+    client = TestClient(app)
+    manager.submit(random_request(161, ALL_CONSTRAINTS))
+
+    full = client.get("/api/health/ready")
+    assert full.status_code == 503
+    assert (full.json()["saturation"], full.json()["queue_full"]) == (1.0, True)
+    manager.shutdown()
+
+    monkeypatch.setattr("routers.health.solver_health", SolverHealthMonitor(60, check=lambda: DEGRADED))
+    degraded = client.get("/api/health/ready")
+    assert degraded.status_code == 503
+    assert degraded.json()["solver"] == DEGRADED
+    assert client.get("/api/health").json()["status"] == "degraded"
+
+
+class _CrashingSolver(MatrixSolver):
+    name = "highs"
+
+    def solve(self, model, options):
+        raise RuntimeError("solver library failed to load")
+
+
+def test_self_test_uses_the_solver_auto_selects(monkeypatch):
+    assert check_solver_availability("auto") == HEALTHY
+
+    # Under "auto" plain MIP instances go to HiGHS, so a broken HiGHS fails the self-test while CBC passes
+    monkeypatch.setitem(SOLVERS, "highs", _CrashingSolver())
+    assert check_solver_availability("auto") == UNHEALTHY
+    assert check_solver_availability("cbc") == HEALTHY
+
+    # A configured solver that is unavailable falls back to a working one
+    monkeypatch.setattr(SOLVERS["cpsat"], "is_available", lambda: False)
+    assert check_solver_availability("cpsat") == UNHEALTHY
+    monkeypatch.setitem(SOLVERS, "highs", SOLVERS["cbc"])
+    assert check_solver_availability("cpsat") == DEGRADED
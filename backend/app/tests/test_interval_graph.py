@@ -0,0 +1,68 @@
+import random
+from datetime import datetime
+from itertools import combinations
+
+from services.interval_graph import find_maximal_cliques
+from services.shift_scheduler import ShiftScheduler
+from models.schemas import ConstraintType
+from models.api_models import ShiftScheduleRequest
+
+from .test_utils import print_metrics, create_employee, create_shift
+
+
+def _overlaps(a, b) -> bool:
+    return a[1] < b[2] and b[1] < a[2]
+
+
+def test_touching_intervals_do_not_overlap():
+    intervals = [("a", 0, 4), ("b", 4, 8), ("c", 8, 12)]
+    assert find_maximal_cliques(intervals) == []
+
+
+def test_chain_produces_pairwise_cliques():
+    intervals = [("a", 0, 4), ("b", 3, 7), ("c", 6, 10)]
+    assert find_maximal_cliques(intervals) == [["a", "b"], ["b", "c"]]
+
+
+def test_cliques_match_brute_force():
+    rng = random.Random(42)
+    intervals = []
+    for i in range(60):
+        start = rng.randint(0, 100)
+        intervals.append((f"s{i}", start, start + rng.randint(1, 15)))
+
+    cliques = [frozenset(clique) for clique in find_maximal_cliques(intervals)]
+    by_key = {interval[0]: interval for interval in intervals}
+
+    # Every emitted group is a clique and no clique is contained in another
+    for clique in cliques:
+        for a, b in combinations(clique, 2):
+            assert _overlaps(by_key[a], by_key[b])
+        assert not any(clique < other for other in cliques)
+
+    # Every overlapping pair is covered by some clique
+    for a, b in combinations(intervals, 2):
+        if _overlaps(a, b):
+            assert any(a[0] in clique and b[0] in clique for clique in cliques)
+
+
+def test_no_overlapping_does_not_over_constrain_chains():
+    """A-B and B-C overlap but A and C do not, so one employee can work A and C"""
+    scheduler = ShiftScheduler()
+    base_datetime = datetime(2025, 7, 7, 9, 0)
+    employees = [create_employee("emp1", ["nursing"], 40, 0, 24, base_datetime=base_datetime)]
+    shifts = [
+        create_shift("shiftA", "nursing", 0, 4, base_datetime=base_datetime),
+        create_shift("shiftB", "nursing", 3, 4, base_datetime=base_datetime),
+        create_shift("shiftC", "nursing", 6, 4, base_datetime=base_datetime)
+    ]
+    request = ShiftScheduleRequest(
+        period="2025-07-07/2025-07-14",
+        employees=employees,
+        shifts=shifts,
+        constraints=[ConstraintType.SKILL_MATCHING, ConstraintType.NO_OVERLAPPING]
+    )
+    response = scheduler.schedule(request)
+    print_metrics(response)
+    assert response.success
+    assert sorted(a.shift_id for a in response.assignments) == ["shiftA", "shiftC"]
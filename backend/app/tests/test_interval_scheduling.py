@@ -0,0 +1,82 @@
+import itertools
+import random
+from datetime import datetime
+
+import pytest
+
+from models.api_models import ShiftScheduleRequest
+from models.schemas import ConstraintType
+from services.interval_scheduling import machine_pools, schedule_intervals
+from services.problem_data import ProblemData
+from services.shift_scheduler import ShiftScheduler
+
+from .test_utils import assert_feasible, random_request
+
+BASE = datetime(2025, 7, 7, 0, 0)
+SKILL_NO_OVERLAP = [ConstraintType.SKILL_MATCHING, ConstraintType.NO_OVERLAPPING]
+
+
+def _pooled_request(seed: int, constraints, skill_sets) -> ShiftScheduleRequest:
+    skills = sorted({skill for skill_set in skill_sets for skill in skill_set}) + ["unknown"]
+    return random_request(seed, constraints, num_employees=8, num_shifts=60, skill_sets=skill_sets,
+                          shift_skills=skills, max_hours=(8,), availability_offset=(0, 0),
+                          availability_hours=(96, 96), shift_offset=(0, 40), shift_hours=(2, 10), base_datetime=BASE)
+
+
+def _best_by_brute_force(starts, ends, num_machines) -> int:
+    best = 0
+    for assignment in itertools.product(range(-1, num_machines), repeat=len(starts)):
+        machines = [[] for _ in range(num_machines)]
+        for k, machine in enumerate(assignment):
+            if machine >= 0:
+                machines[machine].append((starts[k], ends[k]))
+        if all(a[1] <= b[0] for intervals in machines for a, b in zip(sorted(intervals), sorted(intervals)[1:])):
+            best = max(best, sum(machine >= 0 for machine in assignment))
+    return best
+
+
+def test_schedule_intervals_is_optimal():
+    rng = random.Random(7)
+    for _ in range(40):
+        starts = [rng.randint(0, 10) for _ in range(6)]
+        ends = [start + rng.randint(1, 6) for start in starts]
+        num_machines = rng.randint(1, 2)
+        selected = schedule_intervals(starts, ends, num_machines)
+        assert len(selected) == _best_by_brute_force(starts, ends, num_machines)
+
+
+def test_machine_pools_require_equal_or_disjoint_skill_sets():
+    separable = _pooled_request(71, SKILL_NO_OVERLAP, [["cook", "baker"], ["waiter"]])
+    data = ProblemData(separable.employees, separable.shifts)
+    pools = machine_pools(data, check_skills=True)
+    assert pools is not None and len(pools) == 2
+    assert sum(len(shifts) for _, shifts in pools) == sum(s.required_skill != "unknown" for s in separable.shifts)
+
+    overlapping = _pooled_request(72, SKILL_NO_OVERLAP, [["cook", "baker"], ["cook"]])
+    data = ProblemData(overlapping.employees, overlapping.shifts)
+    assert machine_pools(data, check_skills=True) is None
+
+
+@pytest.mark.parametrize("seed,constraints,skill_sets", [
+    (73, SKILL_NO_OVERLAP, [["cook"], ["waiter"], ["baker"]]),
+    (74, SKILL_NO_OVERLAP, [["cook", "baker"], ["waiter"]]),
+    (75, [ConstraintType.NO_OVERLAPPING], [["cook"], ["cook", "waiter"]]),
+])
+def test_interval_engine_matches_ilp(seed, constraints, skill_sets):
+    request = _pooled_request(seed, constraints, skill_sets)
+    interval = ShiftScheduler(solver_backend="auto").schedule(request)
+    ilp = ShiftScheduler(solver_backend="cbc").schedule(request)
+
+    assert interval.success and ilp.success
+    assert interval.metrics.solver == "interval"
+    assert interval.message == "Optimization completed successfully"
+    assert_feasible(request, interval)
+    assert interval.metrics.objective_value == ilp.metrics.objective_value
+
+
+def test_overlapping_skill_sets_use_the_ilp():
+    request = _pooled_request(76, SKILL_NO_OVERLAP, [["cook", "baker"], ["cook"]])
+    response = ShiftScheduler(solver_backend="auto").schedule(request)
+
+    assert response.success
+    assert response.metrics.solver != "interval"
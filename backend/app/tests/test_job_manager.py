@@ -0,0 +1,164 @@
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from models.api_models import JobStatus
+from services.job_manager import FINISHED_STATUSES, JobManager, JobNotFoundError, QueueFullError, _limit_resources
+from services.shift_scheduler import ShiftScheduler
+from core.settings import settings
+
+from .test_utils import ALL_CONSTRAINTS, random_request
+
+
+def _sleeping_worker(request_json, sender):
+    time.sleep(60)
+
+
+def _limits_worker(request_json, sender):
+    import resource
+    _limit_resources()
+    sender.send(("error", repr((resource.getrlimit(resource.RLIMIT_AS)[0], resource.getrlimit(resource.RLIMIT_CPU)[0]))))
+
+
+def _wait(job, timeout=60):
+    deadline = time.monotonic() + timeout
+    while job.status not in FINISHED_STATUSES and time.monotonic() < deadline:
+        time.sleep(0.02)
+    return job
+
+
+def test_jobs_are_solved_in_worker_processes():
+    manager = JobManager(max_workers=2, retention_seconds=60)
+    requests = [random_request(seed, ALL_CONSTRAINTS) for seed in (101, 102, 103)]
+    jobs = [manager.submit(request) for request in requests]
+
+    for job, request in zip(jobs, requests):
+        _wait(job)
+        assert job.status == JobStatus.COMPLETED
+        expected = ShiftScheduler().schedule(request)
+        assert job.result.metrics.objective_value == expected.metrics.objective_value
+
+    stats = manager.stats()
+    assert (stats["queued"], stats["running"], stats["completed"]) == (0, 0, 3)
+    assert manager.get(jobs[0].job_id) is jobs[0]
+
+
+def test_cancel_kills_running_job_and_starts_the_next():
+    manager = JobManager(max_workers=1, retention_seconds=60, worker=_sleeping_worker)
+    running = manager.submit(random_request(104, ALL_CONSTRAINTS))
+    queued = manager.submit(random_request(105, ALL_CONSTRAINTS))
+    waiting = manager.submit(random_request(106, ALL_CONSTRAINTS))
+    assert running.status == JobStatus.RUNNING
+    assert (manager.queue_position(queued), manager.queue_position(waiting)) == (0, 1)
+
+    manager.cancel(queued.job_id)
+    assert queued.status == JobStatus.CANCELLED
+    assert manager.queue_position(waiting) == 0
+
+    process = running.process
+    manager.cancel(running.job_id)
+    process.join(timeout=10)
+    assert running.status == JobStatus.CANCELLED
+    assert process.exitcode is not None
+    assert waiting.status == JobStatus.RUNNING
+
+    manager.shutdown()
+    assert manager.stats()["cancelled"] == 3
+
+
+def test_failed_worker_and_expired_jobs():
+    now = [0.0]
+    manager = JobManager(max_workers=1, retention_seconds=10, clock=lambda: now[0], worker=_sleeping_worker)
+    job = manager.submit(random_request(107, ALL_CONSTRAINTS))
+    job.process.kill()
+    _wait(job)
+    assert job.status == JobStatus.FAILED
+    assert "exited" in job.error
+
+    now[0] = 11.0
+    with pytest.raises(JobNotFoundError):
+        manager.get(job.job_id)
+
+
+def test_job_endpoints():
+    client = TestClient(app)
+    request = random_request(108, ALL_CONSTRAINTS)
+
+    submitted = client.post("/api/schedule/jobs", json=request.model_dump(mode="json"))
+    assert submitted.status_code == 202
+    job_id = submitted.json()["job_id"]
+
+    deadline = time.monotonic() + 60
+    body = submitted.json()
+    while body["status"] in ("queued", "running") and time.monotonic() < deadline:
+        time.sleep(0.05)
+        body = client.get(f"/api/schedule/jobs/{job_id}").json()
+    assert body["status"] == "completed"
+    assert body["result"]["success"]
+    assert body["run_ms"] >= 0
+
+    stats = client.get("/api/schedule/jobs/stats").json()
+    assert stats["completed"] >= 1
+    assert client.delete(f"/api/schedule/jobs/{job_id}").json()["status"] == "completed"
+    assert client.get("/api/schedule/jobs/missing").status_code == 404
+
+    bad = request.model_dump(mode="json")
+    bad["period"] = "2025-07-14/2025-07-07"
+    assert client.post("/api/schedule/jobs", json=bad).status_code == 400
+
+
+def test_full_queue_rejects_with_retry_after():
+    manager = JobManager(max_workers=1, retention_seconds=60, max_queued=1, worker=_sleeping_worker)
+    manager.submit(random_request(109, ALL_CONSTRAINTS))
+    manager.submit(random_request(110, ALL_CONSTRAINTS))
+
+    with pytest.raises(QueueFullError) as rejected:
+        manager.submit(random_request(111, ALL_CONSTRAINTS))
+    assert rejected.value.retry_after_seconds >= 1
+    assert manager.stats()["rejected"] == 1
+    manager.shutdown()
+
+
+def test_workers_run_under_resource_limits():
+    pytest.importorskip("resource")
+    manager = JobManager(max_workers=1, retention_seconds=60, worker=_limits_worker)
+    job = _wait(manager.submit(random_request(112, ALL_CONSTRAINTS)))
+
+    assert job.error == repr((settings.solve_memory_limit_mb * 1024 * 1024, settings.solve_cpu_time_limit_seconds))
+
+
+def test_optimize_returns_429_when_the_pool_is_full(monkeypatch):
+    manager = JobManager(max_workers=1, retention_seconds=60, max_queued=0, worker=_sleeping_worker)
+    monkeypatch.setattr("routers.schedule.job_manager", manager)
+    monkeypatch.setattr(settings, "result_cache_enabled", False)
+    manager.submit(random_request(113, ALL_CONSTRAINTS))
+
+    response = TestClient(app).post("/api/schedule/optimize",
+                                    json=random_request(114, ALL_CONSTRAINTS).model_dump(mode="json"))
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    manager.shutdown()
+
+
+def test_local_work_queues_for_a_worker_slot():
+    manager = JobManager(max_workers=1, retention_seconds=60, max_queued=1, worker=_sleeping_worker)
+    assert manager.run_local(lambda: 42) == 42
+
+    job = manager.submit(random_request(115, ALL_CONSTRAINTS))
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(manager.run_local(lambda: "done")))
+    waiter.start()
+    deadline = time.monotonic() + 10
+    while manager.stats()["queued"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not results
+
+    with pytest.raises(QueueFullError):
+        manager.run_local(lambda: None)
+    manager.cancel(job.job_id)
+    waiter.join(timeout=10)
+    assert results == ["done"]
+    assert manager.stats()["completed"] == 2
@@ -0,0 +1,63 @@
+import time
+
+import numpy as np
+
+from models.api_models import ScheduleMode
+from services.constraint_manager import ConstraintManager
+from services.eligibility import EligibilityMatrix
+from services.lns import LargeNeighborhoodSearch
+from services.matrix_model import MatrixModel
+from services.problem_data import ProblemData
+from services.shift_scheduler import ShiftScheduler
+
+from .test_utils import ALL_CONSTRAINTS, assert_feasible, random_request
+
+
+def _model(request):
+    data = ProblemData(request.employees, request.shifts)
+    eligibility = EligibilityMatrix(data, request.constraints)
+    cliques = ConstraintManager(data, eligibility).get_overlap_cliques()
+    return data, MatrixModel.build(data, eligibility, request.constraints, cliques)
+
+
+def test_lns_improves_an_empty_start_and_stays_feasible():
+    request = random_request(81, ALL_CONSTRAINTS)
+    data, model = _model(request)
+    optimal = ShiftScheduler(solver_backend="cbc", decompose=False).schedule(request)
+
+    search = LargeNeighborhoodSearch(model, data, neighborhood_columns=15, seed=1)
+    values, trace, _ = search.run(np.zeros(model.num_cols), time.perf_counter() + 2, optimal.metrics.objective_value)
+
+    activity = np.bincount(model.row_ids(), weights=model.values * values[model.indices], minlength=model.num_rows)
+    assert (activity <= model.row_upper + 1e-9).all()
+    assert trace[0][1] == 0
+    assert [objective for _, objective in trace] == sorted({objective for _, objective in trace})
+    assert 0 < values.sum() <= optimal.metrics.objective_value
+
+
+def test_whole_model_neighborhood_proves_optimality():
+    request = random_request(82, ALL_CONSTRAINTS)
+    data, model = _model(request)
+    optimal = ShiftScheduler(solver_backend="cbc", decompose=False).schedule(request)
+
+    search = LargeNeighborhoodSearch(model, data, neighborhood_columns=model.num_cols)
+    values, _, proven = search.run(np.zeros(model.num_cols), time.perf_counter() + 30, float(model.num_cols))
+
+    assert proven
+    assert values.sum() == optimal.metrics.objective_value
+
+
+def test_lns_mode_reports_trace_and_bound():
+    request = random_request(83, ALL_CONSTRAINTS).model_copy(update={"mode": ScheduleMode.LNS,
+                                                                       "time_budget_ms": 500})
+    fast = ShiftScheduler().schedule(request.model_copy(update={"mode": ScheduleMode.FAST}))
+    response = ShiftScheduler().schedule(request)
+
+    assert response.success
+    assert_feasible(request, response)
+    assert response.metrics.solver == "lns"
+    trace = response.metrics.objective_trace
+    assert trace[0].objective_value >= fast.metrics.objective_value
+    assert trace[-1].objective_value == response.metrics.objective_value
+    assert response.metrics.objective_value <= response.metrics.best_bound
+    assert response.metrics.optimization_time_ms < 5000
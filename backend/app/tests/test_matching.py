@@ -0,0 +1,61 @@
+import pytest
+
+from models.api_models import ShiftScheduleRequest
+from models.schemas import Assignment, ConstraintType
+from services.matching import is_matching_problem
+from services.shift_scheduler import ShiftScheduler
+
+from .test_utils import ALL_CONSTRAINTS, random_request
+
+
+def test_matching_problem_detection():
+    assert is_matching_problem([])
+    assert is_matching_problem([ConstraintType.SKILL_MATCHING, ConstraintType.AVAILABILITY_WINDOWS])
+    assert not is_matching_problem([ConstraintType.SKILL_MATCHING, ConstraintType.NO_OVERLAPPING])
+    assert not is_matching_problem(ALL_CONSTRAINTS)
+
+
+@pytest.mark.parametrize("seed,constraints", [
+    (61, [ConstraintType.SKILL_MATCHING, ConstraintType.AVAILABILITY_WINDOWS]),
+    (62, [ConstraintType.SKILL_MATCHING]),
+    (63, [ConstraintType.AVAILABILITY_WINDOWS]),
+    (64, [])
+])
+def test_matching_matches_ilp(seed, constraints):
+    request = random_request(seed, constraints)
+    matching = ShiftScheduler(solver_backend="auto").schedule(request)
+    ilp = ShiftScheduler(solver_backend="cbc").schedule(request)
+
+    assert matching.success and ilp.success
+    assert matching.metrics.solver == "matching"
+    assert matching.message == "Optimization completed successfully"
+    assert matching.metrics.objective_value == ilp.metrics.objective_value
+    assert sorted(matching.unassigned_shifts) == sorted(ilp.unassigned_shifts)
+
+    employees = {emp.id: emp for emp in request.employees}
+    shifts = {shift.id: shift for shift in request.shifts}
+    for assignment in matching.assignments:
+        if ConstraintType.SKILL_MATCHING in constraints:
+            assert shifts[assignment.shift_id].required_skill in employees[assignment.employee_id].skills
+
+
+def test_exhaustive_fallback_covers_remaining_shifts(monkeypatch):
+    monkeypatch.setattr("services.matching.MATCHING_ROUNDS", 1)
+    request = random_request(66, [ConstraintType.SKILL_MATCHING, ConstraintType.AVAILABILITY_WINDOWS])
+    matching = ShiftScheduler(solver_backend="auto").schedule(request)
+    ilp = ShiftScheduler(solver_backend="cbc").schedule(request)
+
+    assert matching.metrics.objective_value == ilp.metrics.objective_value
+
+
+def test_matching_keeps_eligible_current_assignments():
+    request: ShiftScheduleRequest = random_request(65, [ConstraintType.SKILL_MATCHING])
+    first = ShiftScheduler(solver_backend="cbc").schedule(request)
+    kept = first.assignments[::2]
+
+    rerun = ShiftScheduler(solver_backend="auto").schedule(request.model_copy(update={
+        "current_assignments": kept + [Assignment(shift_id="shift0", employee_id="missing")]
+    }))
+
+    assert rerun.metrics.warm_start_assignments == len(kept)
+    assert {(a.shift_id, a.employee_id) for a in kept} <= {(a.shift_id, a.employee_id) for a in rerun.assignments}
@@ -0,0 +1,63 @@
+import pytest
+
+from services.constraint_manager import ConstraintManager
+from services.eligibility import EligibilityMatrix
+from services.matrix_model import MatrixModel, column_index, column_name, column_names
+from services.problem_data import ProblemData
+from services.shift_scheduler import ShiftScheduler
+from models.schemas import ConstraintType
+
+from .test_utils import ALL_CONSTRAINTS, random_request
+
+
+@pytest.mark.parametrize("seed,constraints", [
+    (1, ALL_CONSTRAINTS),
+    (2, [ConstraintType.SKILL_MATCHING, ConstraintType.NO_OVERLAPPING]),
+    (3, [ConstraintType.OVERTIME_LIMITS, ConstraintType.AVAILABILITY_WINDOWS]),
+    (4, [])
+])
+def test_matrix_backend_matches_pulp_reference(seed, constraints):
+    request = random_request(seed, constraints)
+    matrix_response = ShiftScheduler(model_backend="matrix").schedule(request)
+    pulp_response = ShiftScheduler(model_backend="pulp").schedule(request)
+
+    assert matrix_response.success and pulp_response.success
+    assert matrix_response.metrics.objective_value == pulp_response.metrics.objective_value
+    assert len(matrix_response.assignments) == len(pulp_response.assignments)
+
+
+def test_model_rows_follow_active_constraints():
+    request = random_request(5, ALL_CONSTRAINTS)
+    data = ProblemData(request.employees, request.shifts)
+    eligibility = EligibilityMatrix(data, request.constraints)
+    cliques = ConstraintManager(data, eligibility).get_overlap_cliques()
+
+    model = MatrixModel.build(data, eligibility, request.constraints, cliques)
+    assert model.num_cols == len(eligibility.rows)
+    assert set(model.blocks) == {"shift_capacity", "overtime_limits", "no_overlapping"}
+    assert model.indptr[-1] == model.num_nonzeros
+
+    # Every overtime row carries integer minute coefficients
+    first, last = model.blocks["overtime_limits"]
+    coefficients = model.values[model.indptr[first]:model.indptr[last]]
+    assert (coefficients == coefficients.astype(int)).all()
+
+    skill_only = MatrixModel.build(data, eligibility, [ConstraintType.SKILL_MATCHING], [])
+    assert set(skill_only.blocks) == {"shift_capacity"}
+
+
+def test_column_names_round_trip_and_fit_mps_fields():
+    for index in (0, 35, 36, 10_000_000, 2_000_000_000):
+        name = column_name(index)
+        assert len(name) <= 8
+        assert column_index(name) == index
+
+    fields = column_names(50_000)
+    assert fields.dtype.itemsize == 8
+    assert [field.decode().rstrip() for field in fields[[0, 35, 36, 1295, 1296, 49_999]]] == \
+        [column_name(index) for index in (0, 35, 36, 1295, 1296, 49_999)]
+
+
+def test_unknown_model_backend_is_rejected():
+    with pytest.raises(ValueError):
+        ShiftScheduler(model_backend="excel")
@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from services.problem_data import ProblemData
+
+from .test_utils import create_employee, create_shift
+
+
+def test_columns_use_integer_minutes():
+    base_datetime = datetime(2025, 7, 7, 9, 0)
+    employees = [
+        create_employee("emp1", ["nursing", "admin"], 16, 0, 24, base_datetime=base_datetime),
+        create_employee("emp2", ["doctor"], 40, 2, 8, base_datetime=base_datetime)
+    ]
+    shifts = [
+        create_shift("shift1", "nursing", 1, 8, base_datetime=base_datetime),
+        create_shift("shift2", "doctor", 3, 2, base_datetime=base_datetime),
+        create_shift("shift3", "surgery", 4, 6, base_datetime=base_datetime)
+    ]
+    data = ProblemData(employees, shifts)
+
+    assert data.num_employees == 2 and data.num_shifts == 3
+    assert data.shift_start.tolist() == [0, 120, 180]
+    assert data.shift_end.tolist() == [480, 240, 540]
+    assert data.duration.tolist() == [480, 120, 360]
+    assert data.max_minutes.tolist() == [960, 2400]
+    assert data.horizon == 540
+    assert data.shift_index["shift2"] == 1
+    assert data.employee_index["emp2"] == 1
+
+    # Skills unknown to every employee are still interned for the shifts that need them
+    assert set(data.skill_ids) == {"nursing", "admin", "doctor", "surgery"}
+    assert data.calendars[1].runs() == [(60, 540)]
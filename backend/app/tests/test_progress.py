@@ -0,0 +1,83 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from services.job_manager import JobManager
+from services.shift_scheduler import ShiftScheduler
+from core.settings import settings
+
+from .test_job_manager import _wait
+from .test_utils import ALL_CONSTRAINTS, random_request
+
+
+def _parse_events(text):
+    events = []
+    for block in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.split("\n") if not line.startswith(":"))
+        if fields:
+            events.append((fields.get("id"), fields["event"], json.loads(fields["data"])))
+    return events
+
+
+@pytest.mark.parametrize("solver_backend", ["cbc", "highs"])
+def test_scheduler_reports_phases_model_and_improving_incumbents(solver_backend):
+    events = []
+    request = random_request(121, ALL_CONSTRAINTS)
+    response = ShiftScheduler(solver_backend=solver_backend, decompose=False,
+                              progress=lambda event, payload: events.append((event, payload))).schedule(request)
+
+    phases = [payload["phase"] for event, payload in events if event == "phase"]
+    assert phases == ["validate", "build", "solve", "extract"]
+    model = next(payload for event, payload in events if event == "model")
+    assert model["rows"] > 0 and model["columns"] > 0 and model["nonzeros"] > 0
+
+    incumbents = [payload["objective_value"] for event, payload in events if event == "incumbent"]
+    assert incumbents == sorted(set(incumbents))
+    assert incumbents[-1] == response.metrics.objective_value
+
+    elapsed = [payload["elapsed_ms"] for _, payload in events]
+    assert elapsed == sorted(elapsed)
+
+
+def test_scheduler_without_progress_callback_reports_nothing():
+    scheduler = ShiftScheduler()
+    assert scheduler._incumbent_reporter() is None
+    assert scheduler.schedule(random_request(122, ALL_CONSTRAINTS)).success
+
+
+def test_job_collects_worker_progress_and_notifies_listeners():
+    manager = JobManager(max_workers=1, retention_seconds=60)
+    notified = []
+    job = manager.submit(random_request(123, ALL_CONSTRAINTS))
+    manager.subscribe(job, lambda: notified.append(len(job.events)))
+    _wait(job)
+
+    assert job.result.success
+    assert [payload["phase"] for event, payload in job.events if event == "phase"][-1] == "extract"
+    assert notified and notified[-1] == len(job.events)
+
+
+def test_stream_endpoint_sends_progress_then_the_result(monkeypatch):
+    monkeypatch.setattr(settings, "result_cache_enabled", False)
+    client = TestClient(app)
+    request = random_request(124, ALL_CONSTRAINTS)
+
+    response = client.post("/api/schedule/optimize/stream", json=request.model_dump(mode="json"))
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = _parse_events(response.text)
+    assert events[0][1] == "job"
+    assert "phase" in [name for _, name, _ in events]
+    event_id, name, data = events[-1]
+    assert name == "completed"
+    assert data["result"]["success"]
+    assert [int(i) for i, _, _ in events[1:]] == list(range(len(events) - 1))
+
+    # Replaying a finished job after the last progress event only sends the final event
+    replay = client.get(f"/api/schedule/jobs/{data['job_id']}/events",
+                        headers={"Last-Event-ID": str(int(event_id) - 1)})
+    assert [name for _, name, _ in _parse_events(replay.text)] == ["completed"]
+    assert client.get("/api/schedule/jobs/missing/events").status_code == 404
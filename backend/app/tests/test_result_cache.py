@@ -0,0 +1,157 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from models.api_models import RollingHorizon, ShiftScheduleRequest, ShiftScheduleResponse
+from models.schemas import ConstraintType, OptimizationMetrics
+from services.result_cache import ResultCache, canonical_request_key, result_cache
+
+from .test_utils import create_employee, create_shift
+
+BASE = datetime(2025, 7, 1, 8, 0)
+
+
+def _request(employees=None, shifts=None, constraints=None) -> ShiftScheduleRequest:
+    return ShiftScheduleRequest(
+        period="2025-07-01/2025-07-03",
+        employees=employees or [
+            create_employee("E1", ["cook", "clean"], 40, 0, 24, BASE),
+            create_employee("E2", ["serve"], 40, 0, 24, BASE),
+        ],
+        shifts=shifts or [
+            create_shift("S1", "cook", 1, 4, BASE),
+            create_shift("S2", "serve", 2, 4, BASE),
+        ],
+        constraints=constraints if constraints is not None else [
+            ConstraintType.SKILL_MATCHING, ConstraintType.NO_OVERLAPPING
+        ],
+    )
+
+
+def _response(objective: float) -> ShiftScheduleResponse:
+    return ShiftScheduleResponse(
+        success=True,
+        assignments=[],
+        unassigned_shifts=[],
+        metrics=OptimizationMetrics(total_overtime_minutes=0, constraint_violations=0,
+                                    optimization_time_ms=1, objective_value=objective),
+        constraints_applied=[],
+    )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_key_ignores_order_and_display_fields():
+    request = _request()
+    shuffled = _request(
+        employees=list(reversed(request.employees)),
+        shifts=list(reversed(request.shifts)),
+        constraints=[ConstraintType.NO_OVERLAPPING, ConstraintType.SKILL_MATCHING],
+    )
+    shuffled.employees[1].skills.reverse()
+    shuffled.employees[0].name = "Renamed"
+    shuffled.period = "2025-06-30/2025-07-05"
+
+    assert canonical_request_key(request) == canonical_request_key(shuffled)
+
+
+def test_key_includes_period_of_rolling_horizon_requests():
+    request = _request()
+    request.rolling_horizon = RollingHorizon(window_days=2, overlap_days=1)
+    moved = _request()
+    moved.rolling_horizon = RollingHorizon(window_days=2, overlap_days=1)
+    moved.period = "2025-06-30/2025-07-03"
+
+    assert canonical_request_key(request) != canonical_request_key(moved)
+
+
+def test_key_normalizes_time_zones():
+    request = _request()
+    utc_shift = request.shifts[0].model_copy(update={
+        "start_time": request.shifts[0].start_time.replace(tzinfo=timezone.utc),
+        "end_time": request.shifts[0].end_time.replace(tzinfo=timezone.utc),
+    })
+    offset = timezone(timedelta(hours=2))
+    shifted = request.shifts[0].model_copy(update={
+        "start_time": utc_shift.start_time.astimezone(offset),
+        "end_time": utc_shift.end_time.astimezone(offset),
+    })
+
+    assert (canonical_request_key(_request(shifts=[utc_shift, request.shifts[1]]))
+            == canonical_request_key(_request(shifts=[shifted, request.shifts[1]])))
+
+
+def test_key_changes_with_content_and_scope():
+    request = _request()
+    key = canonical_request_key(request)
+
+    longer = _request(shifts=[create_shift("S1", "cook", 1, 5, BASE), request.shifts[1]])
+    assert canonical_request_key(longer) != key
+    assert canonical_request_key(_request(constraints=[])) != key
+    assert canonical_request_key(request, "pulp", "cbc") != key
+
+
+def test_lru_evicts_least_recently_used():
+    cache = ResultCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", _response(1))
+    cache.put("b", _response(2))
+    assert cache.get("a") is not None
+    cache.put("c", _response(3))
+
+    assert cache.get("b") is None
+    assert cache.get("a").metrics.objective_value == 1
+    assert cache.get("c").metrics.objective_value == 3
+    assert cache.stats()["hits"] == 3
+    assert cache.stats()["misses"] == 1
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = ResultCache(max_entries=4, ttl_seconds=10, clock=clock)
+    cache.put("a", _response(1))
+
+    clock.now += 5
+    assert cache.get("a") is not None
+    clock.now += 6
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_sqlite_tier_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "results.sqlite3")
+    ResultCache(max_entries=4, ttl_seconds=60, sqlite_path=path).put("a", _response(7))
+
+    other_worker = ResultCache(max_entries=4, ttl_seconds=60, sqlite_path=path)
+    hit = other_worker.get("a")
+    assert hit is not None and hit.metrics.objective_value == 7
+    assert other_worker.stats()["disk_hits"] == 1
+    assert other_worker.stats()["entries"] == 1
+
+
+@pytest.fixture
+def client():
+    result_cache.clear()
+    yield TestClient(app)
+    result_cache.clear()
+
+
+def test_repeated_optimize_is_served_from_cache(client):
+    payload = _request().model_dump(mode="json")
+
+    first = client.post("/api/schedule/optimize", json=payload).json()
+    second = client.post("/api/schedule/optimize", json=payload).json()
+
+    assert first["success"] and not first["cached"]
+    assert second["cached"]
+    assert second["assignments"] == first["assignments"]
+
+    stats = client.get("/api/schedule/cache/stats").json()
+    assert stats["hits"] == 1 and stats["misses"] == 1
@@ -0,0 +1,82 @@
+from datetime import datetime
+
+import numpy as np
+
+from services.eligibility import EligibilityMatrix
+from services.problem_data import ProblemData
+from services.rolling_horizon import assignment_upper_bound, overlaps_commitments, plan_windows
+from services.shift_scheduler import ShiftScheduler
+from models.api_models import RollingHorizon, ShiftScheduleRequest
+
+from .test_utils import ALL_CONSTRAINTS, assert_feasible, create_employee, create_shift, random_request
+
+BASE = datetime(2025, 7, 1, 0, 0)
+
+
+def _quarter_request(seed: int, rolling_horizon=None) -> ShiftScheduleRequest:
+    return random_request(seed, ALL_CONSTRAINTS, num_employees=10, num_shifts=120, max_hours=(40, 80, 120),
+                          availability_offset=(0, 0), availability_hours=(24 * 28, 24 * 28),
+                          shift_offset=(0, 24 * 27), shift_hours=(4, 10), period="2025-07-01/2025-07-30",
+                          base_datetime=BASE, rolling_horizon=rolling_horizon)
+
+
+def test_plan_windows_cover_every_start():
+    windows = list(plan_windows(0, 20_000, window_minutes=7 * 1440, overlap_minutes=1440))
+
+    assert windows[0] == (0, 7 * 1440, 6 * 1440)
+    assert all(nxt[0] == prev[2] for prev, nxt in zip(windows, windows[1:]))
+    assert windows[-1][2] == windows[-1][1] > 20_000
+
+
+def test_overlaps_commitments():
+    busy_emp, busy_start, busy_end = np.array([0, 0, 1]), np.array([0, 100, 50]), np.array([60, 160, 80])
+    emp = np.array([0, 0, 0, 1, 2])
+    start = np.array([60, 90, 150, 70, 0])
+    end = np.array([100, 110, 200, 90, 500])
+
+    clash = overlaps_commitments(emp, start, end, busy_emp, busy_start, busy_end, stride=1000)
+    assert clash.tolist() == [False, True, True, True, False]
+
+
+def test_rolling_horizon_is_feasible_and_bounded():
+    request = _quarter_request(1, RollingHorizon(window_days=7, overlap_days=2))
+    rolling = ShiftScheduler(solver_backend="cbc").schedule(request)
+    monolithic = ShiftScheduler(solver_backend="cbc").schedule(request.model_copy(update={"rolling_horizon": None}))
+
+    assert rolling.success and monolithic.success
+    assert_feasible(request, rolling)
+    assert len(rolling.metrics.windows) == 5
+    assert sum(w.committed_assignments for w in rolling.metrics.windows) == len(rolling.assignments)
+    assert rolling.metrics.objective_value <= monolithic.metrics.objective_value <= rolling.metrics.best_bound
+    assert 0 <= rolling.metrics.gap < 1
+
+
+def test_hours_and_busy_intervals_carry_over_between_windows():
+    employees = [create_employee("E1", ["cook"], 10, 0, 24 * 20, base_datetime=BASE)]
+    shifts = [
+        create_shift("week1_late", "cook", 24 * 7 - 2, 4, base_datetime=BASE),  # Crosses the first boundary
+        create_shift("week2_early", "cook", 24 * 7, 3, base_datetime=BASE),  # Overlaps week1_late
+        create_shift("week2", "cook", 24 * 9, 6, base_datetime=BASE),
+        create_shift("week3", "cook", 24 * 15, 6, base_datetime=BASE),
+    ]
+    request = ShiftScheduleRequest(
+        period="2025-07-01/2025-07-25",
+        employees=employees,
+        shifts=shifts,
+        constraints=ALL_CONSTRAINTS,
+        rolling_horizon=RollingHorizon(window_days=7, overlap_days=0)
+    )
+    response = ShiftScheduler(solver_backend="cbc").schedule(request)
+
+    assert response.success
+    assert_feasible(request, response)
+    assert [a.shift_id for a in response.assignments] == ["week1_late", "week2"]
+
+
+def test_upper_bound_dominates_monolithic_objective():
+    for seed in range(3):
+        request = _quarter_request(10 + seed)
+        data = ProblemData(request.employees, request.shifts)
+        bound = assignment_upper_bound(data, EligibilityMatrix(data, request.constraints), request.constraints)
+        response = ShiftScheduler(solver_backend="cbc").schedule(request)
+        assert response.metrics.objective_value <= bound
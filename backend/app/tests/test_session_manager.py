@@ -0,0 +1,205 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from models.api_models import SessionDelta, ShiftScheduleRequest
+from models.schemas import ConstraintType
+from services.eligibility import EligibilityMatrix
+from services.job_manager import JobManager
+from services.interval_graph import find_maximal_cliques
+from services.matrix_model import MatrixModel
+from services.problem_data import ProblemData
+from services.session_manager import SessionManager, SessionNotFoundError
+from services.shift_scheduler import ShiftScheduler
+
+from .test_job_manager import _sleeping_worker
+from .test_utils import ALL_CONSTRAINTS, create_employee, create_shift, random_request
+
+BASE = datetime(2025, 7, 7, 0, 0)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _manager(clock=None, max_sessions=10, memory_cap_bytes=1 << 30) -> SessionManager:
+    return SessionManager(idle_ttl_seconds=60, max_sessions=max_sessions,
+                          memory_cap_bytes=memory_cap_bytes, clock=clock or FakeClock())
+
+
+def _delta() -> SessionDelta:
+    return SessionDelta(
+        add_employees=[create_employee("emp_new", ["nursing", "admin"], 24, 0, 96, base_datetime=BASE)],
+        update_employees=[create_employee("emp3", ["doctor"], 16, 12, 48, base_datetime=BASE)],
+        remove_employees=["emp5"],
+        add_shifts=[create_shift("shift_new", "admin", 3, 4, base_datetime=BASE)],
+        update_shifts=[create_shift("shift0", "nursing", 20, 6, base_datetime=BASE)],
+        remove_shifts=["shift7", "shift8"],
+    )
+
+
+def _edited_request(request: ShiftScheduleRequest, delta: SessionDelta) -> ShiftScheduleRequest:
+    updated = {entity.id: entity for entity in delta.update_employees + delta.update_shifts}
+    employees = [updated.get(emp.id, emp) for emp in request.employees if emp.id not in delta.remove_employees]
+    shifts = [updated.get(shift.id, shift) for shift in request.shifts if shift.id not in delta.remove_shifts]
+    return request.model_copy(update={"employees": employees + delta.add_employees,
+                                      "shifts": shifts + delta.add_shifts})
+
+
+def test_updated_eligibility_matches_full_rebuild():
+    request = random_request(31, ALL_CONSTRAINTS)
+    delta = _delta()
+    previous = EligibilityMatrix(ProblemData(request.employees, request.shifts), request.constraints)
+
+    edited = _edited_request(request, delta)
+    data = ProblemData(edited.employees, edited.shifts)
+    updated = EligibilityMatrix.updated(previous, data, edited.constraints,
+                                        {"emp_new", "emp3"}, {"shift_new", "shift0"})
+    rebuilt = EligibilityMatrix(data, edited.constraints)
+
+    assert np.array_equal(updated.rows, rebuilt.rows)
+    assert np.array_equal(updated.cols, rebuilt.cols)
+
+
+def test_delta_solve_matches_solving_the_edited_roster():
+    request = random_request(32, ALL_CONSTRAINTS)
+    manager = _manager()
+    session = manager.create(request, ShiftScheduler(solver_backend="cbc"))
+    assert session.last_response.success
+
+    delta = _delta()
+    delta.remove_constraints = [ConstraintType.OVERTIME_LIMITS]
+    session = manager.apply_delta(session.session_id, delta, ShiftScheduler(solver_backend="cbc"))
+
+    edited = _edited_request(request, delta)
+    edited.constraints = [c for c in ALL_CONSTRAINTS if c != ConstraintType.OVERTIME_LIMITS]
+    expected = ShiftScheduler(solver_backend="cbc").schedule(edited)
+
+    assert session.last_response.success
+    assert session.last_response.metrics.objective_value == expected.metrics.objective_value
+    assert session.last_response.metrics.warm_start_assignments > 0
+    assert len(session.shifts) == len(edited.shifts)
+
+
+def _model_rows(model, data):
+    return {
+        name: {(frozenset((data.employee_ids[model.col_employee[c]], data.shift_ids[model.col_shift[c]])
+                          for c in model.indices[model.indptr[r]:model.indptr[r + 1]].tolist()), model.row_upper[r])
+               for r in range(first, last)}
+        for name, (first, last) in model.blocks.items()
+    }
+
+
+def test_patched_model_matches_full_rebuild():
+    request = random_request(41, ALL_CONSTRAINTS)
+    manager = _manager()
+    scheduler = ShiftScheduler(solver_backend="highs")
+    session = manager.create(request, scheduler)
+
+    deltas = [
+        _delta(),
+        SessionDelta(update_shifts=[create_shift("shift3", "doctor", 30, 8, base_datetime=BASE)],
+                     add_shifts=[create_shift("shift_late", "nursing", 31, 5, base_datetime=BASE)],
+                     remove_shifts=["shift9"]),
+    ]
+    for delta in deltas:
+        session = manager.apply_delta(session.session_id, delta, scheduler)
+        request = _edited_request(request, delta)
+
+        data = ProblemData(request.employees, request.shifts)
+        eligibility = EligibilityMatrix(data, request.constraints)
+        cliques = find_maximal_cliques(zip(range(data.num_shifts), data.shift_start.tolist(), data.shift_end.tolist()))
+        rebuilt = MatrixModel.build(data, eligibility, request.constraints, cliques)
+
+        assert sorted(map(sorted, session.overlap_cliques)) == sorted(map(sorted, cliques))
+        assert _model_rows(session.model, session.data) == _model_rows(rebuilt, data)
+
+
+def test_invalid_delta_leaves_session_unchanged():
+    manager = _manager()
+    session = manager.create(random_request(33, ALL_CONSTRAINTS), ShiftScheduler(solver_backend="cbc"))
+    before = set(session.shifts)
+
+    with pytest.raises(ValueError):
+        manager.apply_delta(session.session_id, SessionDelta(remove_shifts=["shift1", "missing"]),
+                            ShiftScheduler(solver_backend="cbc"))
+    assert set(session.shifts) == before
+
+
+def test_idle_sessions_are_evicted():
+    clock = FakeClock()
+    manager = _manager(clock)
+    session = manager.create(random_request(34, ALL_CONSTRAINTS), ShiftScheduler(solver_backend="cbc"))
+
+    clock.now += 30
+    manager.get(session.session_id)
+    clock.now += 61
+    with pytest.raises(SessionNotFoundError):
+        manager.get(session.session_id)
+
+
+def test_capacity_evicts_least_recently_used():
+    manager = _manager(max_sessions=2)
+    scheduler = ShiftScheduler(solver_backend="cbc")
+    first = manager.create(random_request(35, ALL_CONSTRAINTS), scheduler)
+    second = manager.create(random_request(36, ALL_CONSTRAINTS), scheduler)
+    manager.get(first.session_id)
+    manager.create(random_request(37, ALL_CONSTRAINTS), scheduler)
+
+    manager.get(first.session_id)
+    with pytest.raises(SessionNotFoundError):
+        manager.get(second.session_id)
+
+    tight = _manager(memory_cap_bytes=first.size_bytes + 1)
+    kept = tight.create(random_request(38, ALL_CONSTRAINTS), scheduler)
+    tight.create(random_request(39, ALL_CONSTRAINTS), scheduler)
+    with pytest.raises(SessionNotFoundError):
+        tight.get(kept.session_id)
+    assert tight.stats()["sessions"] == 1
+
+
+def test_session_endpoints():
+    client = TestClient(app)
+    request = random_request(40, ALL_CONSTRAINTS)
+
+    created = client.post("/api/schedule/sessions", json=request.model_dump(mode="json"))
+    assert created.status_code == 201
+    session_id = created.json()["session_id"]
+
+    delta = SessionDelta(remove_shifts=["shift1"], add_constraints=[ConstraintType.NO_OVERLAPPING])
+    updated = client.patch(f"/api/schedule/sessions/{session_id}", json=delta.model_dump(mode="json"))
+    assert updated.status_code == 200
+    assert updated.json()["num_shifts"] == len(request.shifts) - 1
+
+    bad = client.patch(f"/api/schedule/sessions/{session_id}", json={"remove_shifts": ["missing"]})
+    assert bad.status_code == 400
+
+    assert client.get(f"/api/schedule/sessions/{session_id}").json() == updated.json()
+    assert client.delete(f"/api/schedule/sessions/{session_id}").status_code == 204
+    assert client.get(f"/api/schedule/sessions/{session_id}").status_code == 404
+
+
+def test_session_solves_are_admitted_by_the_worker_pool(monkeypatch):
+    manager = JobManager(max_workers=1, retention_seconds=60, max_queued=0, worker=_sleeping_worker)
+    monkeypatch.setattr("routers.schedule.job_manager", manager)
+    client = TestClient(app)
+    request = random_request(42, ALL_CONSTRAINTS).model_dump(mode="json")
+
+    created = client.post("/api/schedule/sessions", json=request)
+    assert created.status_code == 201
+    assert manager.stats()["completed"] == 1
+
+    manager.submit(random_request(43, ALL_CONSTRAINTS))
+    assert client.post("/api/schedule/sessions", json=request).status_code == 429
+    rejected = client.patch(f"/api/schedule/sessions/{created.json()['session_id']}",
+                            json={"remove_shifts": ["shift1"]})
+    assert rejected.status_code == 429
+    assert int(rejected.headers["Retry-After"]) >= 1
+    manager.shutdown()
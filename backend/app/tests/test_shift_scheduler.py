@@ -3,6 +3,8 @@ from datetime import datetime, timedelta
 from typing import List
 
 from services.shift_scheduler import ShiftScheduler
+from services.eligibility import EligibilityMatrix
+from services.problem_data import ProblemData
 from models.schemas import Employee, Shift, Assignment, ConstraintType
 from models.api_models import ShiftScheduleRequest, ShiftScheduleResponse
 
@@ -607,3 +609,36 @@ def test_performance_under_pressure() -> None:
     
     # Should handle the complexity without crashing
     assert len(response.assignments) + len(response.unassigned_shifts) == len(shifts)
+
+
+def test_variables_only_for_eligible_pairs() -> None:
+    """Decision variables are created only for pairs passing skill and availability filters"""
+    base_datetime = datetime(2025, 7, 7, 9, 0)
+    employees = [
+        create_employee("emp1", ["nursing"], 40, 0, 8, base_datetime=base_datetime),
+        create_employee("emp2", ["doctor"], 40, 0, 24, base_datetime=base_datetime)
+    ]
+    shifts = [
+        create_shift("shift1", "nursing", 0, 4, base_datetime=base_datetime),
+        create_shift("shift2", "nursing", 10, 4, base_datetime=base_datetime),
+        create_shift("shift3", "doctor", 10, 4, base_datetime=base_datetime)
+    ]
+    constraints = [ConstraintType.SKILL_MATCHING, ConstraintType.AVAILABILITY_WINDOWS]
+    
+    eligibility = EligibilityMatrix(ProblemData(employees, shifts), constraints)
+    assert eligibility.as_dict() == {"emp1": ["shift1"], "emp2": ["shift3"]}
+    
+    scheduler = ShiftScheduler()
+    problem = scheduler._create_problem()
+    variables = scheduler._create_variables(problem, eligibility)
+    assert sum(len(shift_vars) for shift_vars in variables.values()) == 2
+    
+    response = scheduler.schedule(ShiftScheduleRequest(
+        period="2025-07-07/2025-07-14",
+        employees=employees,
+        shifts=shifts,
+        constraints=constraints
+    ))
+    print_metrics(response)
+    assert response.success
+    assert response.unassigned_shifts == ["shift2"]
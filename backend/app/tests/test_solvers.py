@@ -0,0 +1,92 @@
+import pytest
+
+from services.matrix_model import MatrixModel
+from services.problem_data import ProblemData
+from services.eligibility import EligibilityMatrix
+from services.constraint_manager import ConstraintManager
+from services.shift_scheduler import ShiftScheduler
+from services.solvers import highs
+from services.solvers.base import SolveOptions
+from services.solvers.registry import SOLVERS, available_solvers, select_solver
+from models.schemas import ConstraintType
+from core.settings import settings
+
+from .test_utils import ALL_CONSTRAINTS, random_request
+
+
+EXACT_SOLVERS = [
+    pytest.param(name, marks=pytest.mark.skipif(not solver.is_available(), reason=f"{name} is not installed"))
+    for name, solver in SOLVERS.items() if solver.capabilities.exact and name != "cbc"
+]
+
+
+@pytest.mark.parametrize("solver_backend", EXACT_SOLVERS)
+@pytest.mark.parametrize("model_backend", ["matrix", "pulp"])
+@pytest.mark.parametrize("seed,constraints", [
+    (11, ALL_CONSTRAINTS),
+    (12, [ConstraintType.SKILL_MATCHING, ConstraintType.OVERTIME_LIMITS]),
+])
+def test_exact_solvers_match_cbc(solver_backend, model_backend, seed, constraints):
+    request = random_request(seed, constraints)
+    response = ShiftScheduler(model_backend=model_backend, solver_backend=solver_backend).schedule(request)
+    cbc_response = ShiftScheduler(model_backend=model_backend, solver_backend="cbc").schedule(request)
+
+    assert response.success and cbc_response.success
+    assert response.metrics.objective_value == cbc_response.metrics.objective_value
+    assert len(response.assignments) + len(response.unassigned_shifts) == len(request.shifts)
+
+
+def test_greedy_solution_is_feasible():
+    request = random_request(14, ALL_CONSTRAINTS)
+    data = ProblemData(request.employees, request.shifts)
+    eligibility = EligibilityMatrix(data, request.constraints)
+    cliques = ConstraintManager(data, eligibility).get_overlap_cliques()
+    model = MatrixModel.build(data, eligibility, request.constraints, cliques)
+
+    result = SOLVERS["greedy"].solve(model, SolveOptions())
+    assert not result.proven_optimal
+    assert result.objective_value > 0
+
+    row_activity = [0.0] * model.num_rows
+    for r in range(model.num_rows):
+        for k in range(model.indptr[r], model.indptr[r + 1]):
+            row_activity[r] += model.values[k] * result.values[model.indices[k]]
+        assert row_activity[r] <= model.row_upper[r]
+
+    response = ShiftScheduler(solver_backend="greedy").schedule(request)
+    assert response.success
+    assert response.metrics.solver == "greedy"
+    assert response.metrics.objective_value <= ShiftScheduler(solver_backend="cbc").schedule(request).metrics.objective_value
+
+
+def test_auto_selection_reports_solver_and_reason():
+    response = ShiftScheduler(solver_backend="auto").schedule(random_request(15, ALL_CONSTRAINTS))
+    assert response.success
+    assert response.metrics.solver in available_solvers()
+    assert response.metrics.solver_reason
+
+
+def test_auto_selection_policy(monkeypatch):
+    solver, _ = select_solver("auto", settings.greedy_min_columns + 1, ALL_CONSTRAINTS)
+    assert solver.name == "greedy"
+
+    solver, _ = select_solver("auto", 100, [ConstraintType.NO_OVERLAPPING])
+    assert solver.name == ("cpsat" if SOLVERS["cpsat"].is_available() else
+                           "highs" if SOLVERS["highs"].is_available() else "cbc")
+
+    monkeypatch.setattr(highs, "highspy", None)
+    solver, reason = select_solver("highs", 100, ALL_CONSTRAINTS)
+    assert solver.name == "cbc"
+    assert reason.startswith("highs unavailable")
+
+
+def test_falls_back_to_cbc_without_highs(monkeypatch):
+    monkeypatch.setattr(highs, "highspy", None)
+    response = ShiftScheduler(solver_backend="highs").schedule(random_request(13, ALL_CONSTRAINTS))
+    assert response.success
+    assert response.metrics.solver == "cbc"
+
+
+def test_unknown_solver_backend_is_rejected():
+    with pytest.raises(ValueError):
+        ShiftScheduler(solver_backend="gurobi")
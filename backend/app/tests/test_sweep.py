@@ -0,0 +1,148 @@
+import time
+from datetime import datetime
+
+import numpy as np
+import pulp
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from models.api_models import ShiftScheduleRequest, SweepScenario
+from models.schemas import ConstraintType
+from services.eligibility import EligibilityMatrix
+from services.job_manager import JobManager
+from services.shift_scheduler import ShiftScheduler
+from services.solvers.base import MatrixSolver, SolveResult, SolverCapabilities
+from services.sweep import ScenarioSweep
+
+from .test_job_manager import _sleeping_worker
+from .test_utils import ALL_CONSTRAINTS, create_employee, create_shift, random_request
+
+SCENARIOS = [
+    SweepScenario(name="base"),
+    SweepScenario(name="8h", max_hours=8),
+    SweepScenario(name="40h", max_hours=40),
+    SweepScenario(name="emp0 off", employee_max_hours={"emp0": 0}),
+    SweepScenario(name="any time", remove_constraints=[ConstraintType.AVAILABILITY_WINDOWS]),
+    SweepScenario(name="no caps", remove_constraints=[ConstraintType.OVERTIME_LIMITS, ConstraintType.NO_OVERLAPPING]),
+]
+
+
+def _scenario_request(request, scenario):
+    employees = [
+        employee.model_copy(update={"max_hours": scenario.employee_max_hours.get(
+            employee.id, scenario.max_hours if scenario.max_hours is not None else employee.max_hours)})
+        for employee in request.employees
+    ]
+    constraints = [c for c in request.constraints if c not in scenario.remove_constraints]
+    return request.model_copy(update={"employees": employees, "constraints": constraints})
+
+
+@pytest.mark.parametrize("solver_backend", ["cbc", "highs", "cpsat"])
+def test_sweep_matches_separate_solves(solver_backend):
+    request = random_request(151, ALL_CONSTRAINTS)
+    sweep = ScenarioSweep(request, solver_backend).run(SCENARIOS)
+
+    assert [row.name for row in sweep.scenarios] == [scenario.name for scenario in SCENARIOS]
+    for scenario, row in zip(SCENARIOS, sweep.scenarios):
+        expected = ShiftScheduler(solver_backend="highs").schedule(_scenario_request(request, scenario))
+        assert row.optimal
+        assert row.objective_value == expected.metrics.objective_value
+        assert row.unassigned_shifts == len(expected.unassigned_shifts)
+
+    rows = {row.name: row for row in sweep.scenarios}
+    assert rows["base"].overtime_hours == 0
+    assert rows["8h"].overtime_hours == 0
+    assert rows["40h"].objective_value >= rows["base"].objective_value
+
+
+def test_tighter_scenario_keeps_overtime_rows():
+    base_datetime = datetime(2025, 7, 7, 0, 0)
+    request = ShiftScheduleRequest(
+        period="2025-07-07/2025-07-14",
+        employees=[create_employee("emp1", ["nursing"], 40, 0, 168, base_datetime=base_datetime)],
+        shifts=[create_shift(f"shift{k}", "nursing", 24 * k, hours, base_datetime=base_datetime)
+                for k, hours in enumerate([8, 8, 8, 6, 6])],
+        constraints=ALL_CONSTRAINTS
+    )
+    sweep = ScenarioSweep(request).run([SweepScenario(name="20h", max_hours=20), SweepScenario(name="40h")])
+
+    tight, loose = sweep.scenarios
+    assert sweep.num_rows > 0
+    assert (tight.objective_value, tight.unassigned_shifts) == (3, 2)
+    assert (loose.objective_value, loose.unassigned_shifts) == (5, 0)
+
+
+class _StalledSolver(MatrixSolver):
+    """Exact solver that never finds an incumbent, recording the deadline of every solve."""
+
+    name = "stalled"
+    capabilities = SolverCapabilities(warm_start=True, time_limit=True, threads=False, callbacks=False)
+
+    def __init__(self):
+        self.deadlines = []
+
+    def solve(self, model, options):
+        self.deadlines.append(None if options.time_limit is None else time.time() + options.time_limit)
+        return SolveResult(pulp.LpStatusNotSolved, np.zeros(model.num_cols), 0.0)
+
+
+@pytest.mark.parametrize("time_limit_ms", [None, 2000])
+def test_scenarios_share_the_time_limit_and_fall_back_to_a_repaired_schedule(monkeypatch, time_limit_ms):
+    solver = _StalledSolver()
+    monkeypatch.setattr("services.sweep.select_solver", lambda *args: (solver, "stalled"))
+    request = random_request(154, ALL_CONSTRAINTS).model_copy(update={"time_limit_ms": time_limit_ms})
+    started = time.time()
+    sweep = ScenarioSweep(request).run(SCENARIOS)
+
+    if time_limit_ms is None:
+        assert solver.deadlines == [None] * len(SCENARIOS)
+    else:
+        # The first scenario gets its share of the budget and no scenario runs past the sweep's limit
+        assert solver.deadlines[0] <= started + time_limit_ms / 1000 / len(SCENARIOS) + 0.01
+        assert max(solver.deadlines) <= started + time_limit_ms / 1000 + 0.01
+    for scenario, row in zip(SCENARIOS, sweep.scenarios):
+        # The fallback is feasible under the scenario: never better than its optimum, never empty
+        expected = ShiftScheduler(solver_backend="highs").schedule(_scenario_request(request, scenario))
+        assert not row.optimal
+        assert 0 < row.objective_value <= expected.metrics.objective_value
+
+
+def test_pack_skips_columns_with_zero_upper_bound():
+    request = random_request(152, ALL_CONSTRAINTS)
+    sweep = ScenarioSweep(request)
+    eligibility = EligibilityMatrix(sweep.data, ALL_CONSTRAINTS)
+    model = sweep._build_model(eligibility, set(ALL_CONSTRAINTS), sweep.data.max_minutes)
+    model.col_upper[::2] = 0.0
+
+    packed = model.pack(np.arange(model.num_cols))
+    assert packed.sum() > 0 and not packed[::2].any()
+
+
+def test_sweep_endpoint():
+    client = TestClient(app)
+    base = random_request(153, ALL_CONSTRAINTS).model_dump(mode="json")
+
+    response = client.post("/api/schedule/sweep", json={
+        "base": base, "scenarios": [{"max_hours": 16}, {"name": "relaxed", "remove_constraints": ["no_overlapping"]}]
+    })
+    assert response.status_code == 200
+    body = response.json()
+    assert [row["name"] for row in body["scenarios"]] == ["scenario 1", "relaxed"]
+    assert body["num_columns"] > 0
+
+    unknown = client.post("/api/schedule/sweep", json={"base": base, "scenarios": [{"employee_max_hours": {"x": 8}}]})
+    assert unknown.status_code == 400
+
+
+def test_sweep_returns_429_when_the_pool_is_full(monkeypatch):
+    manager = JobManager(max_workers=1, retention_seconds=60, max_queued=0, worker=_sleeping_worker)
+    monkeypatch.setattr("routers.schedule.job_manager", manager)
+    manager.submit(random_request(154, ALL_CONSTRAINTS))
+
+    response = TestClient(app).post("/api/schedule/sweep", json={
+        "base": random_request(155, ALL_CONSTRAINTS).model_dump(mode="json"), "scenarios": [{"max_hours": 16}]
+    })
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    manager.shutdown()
@@ -1,7 +1,16 @@
+import random
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import List
-from models.schemas import Employee, Shift, Availability
-from models.api_models import ShiftScheduleResponse
+from typing import List, Optional, Sequence, Tuple
+from models.schemas import ConstraintType, Employee, Shift, Availability
+from models.api_models import ShiftScheduleRequest, ShiftScheduleResponse
+
+ALL_CONSTRAINTS = [
+    ConstraintType.SKILL_MATCHING,
+    ConstraintType.OVERTIME_LIMITS,
+    ConstraintType.AVAILABILITY_WINDOWS,
+    ConstraintType.NO_OVERLAPPING
+]
 
 def print_metrics(response: ShiftScheduleResponse) -> None:
     if hasattr(response, 'metrics') and response.metrics:
@@ -44,3 +53,64 @@ def create_shift(
         end_time=end_time,
         required_skill=required_skill
     )
+
+def random_request(
+    seed: int,
+    constraints: List[ConstraintType],
+    num_employees: int = 12,
+    num_shifts: int = 40,
+    skills: Sequence[str] = ("nursing", "doctor", "admin"),
+    skills_per_employee: Tuple[int, int] = (1, 2),
+    max_hours: Sequence[int] = (8, 12, 16, 24),
+    availability_offset: Tuple[int, int] = (0, 24),
+    availability_hours: Tuple[int, int] = (8, 72),
+    shift_offset: Tuple[int, int] = (0, 90),
+    shift_hours: Tuple[int, int] = (2, 8),
+    skill_sets: Optional[Sequence[List[str]]] = None,
+    shift_skills: Optional[Sequence[str]] = None,
+    id_prefix: str = "",
+    period: str = "2025-07-07/2025-07-14",
+    base_datetime: datetime = datetime(2025, 7, 7, 0, 0),
+    **request_fields
+) -> ShiftScheduleRequest:
+    """Seeded random roster; hour ranges are inclusive offsets from base_datetime and lengths in hours."""
+    rng = random.Random(seed)
+    employees = [
+        create_employee(
+            f"{id_prefix}emp{i}",
+            rng.choice(skill_sets) if skill_sets else rng.sample(list(skills), rng.randint(*skills_per_employee)),
+            rng.choice(max_hours), rng.randint(*availability_offset), rng.randint(*availability_hours),
+            base_datetime=base_datetime
+        )
+        for i in range(num_employees)
+    ]
+    shifts = [
+        create_shift(f"{id_prefix}shift{j}", rng.choice(shift_skills or skills), rng.randint(*shift_offset),
+                     rng.randint(*shift_hours), base_datetime=base_datetime)
+        for j in range(num_shifts)
+    ]
+    return ShiftScheduleRequest(period=period, employees=employees, shifts=shifts, constraints=constraints,
+                                **request_fields)
+
+def assert_feasible(request: ShiftScheduleRequest, response: ShiftScheduleResponse) -> None:
+    employees = {emp.id: emp for emp in request.employees}
+    shifts = {shift.id: shift for shift in request.shifts}
+    constraints = set(request.constraints)
+    assert len({a.shift_id for a in response.assignments}) == len(response.assignments)
+
+    worked = defaultdict(list)
+    for assignment in response.assignments:
+        emp, shift = employees[assignment.employee_id], shifts[assignment.shift_id]
+        worked[emp.id].append(shift)
+        if ConstraintType.SKILL_MATCHING in constraints:
+            assert shift.required_skill in emp.skills
+        if ConstraintType.AVAILABILITY_WINDOWS in constraints:
+            assert any(w.start <= shift.start_time and shift.end_time <= w.end for w in emp.availability)
+
+    for emp_id, emp_shifts in worked.items():
+        if ConstraintType.OVERTIME_LIMITS in constraints:
+            assert sum(shift.duration_hours for shift in emp_shifts) <= employees[emp_id].max_hours
+        if ConstraintType.NO_OVERLAPPING in constraints:
+            emp_shifts.sort(key=lambda shift: shift.start_time)
+            for earlier, later in zip(emp_shifts, emp_shifts[1:]):
+                assert earlier.end_time <= later.start_time
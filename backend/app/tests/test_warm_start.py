@@ -0,0 +1,66 @@
+import pytest
+
+from services.eligibility import EligibilityMatrix
+from services.problem_data import ProblemData
+from services.shift_scheduler import ShiftScheduler
+from services.solvers.registry import SOLVERS
+from models.schemas import Assignment
+
+from .test_utils import ALL_CONSTRAINTS, random_request
+
+
+WARM_START_SOLVERS = [
+    pytest.param(name, marks=pytest.mark.skipif(not solver.is_available(), reason=f"{name} is not installed"))
+    for name, solver in SOLVERS.items()
+]
+
+
+@pytest.mark.parametrize("solver_backend", WARM_START_SOLVERS)
+def test_previous_solution_is_accepted_as_warm_start(solver_backend):
+    request = random_request(21, ALL_CONSTRAINTS)
+    first = ShiftScheduler(solver_backend=solver_backend).schedule(request)
+
+    rerun = request.model_copy(update={"current_assignments": first.assignments})
+    second = ShiftScheduler(solver_backend=solver_backend).schedule(rerun)
+
+    assert second.success
+    assert second.metrics.warm_start_assignments == len(first.assignments)
+    assert second.metrics.objective_value >= first.metrics.objective_value
+    assert second.metrics.time_to_first_incumbent_ms is not None
+
+
+@pytest.mark.parametrize("model_backend", ["matrix", "pulp"])
+def test_infeasible_current_assignments_are_dropped(model_backend):
+    request = random_request(22, ALL_CONSTRAINTS)
+    data = ProblemData(request.employees, request.shifts)
+    rows, cols = EligibilityMatrix(data, request.constraints).coo()
+
+    # Give one shift to two employees: only the first survives the capacity row
+    eligible_shift = int(cols[0])
+    holders = [int(i) for i, j in zip(rows, cols) if j == eligible_shift][:2]
+    current = [Assignment(shift_id=data.shift_ids[eligible_shift], employee_id=data.employee_ids[i])
+               for i in holders]
+    # Ineligible pair and unknown IDs are dropped before the model is built
+    ineligible = next((i, j) for i in range(data.num_employees) for j in range(data.num_shifts)
+                      if not ((rows == i) & (cols == j)).any())
+    current.append(Assignment(shift_id=data.shift_ids[ineligible[1]], employee_id=data.employee_ids[ineligible[0]]))
+    current.append(Assignment(shift_id="missing", employee_id=data.employee_ids[0]))
+
+    response = ShiftScheduler(model_backend=model_backend, solver_backend="cbc").schedule(
+        request.model_copy(update={"current_assignments": current})
+    )
+
+    assert response.success
+    assert response.metrics.warm_start_assignments == 1
+
+
+def test_pair_columns_maps_pairs_to_coo_positions():
+    request = random_request(23, ALL_CONSTRAINTS)
+    eligibility = EligibilityMatrix(ProblemData(request.employees, request.shifts), request.constraints)
+    rows, cols = eligibility.coo()
+
+    assert eligibility.pair_columns(rows, cols).tolist() == list(range(len(rows)))
+
+    dense = eligibility.dense()
+    i, j = map(int, next(zip(*(~dense).nonzero())))
+    assert eligibility.pair_columns([i], [j]).tolist() == [-1]
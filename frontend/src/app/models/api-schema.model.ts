@@ -5,6 +5,14 @@ import { Employee } from './employee.model';
 import { Shift } from './shift.model';
 import { ScheduleEntryWithId } from './schedule-entry.model';
 
+/**
+ * API representation of an availability window
+ */
+export interface AvailabilityAPI {
+  start: string; // ISO string format
+  end: string;   // ISO string format
+}
+
 /**
  * API representation of an Employee for requests/responses
  */
@@ -13,10 +21,7 @@ export interface EmployeeAPI {
   name: string;
   skills: string[];
   max_hours: number;
-  availability: {
-    start: string; // ISO string format
-    end: string;   // ISO string format
-  };
+  availability: AvailabilityAPI | AvailabilityAPI[]; // One or several windows
 }
 
 /**
@@ -34,6 +39,8 @@ export interface HealthResponse {
   status: string;
   timestamp: string;
   version: string;
+  dependencies?: { [name: string]: string };
+  solver_checked_at?: string | null;
 }
 
 export interface OptimizeRequest {
@@ -42,6 +49,10 @@ export interface OptimizeRequest {
   shifts: ShiftAPI[];
   current_assignments: ScheduleEntryWithId[];
   constraints: string[];
+  mode?: 'optimal' | 'fast' | 'lns';
+  time_budget_ms?: number;
+  time_limit_ms?: number;
+  mip_gap?: number;
 }
 
 export interface Metrics {
@@ -49,6 +60,13 @@ export interface Metrics {
   constraint_violations: number;
   optimization_time_ms: number;
   objective_value: number;
+  solver?: string;
+  solver_reason?: string;
+  warm_start_assignments?: number;
+  time_to_first_incumbent_ms?: number | null;
+  best_bound?: number | null;
+  gap?: number | null;
+  objective_trace?: { elapsed_ms: number; objective_value: number }[];
 }
 
 export interface OptimizeResponse {
@@ -58,6 +76,7 @@ export interface OptimizeResponse {
   metrics: Metrics;
   constraints_applied: string[];
   message?: string;
+  cached?: boolean;
 }
 
 export enum ConstraintType {